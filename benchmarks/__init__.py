@@ -0,0 +1,21 @@
+"""
+Benchmarks for the exercise functions.
+
+The tests in tests/ check answers on a handful of elements; these
+benchmarks run every exercise function at sizes from 10 up to 10^7 and
+record throughput (ops/sec) and peak memory as JSON, so a slower or
+hungrier solution shows up against a saved baseline.
+
+Usage:
+    python -m benchmarks                      # run everything, compare to baseline
+    python -m benchmarks two_sum find_max     # only some functions
+    python -m benchmarks --max-size 100000    # quicker run
+    python -m benchmarks --save-baseline      # record the current numbers
+
+Baselines are machine-local and not committed; see __main__.py.
+"""
+
+from .cases import CASES, Case
+from .runner import SIZES, compare, measure, run_all, run_case
+
+__all__ = ["CASES", "Case", "SIZES", "compare", "measure", "run_all", "run_case"]
@@ -0,0 +1,93 @@
+"""
+Command line entry point: python -m benchmarks --help
+
+Baselines are machine-local: ops/sec depends on the CPU, the Python build
+and whatever else is running, so no baseline.json is committed (it is
+git-ignored). Record one on your own machine with --save-baseline, using
+the same --max-size and --min-time you will compare with, before relying
+on the regression check. Without a baseline the run only prints its
+numbers.
+"""
+
+import argparse
+import os
+import sys
+
+from .cases import CASES
+from .runner import (
+    DEFAULT_BUDGET, DEFAULT_MIN_TIME, DEFAULT_THRESHOLD, SIZES,
+    compare, load_json, run_all, write_json,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def format_bytes(count: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GiB"
+
+
+def print_table(results, stream) -> None:
+    stream.write(f"{'function':<22} {'size':>10} {'ops/sec':>14} {'peak memory':>12}\n")
+    for r in results:
+        if "skipped" in r:
+            detail = f"skipped ({r['skipped']})"
+        elif "error" in r:
+            detail = f"error: {r['error']}"
+        else:
+            detail = f"{r['ops_per_sec']:>14,.1f} {format_bytes(r['peak_bytes']):>12}"
+        stream.write(f"{r['case']:<22} {r['size']:>10,} {detail}\n")
+
+
+def main(argv=None) -> int:
+    names = [case.name for case in CASES]
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the exercise functions.")
+    parser.add_argument("cases", nargs="*", metavar="FUNCTION", help=f"functions to run (default: all of {', '.join(names)})")
+    parser.add_argument("--max-size", type=int, default=SIZES[-1], help="largest input size (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="seconds to time each size (default: %(default)s)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="skip sizes predicted to take longer than this per call (default: %(default)s)")
+    parser.add_argument("-o", "--output", default="-", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="relative slowdown/memory growth that counts as a regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in names]
+    if unknown:
+        parser.error(f"unknown function(s): {', '.join(unknown)}")
+    cases = [case for case in CASES if not args.cases or case.name in args.cases]
+    sizes = [size for size in SIZES if size <= args.max_size]
+
+    run = run_all(cases, sizes=sizes, min_time=args.min_time, budget=args.budget)
+    print_table(run["results"], sys.stderr)
+
+    regressions = []
+    baseline = None if args.save_baseline else load_json(args.baseline)
+    if baseline is None and not args.save_baseline:
+        sys.stderr.write(
+            f"No baseline at {args.baseline}; not checking for regressions. "
+            "Record one on this machine with --save-baseline.\n"
+        )
+    if baseline is not None:
+        regressions = compare(run, baseline, args.threshold)
+        run["regressions"] = regressions
+        for reg in regressions:
+            sys.stderr.write(
+                f"REGRESSION {reg['case']} size={reg['size']:,} {reg['metric']}: "
+                f"{reg['baseline']:,.1f} -> {reg['current']:,.1f}\n"
+            )
+        if not regressions:
+            sys.stderr.write("No regressions against the baseline.\n")
+
+    write_json(run, args.output)
+    if args.save_baseline:
+        write_json(run, args.baseline)
+        sys.stderr.write(f"Baseline saved to {args.baseline}\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Benchmark Cases
+
+One case per exercise function. Each case builds a deterministic input of
+a given size (outside the timed region) and knows how to call the
+function on it. Functions that check one small value at a time
+(validate_email, parse_version, compare_versions) are benchmarked over a
+batch of ``size`` values, which is how they are used on real data.
+"""
+
+import os
+import random
+import string
+import sys
+from collections import namedtuple
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Same import setup as tests/test_exercises.py
+sys.path.insert(0, os.path.join(ROOT, "exercises", "solo"))
+sys.path.insert(0, os.path.join(ROOT, "exercises", "collaborative"))
+
+Case = namedtuple("Case", ["name", "module", "function", "make_input", "call"])
+
+
+def _call(func: Callable, args: tuple) -> Any:
+    return func(*args)
+
+
+def _call_each(func: Callable, args: tuple) -> Any:
+    (batch,) = args
+    return [func(*item) for item in batch]
+
+
+def _letters(rng: random.Random, size: int, alphabet: str = string.ascii_letters) -> str:
+    return "".join(rng.choices(alphabet, k=size))
+
+
+def _reverse_string(rng, size):
+    return (_letters(rng, size, string.ascii_letters + string.digits + " "),)
+
+
+def _fizzbuzz(rng, size):
+    return (size,)
+
+
+def _find_max(rng, size):
+    return ([rng.randint(-10**9, 10**9) for _ in range(size)],)
+
+
+def _count_vowels(rng, size):
+    return (_letters(rng, size, string.ascii_letters + " "),)
+
+
+def _is_palindrome(rng, size):
+    # A palindrome is the worst case: every character gets compared
+    half = _letters(rng, size // 2, string.ascii_lowercase)
+    return (half + "x" * (size % 2) + half[::-1],)
+
+
+def _two_sum(rng, size):
+    # The only pair is the last two numbers, so nothing short-circuits
+    nums = [3 * i for i in range(size)]
+    nums[-1] += 1 if size > 1 else 0
+    target = nums[-1] + nums[-2] if size > 1 else 0
+    return (nums, target)
+
+
+def _merge_sorted_arrays(rng, size):
+    half = size // 2
+    return (
+        sorted(rng.randrange(size * 4) for _ in range(half)),
+        sorted(rng.randrange(size * 4) for _ in range(size - half)),
+    )
+
+
+def _group_anagrams(rng, size):
+    roots = ["".join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(max(1, size // 4))]
+    words = []
+    for _ in range(size):
+        letters = list(rng.choice(roots))
+        rng.shuffle(letters)
+        words.append("".join(letters))
+    return (words,)
+
+
+def _is_valid_parentheses(rng, size):
+    # Balanced and nested, so the whole string is scanned
+    pairs = [("(", ")"), ("[", "]"), ("{", "}")]
+    opened = [rng.choice(pairs) for _ in range(size // 2)]
+    return ("".join(o for o, _ in opened) + "".join(c for _, c in reversed(opened)),)
+
+
+def _binary_search(rng, size):
+    return (list(range(0, 2 * size, 2)), 2 * (size - 1))
+
+
+def _validate_email(rng, size):
+    emails = []
+    for i in range(size):
+        user = _letters(rng, rng.randint(1, 12), string.ascii_lowercase + ".")
+        domain = _letters(rng, rng.randint(1, 10), string.ascii_lowercase)
+        # Mix valid and invalid addresses
+        emails.append((f"{user}@{domain}.com" if i % 3 else f"{user}{domain}.c",))
+    return (emails,)
+
+
+def _flatten(rng, size):
+    full = size - size % 3
+    nested: List = [[i, [i + 1, [i + 2]]] for i in range(0, full, 3)]
+    nested.extend(range(full, size))
+    return (nested,)
+
+
+def _remove_duplicates(rng, size):
+    return ([rng.randrange(max(1, size // 2)) for _ in range(size)],)
+
+
+def _word_frequency(rng, size):
+    vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 8))) for _ in range(1000)]
+    return (" ".join(rng.choice(vocabulary) for _ in range(size)),)
+
+
+def _versions(rng, size):
+    return [f"{rng.randrange(20)}.{rng.randrange(50)}.{rng.randrange(100)}" for _ in range(size)]
+
+
+def _parse_version(rng, size):
+    return ([(v,) for v in _versions(rng, size)],)
+
+
+def _compare_versions(rng, size):
+    return (list(zip(_versions(rng, size), _versions(rng, size))),)
+
+
+CASES: List[Case] = [
+    Case("reverse_string", "exercise_1", "reverse_string", _reverse_string, _call),
+    Case("fizzbuzz", "exercise_2", "fizzbuzz", _fizzbuzz, _call),
+    Case("find_max", "exercise_3", "find_max", _find_max, _call),
+    Case("count_vowels", "exercise_4", "count_vowels", _count_vowels, _call),
+    Case("is_palindrome", "exercise_5", "is_palindrome", _is_palindrome, _call),
+    Case("two_sum", "exercise_6", "two_sum", _two_sum, _call),
+    Case("merge_sorted_arrays", "exercise_7", "merge_sorted_arrays", _merge_sorted_arrays, _call),
+    Case("group_anagrams", "exercise_8", "group_anagrams", _group_anagrams, _call),
+    Case("is_valid_parentheses", "exercise_9", "is_valid_parentheses", _is_valid_parentheses, _call),
+    Case("binary_search", "exercise_10", "binary_search", _binary_search, _call),
+    Case("validate_email", "exercise_11", "validate_email", _validate_email, _call_each),
+    Case("flatten", "exercise_12", "flatten", _flatten, _call),
+    Case("remove_duplicates", "exercise_13", "remove_duplicates", _remove_duplicates, _call),
+    Case("word_frequency", "exercise_14", "word_frequency", _word_frequency, _call),
+    Case("parse_version", "exercise_15", "parse_version", _parse_version, _call_each),
+    Case("compare_versions", "exercise_15", "compare_versions", _compare_versions, _call_each),
+]
+
+
+def cases_by_name() -> Dict[str, Case]:
+    return {case.name: case for case in CASES}
@@ -0,0 +1,152 @@
+"""
+Benchmark Runner
+
+Times each case at increasing input sizes, records throughput and peak
+memory, and compares a run against a saved baseline.
+
+Throughput is measured by calling the function repeatedly until at least
+``min_time`` seconds have passed. Peak memory is measured in a separate
+call under tracemalloc, so tracing doesn't skew the timings. Once a size
+is predicted to take longer than ``budget`` seconds per call (from the
+previous size, assuming linear growth), the larger sizes are skipped.
+"""
+
+import importlib
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, Iterable, List, Optional
+
+from .cases import Case
+
+SIZES = [10 ** exp for exp in range(1, 8)]
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_BUDGET = 5.0
+DEFAULT_THRESHOLD = 0.25
+
+
+def measure(case: Case, size: int, min_time: float = DEFAULT_MIN_TIME) -> Dict:
+    """
+    Benchmark one case at one size.
+
+    Returns:
+        Result dict with ops_per_sec, seconds_per_op, peak_bytes and calls,
+        or an ``error`` key if the function raised
+    """
+    result: Dict = {"case": case.name, "size": size}
+    func = getattr(importlib.import_module(case.module), case.function)
+    args = case.make_input(random.Random(size), size)
+
+    calls = 0
+    elapsed = 0.0
+    try:
+        started = time.perf_counter()
+        while calls == 0 or elapsed < min_time:
+            case.call(func, args)
+            calls += 1
+            elapsed = time.perf_counter() - started
+
+        tracemalloc.start()
+        try:
+            case.call(func, args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+        return result
+
+    result.update({
+        "calls": calls,
+        "seconds_per_op": elapsed / calls,
+        "ops_per_sec": calls / elapsed if elapsed else float("inf"),
+        "peak_bytes": peak,
+    })
+    return result
+
+
+def run_case(
+    case: Case,
+    sizes: Iterable[int] = SIZES,
+    min_time: float = DEFAULT_MIN_TIME,
+    budget: float = DEFAULT_BUDGET,
+) -> List[Dict]:
+    """Benchmark one case at every size that fits in the time budget."""
+    results = []
+    last: Optional[Dict] = None
+    for size in sorted(sizes):
+        if last is not None and "error" not in last:
+            predicted = last["seconds_per_op"] * size / last["size"]
+            if predicted > budget:
+                results.append({"case": case.name, "size": size, "skipped": f"~{predicted:.1f}s per call"})
+                continue
+        last = measure(case, size, min_time)
+        results.append(last)
+    return results
+
+
+def run_all(cases: Iterable[Case], **kwargs) -> Dict:
+    """Benchmark every case and wrap the results with run metadata."""
+    results = []
+    for case in cases:
+        results.extend(run_case(case, **kwargs))
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(run: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Find (case, size) pairs that got slower or hungrier than the baseline.
+
+    Args:
+        run: Output of run_all()
+        baseline: A previous run_all() output
+        threshold: Allowed relative change, e.g. 0.25 for 25%
+
+    Returns:
+        One dict per regression with the metric, old and new values
+    """
+    old = {(r["case"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in run["results"]:
+        before = old.get((result["case"], result["size"]))
+        if before is None or "ops_per_sec" not in before or "ops_per_sec" not in result:
+            continue
+        if result["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold):
+            regressions.append({
+                "case": result["case"], "size": result["size"], "metric": "ops_per_sec",
+                "baseline": before["ops_per_sec"], "current": result["ops_per_sec"],
+            })
+        # The extra KiB keeps tiny inputs from flagging on allocator noise
+        if result["peak_bytes"] > before["peak_bytes"] * (1 + threshold) + 1024:
+            regressions.append({
+                "case": result["case"], "size": result["size"], "metric": "peak_bytes",
+                "baseline": before["peak_bytes"], "current": result["peak_bytes"],
+            })
+    return regressions
+
+
+def load_json(path: str) -> Optional[Dict]:
+    """Read a results file, or None if it doesn't exist."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def write_json(data: Dict, path: str) -> None:
+    if path == "-":
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
@@ -17,8 +17,44 @@ INSTRUCTIONS:
 3. Follow the Git steps at the bottom
 """
 
+import codecs
+import mmap
+import os
+import unicodedata
 
-def reverse_string(s: str) -> str:
+# Bytes read per block by reverse_stream
+CHUNK_SIZE = 1 << 16
+
+# Bytes reversed per block by reverse_file
+FILE_CHUNK_SIZE = 1 << 20
+
+# Longest UTF-8 encoding of one character
+MAX_UTF8_LENGTH = 4
+
+ZERO_WIDTH_JOINER = "\u200d"
+
+# Conjoining Hangul: which jamo/syllable types may follow which (UAX #29 GB6-GB8)
+HANGUL_FOLLOWERS = {
+    "L": ("L", "V", "LV", "LVT"),
+    "LV": ("V", "T"),
+    "V": ("V", "T"),
+    "LVT": ("T",),
+    "T": ("T",),
+}
+
+# Code point ranges treated as Extended_Pictographic (emoji that ZWJ can join)
+PICTOGRAPHIC_RANGES = (
+    (0x00A9, 0x00A9), (0x00AE, 0x00AE), (0x203C, 0x203C), (0x2049, 0x2049),
+    (0x2122, 0x2122), (0x2139, 0x2139), (0x2194, 0x2199), (0x21A9, 0x21AA),
+    (0x231A, 0x23FF), (0x24C2, 0x24C2), (0x25AA, 0x25AB), (0x25B6, 0x25B6),
+    (0x25C0, 0x25C0), (0x25FB, 0x25FE), (0x2600, 0x27BF), (0x2934, 0x2935),
+    (0x2B05, 0x2B07), (0x2B1B, 0x2B1C), (0x2B50, 0x2B50), (0x2B55, 0x2B55),
+    (0x3030, 0x3030), (0x303D, 0x303D), (0x3297, 0x3297), (0x3299, 0x3299),
+    (0x1F000, 0x1F1E5), (0x1F200, 0x1FAFF), (0x1FC00, 0x1FFFD),
+)
+
+
+def reverse_string(s: str, graphemes: bool = False) -> str:
     """
     Reverse the input string.
 
@@ -27,24 +63,334 @@ def reverse_string(s: str) -> str:
         reverse_string("Python") → "nohtyP"
         reverse_string("") → ""
         reverse_string("a") → "a"
+        reverse_string("ne\u0301e", graphemes=True) → "ee\u0301n"
 
     Args:
         s: The string to reversess
+        graphemes: Keep grapheme clusters (e.g. "e" + accent) together
 
     Returns:
         The reversed string
     """
-    # TODO: Implement this function
-    # Hint: Python has a simple way to reverse strings using slicing
-    reversed_s = ''
-    # for = loopa igenom 
-    # char = ta en karaktär. 
-    for char in s:
-        reversed_s = char + reversed_s
-    
-    return reversed_s
+    if graphemes:
+        return "".join(reversed(grapheme_clusters(s)))
+    # Slicing with a step of -1 copies each character once: O(n)
+    return s[::-1]
 
-    
+
+def _extends_cluster(char: str) -> bool:
+    """True if ``char`` attaches to the character before it."""
+    code = ord(char)
+    return (
+        unicodedata.category(char) in ("Mn", "Me", "Mc")
+        or char == ZERO_WIDTH_JOINER
+        or 0xFE00 <= code <= 0xFE0F       # variation selectors
+        or 0x1F3FB <= code <= 0x1F3FF     # emoji skin tone modifiers
+        or 0xE0020 <= code <= 0xE007F     # emoji tag characters
+    )
+
+
+def _is_regional_indicator(char: str) -> bool:
+    return 0x1F1E6 <= ord(char) <= 0x1F1FF
+
+
+def _is_pictographic(char: str) -> bool:
+    code = ord(char)
+    return any(low <= code <= high for low, high in PICTOGRAPHIC_RANGES)
+
+
+def _hangul_type(char: str) -> str:
+    """Hangul_Syllable_Type of ``char`` ("L", "V", "T", "LV", "LVT" or "")."""
+    code = ord(char)
+    if 0x1100 <= code <= 0x115F or 0xA960 <= code <= 0xA97C:
+        return "L"
+    if 0x1160 <= code <= 0x11A7 or 0xD7B0 <= code <= 0xD7C6:
+        return "V"
+    if 0x11A8 <= code <= 0x11FF or 0xD7CB <= code <= 0xD7FB:
+        return "T"
+    if 0xAC00 <= code <= 0xD7A3:
+        return "LV" if (code - 0xAC00) % 28 == 0 else "LVT"
+    return ""
+
+
+def _joins_pairwise(previous: str, char: str) -> bool:
+    """True if a rule that only looks at ``previous`` and ``char`` joins them."""
+    return (
+        _extends_cluster(char)
+        or (previous == "\r" and char == "\n")
+        or _hangul_type(char) in HANGUL_FOLLOWERS.get(_hangul_type(previous), ())
+    )
+
+
+def grapheme_clusters(text: str) -> list:
+    """
+    Split text into user-perceived characters.
+
+    Keeps combining marks, emoji modifiers, emoji ZWJ sequences, flag
+    pairs, Hangul jamo sequences and CRLF together, which covers what we
+    see in practice (a close subset of the Unicode extended grapheme
+    cluster rules).
+
+    Examples:
+        grapheme_clusters("ne\u0301e") → ["n", "e\u0301", "e"]
+        grapheme_clusters("🇸🇪!") → ["🇸🇪", "!"]
+        grapheme_clusters("a\u200db") → ["a\u200d", "b"]
+    """
+    clusters = []
+    previous = ""
+    regional_run = 0
+    emoji = False    # the last character that doesn't extend a cluster was an emoji
+    for char in text:
+        regional = _is_regional_indicator(char)
+        pictographic = _is_pictographic(char)
+        joins = clusters and (
+            _joins_pairwise(previous, char)
+            or (emoji and previous == ZERO_WIDTH_JOINER and pictographic)
+            or (regional and regional_run % 2 == 1)
+        )
+        if joins:
+            clusters[-1] += char
+        else:
+            clusters.append(char)
+        if not _extends_cluster(char):
+            emoji = pictographic
+        regional_run = regional_run + 1 if regional else 0
+        previous = char
+    return clusters
+
+
+def _utf8_start(data: bytes) -> int:
+    """Index of the first byte in ``data`` that starts a UTF-8 character."""
+    i = 0
+    while i < len(data) and (data[i] & 0xC0) == 0x80:
+        i += 1
+    return i
+
+
+def _utf8_length(char: str) -> int:
+    """Number of bytes ``char`` takes in UTF-8."""
+    code = ord(char)
+    return 1 if code < 0x80 else 2 if code < 0x800 else 3 if code < 0x10000 else 4
+
+
+def _blocks_backward(raw, chunk_size: int):
+    """Yield ``(offset, data)`` blocks from the end of a file, each starting at a character."""
+    position = raw.seek(0, 2)
+    carry = b""      # bytes of a character cut by the block start
+    while position > 0:
+        start = max(0, position - chunk_size)
+        raw.seek(start)
+        data = raw.read(position - start) + carry
+        position = start
+        split = _utf8_start(data) if position > 0 else 0
+        carry = data[:split]
+        yield position + split, data[split:]
+
+
+def _read_text(raw, start: int, stop: int, chunk_size: int):
+    """Yield the text between two offsets of a file, front to back."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while start < stop:
+        raw.seek(start)
+        data = raw.read(min(chunk_size, stop - start))
+        if not data:
+            return
+        start += len(data)
+        yield decoder.decode(data, final=start >= stop)
+
+
+def _reverse_pairs(text: str) -> str:
+    """Reverse a run of flag letters two at a time."""
+    return "".join(text[i:i + 2] for i in range(len(text) - 2, -1, -2))
+
+
+class _ClusterReverser:
+    """
+    Finds grapheme cluster breaks from the end of a file towards its start.
+
+    Most breaks depend only on the two characters around them. Whether
+    flag letters pair up, and whether a ZWJ joins the emoji after it,
+    also depends on text further back; those breaks are kept as a count
+    or an offset until that text is read. Output that lies outside the
+    current block is read from the file again rather than kept around.
+    """
+
+    def __init__(self, raw, chunk_size: int):
+        self.raw = raw
+        self.chunk_size = chunk_size
+        self.emitted = raw.seek(0, 2)   # text from here to the end has been output
+        self.block = b""
+        self.base = self.end = self.emitted
+        self.right = ""                 # character after the one being looked at
+        self.right_at = self.emitted    # and its offset
+        self.regional = 0               # length of a flag run whose pairing isn't known yet
+        self.pictograph_at = None       # offset of an emoji after a ZWJ that may not join it
+        self.pieces = []                # output: text, or (start, stop, pairs) ranges of the file
+
+    def feed(self, base: int, block: bytes):
+        """Look at the block before the previous one; returns its output."""
+        self.block, self.base, self.end = block, base, base + len(block)
+        at = self.end
+        for char in reversed(block.decode("utf-8")):
+            at -= _utf8_length(char)
+            if self.right:
+                self._step(char)
+            self.right, self.right_at = char, at
+        return self._flush()
+
+    def finish(self):
+        """Settle the undecided breaks at the start of the file; returns the output."""
+        if self.regional:
+            self._flags()
+        elif self.pictograph_at is not None:
+            self._cut(self.pictograph_at)
+            self.pictograph_at = None
+        if self.emitted > self.base:
+            self._cut(self.base)
+        return self._flush()
+
+    def _step(self, char: str) -> None:
+        """Decide the break between ``char`` and the character after it."""
+        right = self.right
+        if self.regional:
+            if _is_regional_indicator(char):
+                self.regional += 1
+            else:
+                self._flags()
+        elif self.pictograph_at is not None:
+            # Only extenders sit between here and the ZWJ
+            if not _extends_cluster(char):
+                if not _is_pictographic(char):
+                    self._cut(self.pictograph_at)
+                self.pictograph_at = None
+        elif _joins_pairwise(char, right):
+            pass
+        elif _is_regional_indicator(char) and _is_regional_indicator(right):
+            self.regional = 2
+        elif char == ZERO_WIDTH_JOINER and _is_pictographic(right):
+            self.pictograph_at = self.right_at
+        else:
+            self._cut(self.right_at)
+
+    def _cut(self, at: int) -> None:
+        """Output the cluster from ``at`` up to the text already output."""
+        stop = self.emitted
+        if at < self.end:
+            self.pieces.append(self.block[at - self.base:min(stop, self.end) - self.base].decode("utf-8"))
+        if stop > self.end:
+            self.pieces.append((max(at, self.end), stop, False))
+        self.emitted = at
+
+    def _flags(self) -> None:
+        """Pair up the flag run that starts at ``right_at``, from its start."""
+        start = self.right_at
+        # Flag letters are 4 bytes each; the last pair may have extenders attached
+        top = start + 8 * ((self.regional - 1) // 2)
+        self._cut(top)
+        if top > start:
+            if top <= self.end:
+                self.pieces.append(_reverse_pairs(self.block[start - self.base:top - self.base].decode("utf-8")))
+            else:
+                self.pieces.append((start, top, True))
+            self.emitted = start
+        self.regional = 0
+
+    def _flush(self):
+        pieces, self.pieces = self.pieces, []
+        for piece in pieces:
+            if isinstance(piece, str):
+                yield piece
+                continue
+            start, stop, pairs = piece
+            if not pairs:
+                yield from _read_text(self.raw, start, stop, self.chunk_size)
+                continue
+            step = max(8, self.chunk_size // 8 * 8)
+            while stop > start:
+                low = max(start, stop - step)
+                self.raw.seek(low)
+                yield _reverse_pairs(self.raw.read(stop - low).decode("utf-8"))
+                stop = low
+
+
+def reverse_stream(reader, chunk_size: int = CHUNK_SIZE, graphemes: bool = False):
+    """
+    Reverse a UTF-8 text file without loading it into memory.
+
+    Reads blocks backwards from the end of the file and yields the
+    reversed text piece by piece, so ``"".join(reverse_stream(f))`` equals
+    ``reverse_string(text)`` while only about one block is held at a time.
+    With ``graphemes``, a cluster that spans blocks (say a long run of
+    flags or accents) is read again from the file once its start is found.
+
+    Examples:
+        with open("big.log", "rb") as f:
+            for piece in reverse_stream(f):
+                out.write(piece)
+
+    Args:
+        reader: Seekable file object (binary, or text with a ``buffer``)
+        chunk_size: Bytes to read per block
+        graphemes: Keep grapheme clusters (e.g. "e" + accent) together
+
+    Yields:
+        Pieces of the reversed text, in order
+    """
+    raw = getattr(reader, "buffer", reader)
+    if not graphemes:
+        for _, data in _blocks_backward(raw, chunk_size):
+            yield data.decode("utf-8")[::-1]
+        return
+    reverser = _ClusterReverser(raw, chunk_size)
+    for base, data in _blocks_backward(raw, chunk_size):
+        yield from reverser.feed(base, data)
+    yield from reverser.finish()
+
+
+def reverse_file(src: str, dst: str, chunk_size: int = FILE_CHUNK_SIZE) -> int:
+    """
+    Write the reversed text of a UTF-8 file to another file.
+
+    The source is memory-mapped and reversed one block at a time from
+    the end, so memory use stays at about one block however big the
+    file is. Block starts are moved forward to the next character
+    boundary, so a multi-byte character is never split.
+
+    Examples:
+        reverse_file("payload.txt", "payload.reversed.txt")
+
+    Args:
+        src: Path of the file to reverse
+        dst: Path to write the reversed text to
+        chunk_size: Bytes to reverse per block
+
+    Returns:
+        Number of bytes written
+    """
+    chunk_size = max(chunk_size, MAX_UTF8_LENGTH)
+    written = 0
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        size = os.fstat(source.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            end = size
+            released = size
+            while end > 0:
+                start = max(0, end - chunk_size)
+                # Skip UTF-8 continuation bytes; they belong to the previous block
+                limit = min(start + MAX_UTF8_LENGTH - 1, end - 1)
+                while 0 < start < limit and (mapped[start] & 0xC0) == 0x80:
+                    start += 1
+                written += target.write(mapped[start:end].decode("utf-8")[::-1].encode("utf-8"))
+                end = start
+                # Let the kernel drop the pages we're done with
+                if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_DONTNEED"):
+                    page_start = -(-end // mmap.PAGESIZE) * mmap.PAGESIZE
+                    if page_start < released:
+                        mapped.madvise(mmap.MADV_DONTNEED, page_start, released - page_start)
+                        released = page_start
+    return written
 
 
 # Don't modify below this line - used for local testing
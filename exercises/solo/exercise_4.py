@@ -17,43 +17,271 @@ INSTRUCTIONS:
 3. Push your changes
 """
 
+import fnmatch
+import multiprocessing
+import os
+from collections import namedtuple
+from typing import Optional
 
-def count_vowels(text: str) -> int:
+VOWELS = "aeiouAEIOU"
+
+# For bytes.translate: delete everything that isn't a vowel, then count what's left
+NOT_VOWEL_BYTES = bytes(b for b in range(256) if b not in VOWELS.encode("ascii"))
+
+# Bytes (or characters) processed per step, to bound temporary copies
+CHUNK_SIZE = 1 << 20
+
+# One result of count_vowels_tree; total is the running total so far
+FileVowels = namedtuple("FileVowels", ["path", "count", "total"])
 
+
+def count_vowels(text: str) -> int:
     """
     Count the number of vowels (a, e, i, o, u) in a string.
     Case-insensitive.
-    
+
+    Also accepts bytes, bytearray or memoryview in an ASCII-compatible
+    encoding such as UTF-8. The counting is done on bytes with
+    bytes.translate, one C-level pass per chunk, without lowercasing
+    or looping in Python.
+
     Examples:
         count_vowels("hello") → 2
         count_vowels("AEIOU") → 5
         count_vowels("rhythm") → 0
         count_vowels("") → 0
         count_vowels("Python Programming") → 4
-    
+        count_vowels(b"Python Programming") → 4
+
     Args:
-        text: The input string
-        
+        text: The input string (or bytes)
+
     Returns:
         Number of vowels in the string
     """
-    # TODO: Implement this function
-    # Hint: Convert to lowercase first, then count vowels
+    if not isinstance(text, str):
+        return count_vowel_bytes(text)
 
-    vowels = "aeiou"
+    count = 0
+    # UTF-8 encodes every non-ASCII character with bytes >= 0x80, so only
+    # real ASCII vowels survive the translate
+    for start in range(0, len(text), CHUNK_SIZE):
+        count += count_vowel_bytes(text[start:start + CHUNK_SIZE].encode("utf-8", "surrogatepass"))
+    if not text.isascii():
+        # "İ".lower() is "i" plus a combining dot, so lower() counted it
+        count += text.count("\u0130")
+    return count
 
-    text = text.lower()
 
+def count_vowel_bytes(data) -> int:
+    """
+    Count ASCII vowel bytes in a bytes-like object.
+
+    Examples:
+        count_vowel_bytes(b"hello") → 2
+        count_vowel_bytes(memoryview(b"AEIOU")) → 5
+    """
+    if isinstance(data, (bytes, bytearray)) and len(data) <= CHUNK_SIZE:
+        return len(data.translate(None, NOT_VOWEL_BYTES))
     count = 0
+    with memoryview(data) as view, view.cast("B") as raw:
+        for start in range(0, len(raw), CHUNK_SIZE):
+            count += len(bytes(raw[start:start + CHUNK_SIZE]).translate(None, NOT_VOWEL_BYTES))
+    return count
+
+
+def count_vowels_file(path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Count the vowels in a text file (UTF-8 or another ASCII-compatible encoding).
+
+    Reads fixed-size chunks into one reused buffer, so memory use stays
+    constant however large the file is.
+
+    Examples:
+        count_vowels_file("corpus.txt") → 1234567
+
+    Args:
+        path: File to read
+        chunk_size: Bytes read per step
 
-    for letter in text:
-        if letter in vowels:
-            count += 1
+    Returns:
+        Number of vowels in the file
+    """
+    return _count_file_with(path, bytearray(chunk_size))
 
 
+def _count_file_with(path: str, buffer: bytearray) -> int:
+    count = 0
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            chunk = buffer if size == len(buffer) else buffer[:size]
+            count += len(chunk.translate(None, NOT_VOWEL_BYTES))
     return count
 
-    
+
+# Each worker process reuses one read buffer for all of its files
+_worker_buffer = None
+
+
+def _count_tree_file(path: str):
+    global _worker_buffer
+    if _worker_buffer is None:
+        _worker_buffer = bytearray(CHUNK_SIZE)
+    try:
+        return path, _count_file_with(path, _worker_buffer)
+    except OSError:
+        return path, None
+
+
+def _walk_files(root: str, pattern: str):
+    for directory, subdirs, files in os.walk(root):
+        subdirs.sort()
+        for name in sorted(files):
+            if fnmatch.fnmatch(name, pattern):
+                yield os.path.join(directory, name)
+
+
+def count_vowels_tree(root: str, workers: Optional[int] = None, pattern: str = "*"):
+    """
+    Count the vowels in every file under a directory, in parallel.
+
+    Files are handed to a pool of worker processes. Each worker reads its
+    files in large blocks into one reused buffer. Results are yielded as
+    soon as each file is done, so a caller can report progress or stop
+    early.
+
+    Examples:
+        for result in count_vowels_tree("corpus/", workers=8):
+            print(result.path, result.count)
+        print("total:", result.total)
+
+    Args:
+        root: Directory to search recursively
+        workers: Number of worker processes (default: CPU count)
+        pattern: Only count files whose name matches this glob
+
+    Yields:
+        FileVowels(path, count, total) in completion order; count is None
+        for files that couldn't be read, and total is the running total
+    """
+    paths = _walk_files(root, pattern)
+    workers = workers or os.cpu_count() or 1
+    total = 0
+    if workers == 1:
+        results = map(_count_tree_file, paths)
+        for path, count in results:
+            total += count or 0
+            yield FileVowels(path, count, total)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        # Batch small files so each message to a worker carries several paths
+        for path, count in pool.imap_unordered(_count_tree_file, paths, chunksize=16):
+            total += count or 0
+            yield FileVowels(path, count, total)
+
+
+class CharClassCounter:
+    """
+    Count several classes of characters in one pass over the text.
+
+    Each class is a name and the characters it contains. The classes are
+    compiled into a single str.translate table. It maps each member
+    character to a one-character code for the exact set of classes it
+    belongs to, and deletes everything else. The per-class totals are
+    then added up from the codes. Classes may overlap, for example "y"
+    in both vowels and consonants.
+
+    Examples:
+        counter = CharClassCounter({
+            "vowels": "aeiouyåäö",
+            "consonants": "bcdfghjklmnpqrstvwxz",
+            "digits": "0123456789",
+        })
+        counter.count("Åsa, 42 år") → {"vowels": 3, "consonants": 2, "digits": 2}
+
+        for chunk in chunks:          # streaming
+            counter.feed(chunk)
+        counter.totals()
+    """
+
+    def __init__(self, classes, ignore_case: bool = True):
+        """
+        Compile the classes into a translation table.
+
+        Args:
+            classes: Mapping of class name -> characters (a string or iterable)
+            ignore_case: Also count the other case of every member
+        """
+        self.names = list(classes)
+        members = {}
+        for name, chars in classes.items():
+            for char in chars:
+                variants = {char, char.lower(), char.upper()} if ignore_case else {char}
+                for variant in variants:
+                    if len(variant) == 1:
+                        members.setdefault(variant, set()).add(name)
+
+        # One code per distinct set of classes; codes start at chr(1)
+        self._code_classes = []
+        codes = {}
+        table = {}
+        for char, names in members.items():
+            key = frozenset(names)
+            if key not in codes:
+                codes[key] = chr(len(codes) + 1)
+                self._code_classes.append(key)
+            table[ord(char)] = codes[key]
+        # Delete all other ASCII (keeps str.translate on its fast path) and
+        # any character that could be mistaken for a code
+        for code_point in range(max(128, len(codes) + 1)):
+            table.setdefault(code_point, None)
+        self._table = table
+        self._totals = dict.fromkeys(self.names, 0)
+
+    def count(self, text: str) -> dict:
+        """Return the count of every class in ``text``."""
+        counts = dict.fromkeys(self.names, 0)
+        for start in range(0, len(text), CHUNK_SIZE):
+            coded = text[start:start + CHUNK_SIZE].translate(self._table)
+            for index, names in enumerate(self._code_classes):
+                hits = coded.count(chr(index + 1))
+                if hits:
+                    for name in names:
+                        counts[name] += hits
+        return counts
+
+    def feed(self, chunk: str) -> None:
+        """Add one chunk of a stream to the running totals."""
+        for name, hits in self.count(chunk).items():
+            self._totals[name] += hits
+
+    def totals(self) -> dict:
+        """Return the running totals of everything fed so far."""
+        return dict(self._totals)
+
+    def reset(self) -> None:
+        """Clear the running totals."""
+        self._totals = dict.fromkeys(self.names, 0)
+
+    def count_file(self, path: str, encoding: str = "utf-8", chunk_size: int = CHUNK_SIZE) -> dict:
+        """
+        Return the count of every class in a text file, read in chunks.
+
+        Does not touch the running totals.
+        """
+        counts = dict.fromkeys(self.names, 0)
+        with open(path, "r", encoding=encoding, newline="") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                for name, hits in self.count(chunk).items():
+                    counts[name] += hits
+        return counts
 
 
 # Don't modify below this line
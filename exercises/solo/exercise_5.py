@@ -20,6 +20,24 @@ INSTRUCTIONS:
 5. Come back and restore your work
 """
 
+import mmap
+import os
+from array import array
+from collections import namedtuple
+from itertools import islice
+
+# Bytes read per step from each end by is_palindrome_file
+FILE_CHUNK_SIZE = 1 << 20
+
+# For ASCII chunks: lowercase and drop non-alphanumerics in one bytes.translate
+ASCII_LOWER = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
+ASCII_NOT_ALNUM = bytes(b for b in range(128) if not chr(b).isalnum())
+
+# Result of PalindromeEngine.analyze: the longest palindromic substring of
+# the original text, its [start, end) indices, and how many palindromic
+# substrings the normalized text has
+PalindromeInfo = namedtuple("PalindromeInfo", ["longest", "span", "count"])
+
 
 def is_palindrome(text: str) -> bool:
     """
@@ -39,18 +57,283 @@ def is_palindrome(text: str) -> bool:
     Returns:
         True if palindrome, False otherwise
     """
-    # TODO: Implement this function
-    # Hint:
-    # 1. Clean the string (remove non-alphanumeric, lowercase)
-    # 2. Compare the cleaned string with its reverse
-    #
-    # Useful: ''.join(c for c in text if c.isalnum())
-    text = text.lower()
+    if not text.isascii():
+        return _is_palindrome_folded(text)
+    # Walk inwards from both ends, skipping anything that isn't a letter
+    # or digit, so no cleaned copy of the text is built
+    left, right = 0, len(text) - 1
+    while left < right:
+        a = text[left]
+        if not a.isalnum():
+            left += 1
+            continue
+        b = text[right]
+        if not b.isalnum():
+            right -= 1
+            continue
+        if a != b and a.lower() != b.lower():
+            return False
+        left += 1
+        right -= 1
+    return True
+
+
+def _fold(char: str) -> str:
+    """
+    What one character adds to the normalized text: its lowercase form,
+    letters and digits only. Characters are lowercased one at a time,
+    then filtered, so "İ" (lowercase "i" + combining dot) folds to "i".
+    """
+    return "".join(c for c in char.lower() if c.isalnum())
+
+
+def _is_palindrome_folded(text: str) -> bool:
+    """is_palindrome for non-ASCII text, where one character may fold to several."""
+    left, right = 0, len(text) - 1
+    front = back = ""  # folded characters not compared yet (back is reversed)
+    folds = {}
+    while True:
+        if not front:
+            if left > right:
+                break
+            char = text[left]
+            front = folds.get(char)
+            if front is None:
+                front = folds[char] = _fold(char)
+            left += 1
+        elif not back:
+            if left > right:
+                break
+            char = text[right]
+            back = folds.get(char)
+            if back is None:
+                back = folds[char] = _fold(char)
+            back = back[::-1]
+            right -= 1
+        elif front == back:
+            front = back = ""
+        elif front[0] != back[0]:
+            return False
+        else:
+            front, back = front[1:], back[1:]
+    # Whatever one side still holds is the middle of the normalized text
+    middle = front or back
+    return middle == middle[::-1]
+
+
+def _normalize(data: bytes) -> str:
+    """Fold (see _fold) the characters of whole UTF-8 characters."""
+    if data.isascii():
+        return data.translate(ASCII_LOWER, ASCII_NOT_ALNUM).decode("ascii")
+    return "".join(filter(str.isalnum, "".join(map(str.lower, data.decode("utf-8")))))
+
+
+def _complete_utf8(data: bytes) -> int:
+    """Length of the longest prefix of ``data`` that doesn't end mid-character."""
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:  # lead byte or ASCII
+            if byte < 0x80:
+                length = 1
+            elif byte >= 0xF0:
+                length = 4
+            elif byte >= 0xE0:
+                length = 3
+            else:
+                length = 2
+            return len(data) if length <= back else len(data) - back
+    return len(data)
+
+
+def _utf8_start(data: bytes) -> int:
+    """Index of the first byte in ``data`` that starts a UTF-8 character."""
+    i = 0
+    while i < len(data) and (data[i] & 0xC0) == 0x80:
+        i += 1
+    return i
+
+
+def _front_chunks(mapped, size: int, chunk_size: int):
+    """Yield (bytes consumed, normalized text) reading forwards."""
+    position = 0
+    carry = b""
+    while position < size:
+        end = min(size, position + chunk_size)
+        data = carry + mapped[position:end]
+        cut = _complete_utf8(data) if end < size else len(data)
+        carry = data[cut:]
+        position = end
+        yield end - len(carry), _normalize(data[:cut])
+
+
+def _back_chunks(mapped, size: int, chunk_size: int):
+    """Yield (first byte consumed, reversed normalized text) reading backwards."""
+    position = size
+    carry = b""
+    while position > 0:
+        start = max(0, position - chunk_size)
+        data = mapped[start:position] + carry
+        split = _utf8_start(data) if start > 0 else 0
+        carry = data[:split]
+        position = start
+        yield start + split, _normalize(data[split:])[::-1]
+
+
+def is_palindrome_file(path: str, chunk_size: int = FILE_CHUNK_SIZE) -> bool:
+    """
+    Check if a UTF-8 text file is a palindrome, with the same rules as
+    is_palindrome.
+
+    The file is memory-mapped and read in chunks from both ends at once,
+    comparing as it goes, so it stops at the first mismatch and uses
+    constant memory however large the file is.
+
+    Examples:
+        is_palindrome_file("racecar.txt") → True
+
+    Args:
+        path: File to check
+        chunk_size: Bytes read per step from each end
+
+    Returns:
+        True if palindrome, False otherwise
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            front = _front_chunks(mapped, size, chunk_size)
+            back = _back_chunks(mapped, size, chunk_size)
+            front_text = back_text = ""
+            front_end, back_start = 0, size
+            while True:
+                # Once both ends have met, the rest would only repeat comparisons
+                if not front_text and not back_text and front_end >= back_start:
+                    return True
+                if not front_text:
+                    front_end, front_text = next(front, (front_end, None))
+                    if front_text is None:
+                        return True
+                    continue
+                if not back_text:
+                    back_start, back_text = next(back, (back_start, None))
+                    if back_text is None:
+                        return True
+                    continue
+                n = min(len(front_text), len(back_text))
+                if front_text[:n] != back_text[:n]:
+                    return False
+                front_text = front_text[n:]
+                back_text = back_text[n:]
+
+
+class PalindromeEngine:
+    """
+    Longest palindromic substring and palindrome counts in O(n).
+
+    Uses Manacher's algorithm on the text normalized the same way as
+    is_palindrome (letters and digits only, case-insensitive). The
+    longest palindrome is returned as the span of the original text it
+    covers, punctuation included. The radius arrays are kept between
+    calls and only grow, so analyzing a batch of strings reuses one
+    work buffer.
+
+    Examples:
+        engine = PalindromeEngine()
+        engine.analyze("Hello, racecar!") → PalindromeInfo("racecar", (7, 14), 16)
+        engine.longest("A man, a plan, a canal: Panama!") → "A man, a plan, a canal: Panama"
+        list(engine.analyze_batch(["abba", "xyz"]))
+    """
+
+    def __init__(self):
+        self._odd = array("q")   # odd[i]: palindromes centred on i
+        self._even = array("q")  # even[i]: palindromes centred just before i
+
+    def _reserve(self, n: int) -> None:
+        if len(self._odd) < n:
+            extra = array("q", bytes(8 * (n - len(self._odd))))
+            self._odd.extend(extra)
+            self._even.extend(extra)
+
+    @staticmethod
+    def _normalize(text: str):
+        """One normalized (folded) entry per alphanumeric character."""
+        if text.isascii():
+            return text.encode("ascii").translate(ASCII_LOWER, ASCII_NOT_ALNUM).decode("ascii")
+        return [folded for folded in map(_fold, text) if folded]
+
+    def _radii(self, chars) -> int:
+        """Fill the radius buffers for ``chars``; return its length."""
+        n = len(chars)
+        self._reserve(n)
+        odd, even = self._odd, self._even
+
+        left, right = 0, -1
+        for i in range(n):
+            k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+            while i - k >= 0 and i + k < n and chars[i - k] == chars[i + k]:
+                k += 1
+            odd[i] = k
+            if i + k - 1 > right:
+                left, right = i - k + 1, i + k - 1
+
+        left, right = 0, -1
+        for i in range(n):
+            k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+            while i - k - 1 >= 0 and i + k < n and chars[i - k - 1] == chars[i + k]:
+                k += 1
+            even[i] = k
+            if i + k - 1 > right:
+                left, right = i - k, i + k - 1
+        return n
+
+    def analyze(self, text: str) -> PalindromeInfo:
+        """Return the longest palindrome, its span and the palindrome count."""
+        chars = self._normalize(text)
+        n = self._radii(chars)
+        if n == 0:
+            return PalindromeInfo("", (0, 0), 0)
+
+        odd, even = self._odd, self._even
+        best_start, best_length = 0, 1
+        for i in range(n):
+            if 2 * odd[i] - 1 > best_length:
+                best_start, best_length = i - odd[i] + 1, 2 * odd[i] - 1
+            if 2 * even[i] > best_length:
+                best_start, best_length = i - even[i], 2 * even[i]
+        count = self._count(n)
+
+        # Map normalized positions back to the original text
+        start = end = None
+        last = best_start + best_length - 1
+        seen = 0
+        for index, char in enumerate(text):
+            if char.isalnum() if char.isascii() else _fold(char):
+                if seen == best_start:
+                    start = index
+                if seen == last:
+                    end = index + 1
+                    break
+                seen += 1
+        return PalindromeInfo(text[start:end], (start, end), count)
+
+    def longest(self, text: str) -> str:
+        """Return the longest palindromic substring of ``text``."""
+        return self.analyze(text).longest
 
-    cleaned = ''.join(c for c in text if c.isalnum())
+    def count(self, text: str) -> int:
+        """Return how many palindromic substrings the normalized text has."""
+        return self._count(self._radii(self._normalize(text)))
 
-   # return cleaned == cleaned[::-1]
+    def _count(self, n: int) -> int:
+        # Each radius counts the palindromes around its centre
+        return sum(islice(self._odd, n)) + sum(islice(self._even, n))
 
+    def analyze_batch(self, texts):
+        """Analyze many strings with the same work buffers, lazily."""
+        for text in texts:
+            yield self.analyze(text)
 
 
 # Don't modify below this line
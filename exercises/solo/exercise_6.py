@@ -19,39 +19,132 @@ INSTRUCTIONS:
 4. Practice revert to understand the difference
 """
 
+import bisect
+
 
 def two_sum(nums: list, target: int) -> list:
     """
     Find two numbers in the list that add up to the target.
     Return their indices.
-    
+
     You may assume exactly one solution exists.
-    
+
     Examples:
         two_sum([2, 7, 11, 15], 9) → [0, 1]  (because 2 + 7 = 9)
         two_sum([3, 2, 4], 6) → [1, 2]       (because 2 + 4 = 6)
         two_sum([3, 3], 6) → [0, 1]          (because 3 + 3 = 6)
-    
+
     Args:
         nums: List of integers
         target: Target sum
-        
+
     Returns:
         List containing the two indices
+
+    Raises:
+        ValueError: If no two numbers add up to the target
+    """
+    # One pass: remember where each number was first seen, and for each
+    # new number look up the partner it needs
+    seen = {}
+    for i, number in enumerate(nums):
+        j = seen.get(target - number)
+        if j is not None:
+            return [j, i]
+        seen.setdefault(number, i)
+    raise ValueError(f"No two numbers add up to {target}")
+
+
+class TwoSumIndex:
+    """
+    Answer many two_sum queries against the same list.
+
+    Building the index takes O(n) for the hash maps plus O(n log n) for a
+    sorted copy; each query then reuses them instead of starting over.
+
+    - query(target) checks each distinct value against a hash map: O(u)
+      for u distinct values.
+    - query_sorted(target) narrows a sorted copy to the values that can
+      take part with two binary searches (O(log n)), then scans only that
+      window with two pointers.
+
+    Examples:
+        index = TwoSumIndex([2, 7, 11, 15])
+        index.query(9) → [0, 1]
+        index.query_sorted(26) → [2, 3]
+        index.query_many([9, 18]) → [[0, 1], [1, 2]]
     """
-    # TODO: Implement this function
-    # 
-    # Approach 1 (O(n²) - simpler):
-    #   Use nested loops to check all pairs
-    #
-    # Approach 2 (O(n) - optimal):
-    #   Use a dictionary to store seen numbers
-    #   For each number, check if (target - number) exists in dict
-    for i in range(len(nums)):
-        for j in range (i + 1, len(nums)):
-            if nums[i] + nums[j] == target:
-                return [i, j]
-    return None        
+
+    def __init__(self, nums):
+        """
+        Index a list of numbers.
+
+        Args:
+            nums: Iterable of numbers (copied)
+        """
+        self.nums = list(nums)
+        self._first = {}
+        self._second = {}  # second index of values that occur more than once
+        for i, number in enumerate(self.nums):
+            if number not in self._first:
+                self._first[number] = i
+            elif number not in self._second:
+                self._second[number] = i
+        self._sorted = sorted((number, i) for i, number in enumerate(self.nums))
+        self._values = [number for number, _ in self._sorted]
+
+    def _no_pair(self, target):
+        return ValueError(f"No two numbers add up to {target}")
+
+    def query(self, target) -> list:
+        """
+        Return the indices of two numbers that add up to ``target``.
+
+        Raises:
+            ValueError: If there is no such pair
+        """
+        first = self._first
+        for number, i in first.items():
+            partner = target - number
+            if partner == number:
+                if number in self._second:
+                    return [i, self._second[number]]
+            elif partner in first:
+                return sorted([i, first[partner]])
+        raise self._no_pair(target)
+
+    def query_sorted(self, target) -> list:
+        """
+        Like query(), using two pointers over the sorted copy.
+
+        Raises:
+            ValueError: If there is no such pair
+        """
+        values = self._values
+        if len(values) < 2:
+            raise self._no_pair(target)
+        # A usable value has a partner between the smallest and largest value
+        left = bisect.bisect_left(values, target - values[-1])
+        right = bisect.bisect_right(values, target - values[0]) - 1
+        while left < right:
+            total = values[left] + values[right]
+            if total == target:
+                return sorted([self._sorted[left][1], self._sorted[right][1]])
+            if total < target:
+                left += 1
+            else:
+                right -= 1
+        raise self._no_pair(target)
+
+    def query_many(self, targets) -> list:
+        """Return query(target) for each target; None where there's no pair."""
+        results = []
+        for target in targets:
+            try:
+                results.append(self.query(target))
+            except ValueError:
+                results.append(None)
+        return results
 
 
 # Don't modify below this line
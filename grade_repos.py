@@ -0,0 +1,39 @@
+"""
+Grade many student forks at once (for instructors).
+
+Usage:
+    python grade_repos.py forks/                 # every repo inside forks/
+    python grade_repos.py --manifest forks.txt   # one repo path per line
+    python grade_repos.py forks/ --jobs 32 --max-git 16 > results.jsonl
+
+Prints one JSON line per repository as soon as it has been graded.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests"))
+
+from git_verification.grading import find_repos, grade_many, read_manifest, write_json_lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grade cloned student forks in parallel.")
+    parser.add_argument("root", nargs="?", help="directory containing one cloned fork per subdirectory")
+    parser.add_argument("--manifest", help="file listing repository paths, one per line")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-git", type=int, default=None, help="max concurrent git processes (default: --jobs)")
+    args = parser.parse_args(argv)
+
+    if bool(args.root) == bool(args.manifest):
+        parser.error("give either a directory or --manifest")
+    repos = read_manifest(args.manifest) if args.manifest else find_repos(args.root)
+
+    summary = write_json_lines(grade_many(repos, args.jobs, args.max_git), sys.stdout)
+    print(f"📊 Graded {summary['graded']} repositories ({summary['errors']} errors)", file=sys.stderr)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
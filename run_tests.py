@@ -1,87 +1,279 @@
 """
 Run this script to see your progress locally.
-Usage: python run_tests.py
+Usage: python run_tests.py [--jobs N] [--watch] [--force]
 """
 
-import subprocess
+import argparse
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 
+import pytest
 
-def run_tests():
-    print("\n🧪 Running tests...\n")
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TEST_FILE = os.path.join("tests", "test_exercises.py")
+WATCH_DIRS = [os.path.join("exercises", "solo"), os.path.join("exercises", "collaborative")]
+
+# exercise_N.py is covered by TestExerciseN
+EXERCISE_FILE = re.compile(r"exercise_(\d+)\.py$")
+
+# Per-exercise results, keyed by the hashes of the sources they were run against
+CACHE_FILE = os.path.join(".pytest_cache", "run_tests.json")
+CACHE_VERSION = 1
+
+# Clear the terminal and move the cursor home
+CLEAR_SCREEN = "\033[2J\033[H"
+
+# Exercises per section, as label -> test class
+SECTIONS = {
+    "Fundamentals:": {
+        "Exercise 1 (Reverse String)": "TestExercise1",
+        "Exercise 2 (FizzBuzz)": "TestExercise2",
+        "Exercise 3 (Find Max)": "TestExercise3",
+        "Exercise 4 (Count Vowels)": "TestExercise4",
+        "Exercise 5 (Palindrome)": "TestExercise5",
+        "Exercise 6 (Two Sum)": "TestExercise6",
+        "Exercise 7 (Merge Arrays)": "TestExercise7",
+    },
+    "Collaborative:": {
+        "Exercise 8 (Group Anagrams)": "TestExercise8",
+        "Exercise 9 (Valid Parentheses)": "TestExercise9",
+    },
+    "Advanced:": {
+        "Exercise 10 (Binary Search)": "TestExercise10",
+        "Exercise 11 (Email Validation)": "TestExercise11",
+        "Exercise 12 (Flatten List)": "TestExercise12",
+        "Exercise 13 (Remove Duplicates)": "TestExercise13",
+        "Exercise 14 (Word Frequency)": "TestExercise14",
+        "Exercise 15 (Version Parser)": "TestExercise15",
+    },
+}
+
+
+class ResultCollector:
+    """pytest plugin that tallies passed/failed tests per test class."""
+
+    def __init__(self):
+        self.results = {}
+
+    def pytest_runtest_logreport(self, report):
+        # A test is decided by its "call" phase, or by a failing setup
+        if report.when != "call" and not (report.when == "setup" and report.failed):
+            return
+        parts = report.nodeid.split("::")
+        if len(parts) < 3:
+            return
+        counts = self.results.setdefault(parts[1], {"passed": 0, "failed": 0})
+        if report.passed:
+            counts["passed"] += 1
+        elif report.failed:
+            counts["failed"] += 1
+
+
+# pytest exit codes after which every selected test has reported a result
+COMPLETE_RUN = (pytest.ExitCode.OK, pytest.ExitCode.TESTS_FAILED)
+
+
+def run_pytest(test_classes=None):
+    """
+    Run the exercise tests in this process.
+
+    Args:
+        test_classes: Only run these TestExerciseN classes (default: all)
+
+    Returns:
+        (results, exit_code): per-class counts as from collect_results(),
+        and pytest's ExitCode for the run
+    """
+    if test_classes is None:
+        targets = [TEST_FILE]
+    else:
+        targets = [f"{TEST_FILE}::{name}" for name in test_classes]
+
+    collector = ResultCollector()
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        # Drop pytest.ini's -v and keep pytest quiet; the report below is our output
+        code = pytest.main([*targets, "-o", "addopts=", "-p", "no:terminal"], plugins=[collector])
+    finally:
+        os.chdir(cwd)
+    return collector.results, pytest.ExitCode(code)
+
+
+def collect_results(test_classes=None):
+    """
+    Run the exercise tests in this process and return per-class counts.
+
+    Args:
+        test_classes: Only run these TestExerciseN classes (default: all)
+
+    Returns:
+        Dict of test class name -> {"passed": n, "failed": n}
+    """
+    return run_pytest(test_classes)[0]
+
+
+def all_test_classes():
+    """Every TestExerciseN class, in report order."""
+    return [name for exercises in SECTIONS.values() for name in exercises.values()]
+
+
+def shard(items, count):
+    """Split items round-robin into at most ``count`` non-empty shards."""
+    return [items[i::count] for i in range(min(count, len(items)))]
+
+
+def run_pytest_parallel(jobs, test_classes=None):
+    """
+    Like run_pytest(), but split across ``jobs`` worker processes.
+
+    Each worker runs a shard of the TestExerciseN classes in its own
+    pytest session; the per-class counts are merged afterwards and the
+    exit code is the worst one any shard returned.
+    """
+    classes = list(test_classes) if test_classes is not None else all_test_classes()
+    shards = shard(classes, jobs)
+    if len(shards) <= 1:
+        return run_pytest(test_classes)
+
+    results = {}
+    codes = []
+    with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+        for partial, code in pool.map(run_pytest, shards):
+            results.update(partial)
+            codes.append(code)
+    return results, max(codes)
+
+
+def collect_results_parallel(jobs, test_classes=None):
+    """
+    Run the exercise tests split across ``jobs`` worker processes.
+
+    The result is the same as collect_results().
+    """
+    return run_pytest_parallel(jobs, test_classes)[0]
+
+
+def source_digest(path):
+    """SHA-256 of a file's contents, or None if it doesn't exist."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def exercise_source(test_class):
+    """Path of the exercise file that ``test_class`` tests, or None."""
+    number = test_class[len("TestExercise"):]
+    for directory in WATCH_DIRS:
+        path = os.path.join(ROOT, directory, f"exercise_{number}.py")
+        if os.path.exists(path):
+            return path
+    return None
 
-    # Run pytest quietly and capture output (only test_exercises.py for progress report)
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest", "tests/test_exercises.py", "-v", "--tb=no"],
-        capture_output=True,
-        text=True,
-    )
 
-    output = result.stdout
-
-    # Count results per exercise, organized by section
-    sections = {
-        "Fundamentals:": {
-            "Exercise 1 (Reverse String)": "TestExercise1",
-            "Exercise 2 (FizzBuzz)": "TestExercise2",
-            "Exercise 3 (Find Max)": "TestExercise3",
-            "Exercise 4 (Count Vowels)": "TestExercise4",
-            "Exercise 5 (Palindrome)": "TestExercise5",
-            "Exercise 6 (Two Sum)": "TestExercise6",
-            "Exercise 7 (Merge Arrays)": "TestExercise7",
-        },
-        "Collaborative:": {
-            "Exercise 8 (Group Anagrams)": "TestExercise8",
-            "Exercise 9 (Valid Parentheses)": "TestExercise9",
-        },
-        "Advanced:": {
-            "Exercise 10 (Binary Search)": "TestExercise10",
-            "Exercise 11 (Email Validation)": "TestExercise11",
-            "Exercise 12 (Flatten List)": "TestExercise12",
-            "Exercise 13 (Remove Duplicates)": "TestExercise13",
-            "Exercise 14 (Word Frequency)": "TestExercise14",
-            "Exercise 15 (Version Parser)": "TestExercise15",
-        },
-    }
+def load_cache():
+    """Cached results as test class -> entry, or {} if missing/stale."""
+    try:
+        with open(os.path.join(ROOT, CACHE_FILE), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION or data.get("python") != sys.version:
+        return {}
+    return data.get("results", {})
 
+
+def save_cache(entries):
+    path = os.path.join(ROOT, CACHE_FILE)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "python": sys.version, "results": entries}, f, indent=2)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # A read-only checkout still gets its report, just no cache
+
+
+def collect_results_cached(jobs=1, force=False):
+    """
+    Like collect_results(), but reuse the last results of unchanged exercises.
+
+    An exercise's cached counts are reused while both its exercise_N.py
+    and tests/test_exercises.py hash the same as when they were recorded.
+    Only classes that reported results in a run pytest finished are
+    cached, so an interrupted run is simply re-run next time.
+
+    Args:
+        jobs: Worker processes for the exercises that do need to run
+        force: Ignore the cache and run every exercise
+
+    Returns:
+        Dict of test class name -> {"passed": n, "failed": n}
+    """
+    test_digest = source_digest(os.path.join(ROOT, TEST_FILE))
+    keys = {}
+    for name in all_test_classes():
+        keys[name] = {"tests": test_digest, "source": source_digest(exercise_source(name) or "")}
+
+    cache = {} if force else load_cache()
+    results = {}
+    stale = []
+    for name, key in keys.items():
+        entry = cache.get(name)
+        if entry is not None and entry.get("key") == key:
+            results[name] = {"passed": entry["passed"], "failed": entry["failed"]}
+        else:
+            stale.append(name)
+
+    if stale:
+        if jobs > 1:
+            fresh, code = run_pytest_parallel(jobs, stale)
+        else:
+            fresh, code = run_pytest(stale)
+        results.update(fresh)
+        if code in COMPLETE_RUN:
+            save_cache({name: {"key": keys[name], **results[name]} for name in keys if name in results})
+    return results
+
+
+def print_report(results):
+    """Print the sectioned progress report for per-class counts."""
     total_passed = 0
     total_tests = 0
 
-    results = []
+    lines = []
 
-    for section_name, exercises in sections.items():
-        results.append(section_name)
+    for section_name, exercises in SECTIONS.items():
+        lines.append(section_name)
         for label, test_class in exercises.items():
-            lines = output.split("\n")
-            # Use "::" suffix to avoid matching TestExercise1 with TestExercise10, etc.
-            # Check for "%" to only count main test output, not summary section
-            class_pattern = f"{test_class}::"
-            passed = sum(
-                1
-                for line in lines
-                if class_pattern in line and " PASSED" in line and "%" in line
-            )
-            failed = sum(
-                1
-                for line in lines
-                if class_pattern in line and " FAILED" in line and "%" in line
-            )
-            total = passed + failed
+            counts = results.get(test_class, {"passed": 0, "failed": 0})
+            passed = counts["passed"]
+            total = passed + counts["failed"]
 
             total_passed += passed
             total_tests += total
 
             if passed == total and total > 0:
-                results.append(f"✅ {label:<35} - COMPLETE ({passed}/{total})")
+                lines.append(f"✅ {label:<35} - COMPLETE ({passed}/{total})")
             else:
-                results.append(f"⬜ {label:<35} - {passed}/{total} passing")
-        results.append("")  # Empty line after section
+                lines.append(f"⬜ {label:<35} - {passed}/{total} passing")
+        lines.append("")  # Empty line after section
 
     print(f"📊 Overall: {total_passed} / {total_tests} tests passing")
     print()
 
-    for r in results:
-        print(r)
+    for line in lines:
+        print(line)
 
     print("─────────────────────────────────────────────────────────────────")
 
@@ -93,5 +285,155 @@ def run_tests():
     print()
 
 
+def scan_sources():
+    """Modification times of the watched exercise files and the test file."""
+    mtimes = {}
+    for directory in WATCH_DIRS:
+        path = os.path.join(ROOT, directory)
+        if not os.path.isdir(path):
+            continue
+        for name in os.listdir(path):
+            if name.endswith(".py"):
+                full = os.path.join(path, name)
+                mtimes[full] = os.stat(full).st_mtime_ns
+    test_file = os.path.join(ROOT, TEST_FILE)
+    if os.path.exists(test_file):
+        mtimes[test_file] = os.stat(test_file).st_mtime_ns
+    return mtimes
+
+
+def affected_classes(paths):
+    """
+    Map changed files to the test classes that need to run again.
+
+    Returns:
+        Set of TestExerciseN names, or None if everything must run
+    """
+    classes = set()
+    for path in paths:
+        match = EXERCISE_FILE.search(os.path.basename(path))
+        if match is None:
+            return None
+        classes.add(f"TestExercise{match.group(1)}")
+    return classes
+
+
+def reload_sources(paths):
+    """
+    Make the next test run see the new contents of ``paths``.
+
+    Exercise modules that were already imported are reloaded; one that no
+    longer imports is dropped from sys.modules so its tests fail on import.
+    A changed test file is dropped so pytest imports it again.
+    """
+    importlib.invalidate_caches()
+    changed = {os.path.abspath(p) for p in paths}
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, "__file__", None)
+        if not filename or os.path.abspath(filename) not in changed:
+            continue
+        if os.path.abspath(filename) == os.path.join(ROOT, TEST_FILE):
+            del sys.modules[name]
+            continue
+        # An edit within the same second can leave a .pyc that still looks fresh
+        try:
+            os.remove(importlib.util.cache_from_source(filename))
+        except (OSError, ValueError, NotImplementedError):
+            pass
+        try:
+            importlib.reload(module)
+        except Exception:
+            sys.modules.pop(name, None)
+
+
+class Watcher:
+    """Keeps results between runs and re-runs only what changed."""
+
+    def __init__(self, jobs=1):
+        self.jobs = jobs
+        self.mtimes = scan_sources()
+        self.results = {}
+
+    def run(self, test_classes=None):
+        """Run ``test_classes`` (default: all) and merge their counts."""
+        if self.jobs > 1:
+            partial = collect_results_parallel(self.jobs, test_classes)
+        else:
+            partial = collect_results(test_classes)
+        if test_classes is None:
+            self.results = partial
+        else:
+            for name in test_classes:
+                self.results.pop(name, None)
+            self.results.update(partial)
+
+    def poll(self):
+        """Return the files added, changed or removed since the last poll."""
+        mtimes = scan_sources()
+        changed = {p for p in mtimes.keys() | self.mtimes.keys() if mtimes.get(p) != self.mtimes.get(p)}
+        self.mtimes = mtimes
+        return changed
+
+    def refresh(self):
+        """
+        Re-run the tests affected by edits since the last poll.
+
+        Returns:
+            True if anything was re-run
+        """
+        changed = self.poll()
+        if not changed:
+            return False
+        reload_sources(changed)
+        classes = affected_classes(changed)
+        self.run(sorted(classes) if classes is not None else None)
+        return True
+
+
+def watch(jobs=1, interval=0.5):
+    """Run the tests, then re-run affected exercises on every save."""
+    watcher = Watcher(jobs)
+    watcher.run()
+    while True:
+        print(CLEAR_SCREEN, end="")
+        print(f"👀 Watching for changes (Ctrl+C to stop) - last run {time.strftime('%H:%M:%S')}\n")
+        print_report(watcher.results)
+        sys.stdout.flush()
+        try:
+            while not watcher.refresh():
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print()
+            return
+
+
+def run_tests(jobs=1, force=False):
+    print("\n🧪 Running tests...\n")
+    print_report(collect_results_cached(jobs, force=force))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show your progress on the exercises.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, metavar="N",
+        help="run the exercise test classes across N worker processes",
+    )
+    parser.add_argument(
+        "-w", "--watch", action="store_true",
+        help="keep running and re-test exercises as you save them",
+    )
+    parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="ignore cached results and re-run every exercise",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.watch:
+        watch(jobs=args.jobs)
+    else:
+        run_tests(jobs=args.jobs, force=args.force)
+
+
 if __name__ == "__main__":
-    run_tests()
+    main()
@@ -0,0 +1,57 @@
+"""
+Git Command Verification Utilities
+
+These utilities help verify that students have actually run git commands
+as part of their exercises, not just implemented the Python code.
+
+Usage:
+    from git_verification import GitVerifier
+
+    verifier = GitVerifier()
+
+    # Check if a commit message exists
+    assert verifier.has_commit_message("Exercise 1")
+
+    # Check if a branch exists
+    assert verifier.branch_exists("feature/my-branch")
+
+    # Check commit count
+    assert verifier.commit_count() >= 5
+
+    # Checks share one memoized RepoState snapshot per repository state
+    state = verifier.state()
+
+    # Reuse one long-lived `git cat-file` process instead of forking per check
+    verifier = GitVerifier(backend=CatFileBackend.for_repo())
+
+    # Or read .git directly and never start a git process at all
+    verifier = GitVerifier(backend=NativeBackend.for_repo())
+
+    # Or run checks concurrently from asyncio code
+    committed = await AsyncGitVerifier().has_commit_message("Exercise 1")
+"""
+
+from .aio import AsyncGitVerifier
+from .backend import Backend, CatFileBackend
+from .native import NativeBackend
+from .progress import CommitIndex
+from .state import RepoState
+from .verifier import (
+    GitVerifier,
+    verify_branch_created,
+    verify_exercise_committed,
+    verify_tag_created,
+)
+
+__all__ = [
+    "AsyncGitVerifier",
+    "Backend",
+    "CatFileBackend",
+    "CommitIndex",
+    "GitVerifier",
+    "NativeBackend",
+    "RepoState",
+    "verify_branch_created",
+    "verify_exercise_committed",
+    "verify_tag_created",
+]
@@ -0,0 +1,183 @@
+"""
+AsyncGitVerifier - the GitVerifier checks as coroutines.
+
+Every check runs git through ``asyncio.create_subprocess_exec``, so checks
+against many refs or many repositories can run concurrently with
+``asyncio.gather``. A semaphore caps how many git processes run at once;
+share one semaphore between verifiers to cap them across repositories.
+
+Usage:
+    import asyncio
+    from git_verification.aio import AsyncGitVerifier, verify_exercises_committed
+
+    async def main():
+        verifier = AsyncGitVerifier(max_concurrency=8)
+        committed = await verify_exercises_committed(verifier=verifier)
+        print([n for n, done in committed.items() if done])
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import os
+from typing import Dict, Iterable, List, Optional
+
+from .verifier import parse_branch_listing
+
+DEFAULT_CONCURRENCY = 8
+
+
+class AsyncGitVerifier:
+    """Async counterpart of GitVerifier with the same methods."""
+
+    def __init__(
+        self,
+        repo_path: Optional[str] = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        """
+        Initialize the AsyncGitVerifier.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+            max_concurrency: Most git processes this verifier runs at once
+            semaphore: Shared semaphore to use instead of a private one
+        """
+        self.repo_path = repo_path or os.getcwd()
+        self.semaphore = semaphore or asyncio.Semaphore(max_concurrency)
+
+    async def _run_git(self, *args) -> str:
+        """Run a git command and return output."""
+        async with self.semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "git", *args,
+                    cwd=self.repo_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+            except Exception:
+                return ""
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return ""
+        return stdout.decode("utf-8", errors="replace").strip()
+
+    async def is_repository(self) -> bool:
+        """Check if the path is inside a git repository."""
+        return await self._run_git("rev-parse", "--git-dir") != ""
+
+    async def has_commit_message(self, message_substring: str, limit: int = 50) -> bool:
+        """Check if any recent commit message contains the given substring."""
+        output = await self._run_git("log", f"-{limit}", "--oneline")
+        return message_substring.lower() in output.lower()
+
+    async def has_commit_with_file(self, filepath: str, limit: int = 50) -> bool:
+        """Check if any recent commit modified the given file."""
+        output = await self._run_git("log", f"-{limit}", "--oneline", "--", filepath)
+        return bool(output)
+
+    async def branch_exists(self, branch_name: str, include_remote: bool = True) -> bool:
+        """Check if a branch exists (locally, or on any remote)."""
+        if not include_remote:
+            return bool(await self._run_git("branch", "--list", branch_name))
+        local, remote = await asyncio.gather(
+            self._run_git("branch", "--list", branch_name),
+            self._run_git("branch", "-r", "--list", f"*/{branch_name}"),
+        )
+        return bool(local or remote)
+
+    async def get_branches(self, include_remote: bool = False) -> List[str]:
+        """Get list of all branches."""
+        if include_remote:
+            output = await self._run_git("branch", "-a")
+        else:
+            output = await self._run_git("branch")
+        return parse_branch_listing(output, include_remote)
+
+    async def commit_count(self, branch: str = "HEAD") -> int:
+        """Get the number of commits in a branch."""
+        output = await self._run_git("rev-list", "--count", branch)
+        try:
+            return int(output)
+        except ValueError:
+            return 0
+
+    async def tag_exists(self, tag_name: str) -> bool:
+        """Check if a tag exists."""
+        return bool(await self._run_git("tag", "-l", tag_name))
+
+    async def get_tags(self) -> List[str]:
+        """Get list of all tags."""
+        output = await self._run_git("tag", "-l")
+        return [t.strip() for t in output.split('\n') if t.strip()]
+
+    async def has_merge_commit(self, limit: int = 20) -> bool:
+        """Check if there are any merge commits in recent history."""
+        return bool(await self._run_git("log", f"-{limit}", "--merges", "--oneline"))
+
+    async def file_was_modified_in_commit(self, filepath: str, commit: str = "HEAD") -> bool:
+        """Check if a file was modified in a specific commit."""
+        output = await self._run_git("show", "--name-only", "--format=", commit)
+        return filepath in output
+
+    async def get_current_branch(self) -> str:
+        """Get the name of the current branch."""
+        return await self._run_git("rev-parse", "--abbrev-ref", "HEAD")
+
+    async def is_clean(self) -> bool:
+        """Check if the working directory is clean."""
+        return not await self._run_git("status", "--porcelain")
+
+    async def get_last_commit_message(self) -> str:
+        """Get the message of the last commit."""
+        return await self._run_git("log", "-1", "--format=%s")
+
+    async def has_remote(self, remote_name: str = "origin") -> bool:
+        """Check if a remote exists."""
+        output = await self._run_git("remote")
+        return remote_name in output.split('\n')
+
+    async def reflog_contains(self, action_substring: str, limit: int = 50) -> bool:
+        """Check if reflog contains a specific action."""
+        output = await self._run_git("reflog", f"-{limit}")
+        return action_substring.lower() in output.lower()
+
+
+# Convenience coroutines for quick checks
+async def verify_exercise_committed(exercise_num: int, verifier: Optional[AsyncGitVerifier] = None) -> bool:
+    """Check if an exercise has been committed."""
+    verifier = verifier or AsyncGitVerifier()
+    return await verifier.has_commit_message(f"Exercise {exercise_num}")
+
+
+async def verify_exercises_committed(
+    exercises: Iterable[int] = range(1, 16),
+    verifier: Optional[AsyncGitVerifier] = None,
+) -> Dict[int, bool]:
+    """
+    Check several exercises concurrently.
+
+    Returns:
+        ``{exercise_number: committed}``
+    """
+    verifier = verifier or AsyncGitVerifier()
+    exercises = list(exercises)
+    results = await asyncio.gather(*(verify_exercise_committed(n, verifier) for n in exercises))
+    return dict(zip(exercises, results))
+
+
+async def verify_branch_created(branch_name: str, verifier: Optional[AsyncGitVerifier] = None) -> bool:
+    """Check if a branch was created."""
+    verifier = verifier or AsyncGitVerifier()
+    return await verifier.branch_exists(branch_name)
+
+
+async def verify_tag_created(tag_name: str, verifier: Optional[AsyncGitVerifier] = None) -> bool:
+    """Check if a tag was created."""
+    verifier = verifier or AsyncGitVerifier()
+    return await verifier.tag_exists(tag_name)
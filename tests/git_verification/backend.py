@@ -0,0 +1,231 @@
+"""
+Backends for GitVerifier
+
+A backend answers low-level questions about a repository (resolve a ref,
+read an object) without starting a new ``git`` process for each one.
+Any hook that returns None tells GitVerifier to fall back to running git.
+
+Usage:
+    from git_verification import GitVerifier, CatFileBackend
+
+    with GitVerifier(backend=CatFileBackend.for_repo(".")) as verifier:
+        assert verifier.commit_count() > 0
+"""
+
+import atexit
+import os
+import subprocess
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .objects import Commit, TreeEntry, parse_commit, parse_tree
+
+
+HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def is_oid(name: str) -> bool:
+    """Check whether a name is a full SHA-1 or SHA-256 object id."""
+    return len(name) in (40, 64) and set(name) <= HEX_DIGITS
+
+
+class Backend:
+    """
+    Base class for GitVerifier backends.
+
+    Every hook returns None, meaning "I can't answer this, ask git".
+    Subclasses override the hooks they support.
+    """
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Resolve a revision or ref name to an object id."""
+        return None
+
+    def read_object(self, name: str) -> Optional[Tuple[str, bytes]]:
+        """Return ``(type, data)`` for an object, or None if unavailable."""
+        return None
+
+    def list_refs(self, prefix: str = "refs/") -> Optional[Dict[str, str]]:
+        """
+        List refs under ``prefix``, sorted by name.
+
+        Values are object ids, or ``"ref: <target>"`` for symbolic refs.
+        """
+        return None
+
+    def current_branch(self) -> Optional[str]:
+        """Short name of the checked-out branch ("HEAD" when detached)."""
+        return None
+
+    def detached_head(self) -> Optional[str]:
+        """How `git branch` lists a detached HEAD, e.g. "(HEAD detached at v1.0)"."""
+        return None
+
+    def remotes(self) -> Optional[List[str]]:
+        """Names of the configured remotes."""
+        return None
+
+    def reflog(self, limit: int) -> Optional[List[str]]:
+        """The newest ``limit`` HEAD reflog entries, formatted like `git reflog`."""
+        return None
+
+    def is_repository(self) -> Optional[bool]:
+        """Whether the path is inside a git repository."""
+        return None
+
+    def is_clean(self) -> Optional[bool]:
+        """Whether `git status --porcelain` would print nothing."""
+        return None
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+    def read_commit(self, oid: str) -> Optional[Commit]:
+        """Load and parse a commit, peeling annotated tags."""
+        if not is_oid(oid):
+            resolved = self.resolve(oid)
+            if resolved is None:
+                return None
+            oid = resolved
+        obj = self.read_object(oid)
+        while obj is not None and obj[0] == "tag":
+            target = obj[1].split(b"\n", 1)[0].partition(b" ")[2].decode("ascii")
+            oid = target
+            obj = self.read_object(target)
+        if obj is None or obj[0] != "commit":
+            return None
+        return parse_commit(oid, obj[1])
+
+    def read_tree(self, oid: str) -> Optional[List[TreeEntry]]:
+        """Load and parse a tree object."""
+        obj = self.read_object(oid)
+        if obj is None or obj[0] != "tree":
+            return None
+        return parse_tree(obj[1], hash_size=len(oid) // 2)
+
+
+class CatFileBackend(Backend):
+    """
+    Backend that keeps long-lived ``git cat-file`` processes per repository.
+
+    One ``--batch-check`` process answers ref and object lookups and one
+    ``--batch`` process streams object contents. Both are started lazily
+    and shared by every verifier created through ``for_repo``.
+    """
+
+    _instances: Dict[str, "CatFileBackend"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, repo_path: Optional[str] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+        """
+        self.repo_path = repo_path or os.getcwd()
+        self._check: Optional[subprocess.Popen] = None
+        self._batch: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[str, bytes]] = {}
+
+    @classmethod
+    def for_repo(cls, repo_path: Optional[str] = None) -> "CatFileBackend":
+        """
+        Return the shared backend for a repository, creating it if needed.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+        """
+        key = os.path.realpath(repo_path or os.getcwd())
+        with cls._instances_lock:
+            backend = cls._instances.get(key)
+            if backend is None:
+                backend = cls(key)
+                cls._instances[key] = backend
+            return backend
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every shared backend."""
+        with cls._instances_lock:
+            backends = list(cls._instances.values())
+            cls._instances.clear()
+        for backend in backends:
+            backend.close()
+
+    def _start(self, mode: str) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["git", "cat-file", mode],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _query(self, mode: str, name: str) -> Optional[Tuple[subprocess.Popen, List[str]]]:
+        """Send one object name to a cat-file process and return its header."""
+        if "\n" in name or not name:
+            return None
+        proc = self._check if mode == "--batch-check" else self._batch
+        if proc is None or proc.poll() is not None:
+            try:
+                proc = self._start(mode)
+            except OSError:
+                return None
+            if mode == "--batch-check":
+                self._check = proc
+            else:
+                self._batch = proc
+        try:
+            proc.stdin.write(name.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline().decode("utf-8", errors="replace").split()
+        except (OSError, ValueError):
+            return None
+        # "<oid> <type> <size>" on success, "<name> missing" / "ambiguous" otherwise
+        if len(header) != 3:
+            return None
+        return proc, header
+
+    def resolve(self, rev: str) -> Optional[str]:
+        with self._lock:
+            answer = self._query("--batch-check", rev)
+        if answer is None:
+            return None
+        return answer[1][0]
+
+    def read_object(self, name: str) -> Optional[Tuple[str, bytes]]:
+        cached = self._cache.get(name)
+        if cached is not None:
+            return cached
+        with self._lock:
+            answer = self._query("--batch", name)
+            if answer is None:
+                return None
+            proc, (oid, obj_type, size) = answer
+            # Contents are followed by a single newline
+            data = proc.stdout.read(int(size) + 1)[:-1]
+        # Object ids are immutable, so only cache lookups by full oid
+        if name == oid:
+            self._cache[oid] = (obj_type, data)
+        return obj_type, data
+
+    def close(self) -> None:
+        with self._lock:
+            for proc in (self._check, self._batch):
+                if proc is None:
+                    continue
+                try:
+                    proc.stdin.close()
+                    proc.wait(timeout=10)
+                except (OSError, subprocess.TimeoutExpired):
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+            self._check = None
+            self._batch = None
+            self._cache.clear()
+
+
+atexit.register(CatFileBackend.close_all)
@@ -0,0 +1,153 @@
+"""
+Batch Grading of Student Forks
+
+Runs the GitVerifier checks over many cloned repositories at once using
+a process pool, and yields one result dict per repository as soon as it
+is graded. Workers read ``.git`` directly (NativeBackend), so most
+repositories are graded without starting any git process; the ones that
+do need git share a bounded pool of process slots.
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .limits import set_git_process_limit
+from .native import NativeBackend, find_git_dir
+from .progress import CommitIndex
+from .state import RepoState
+from .verifier import GitVerifier
+
+EXERCISE_COUNT = 15
+
+
+def find_repos(root: str) -> List[str]:
+    """
+    List the repositories directly inside a directory.
+
+    Args:
+        root: Directory holding one cloned fork per subdirectory
+
+    Returns:
+        Sorted list of repository paths
+    """
+    repos = []
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if os.path.isdir(path) and os.path.exists(os.path.join(path, ".git")):
+            repos.append(path)
+    return repos
+
+
+def read_manifest(path: str) -> List[str]:
+    """
+    Read repository paths from a manifest file.
+
+    One path per line; blank lines and ``#`` comments are skipped.
+    Relative paths are resolved against the manifest's directory.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    repos = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                repos.append(os.path.normpath(os.path.join(base, line)))
+    return repos
+
+
+def grade_repo(repo_path: str) -> Dict:
+    """
+    Run every git workflow check against one repository.
+
+    Args:
+        repo_path: Path to a cloned student fork
+
+    Returns:
+        JSON-serializable result; contains an ``error`` key if the
+        repository couldn't be graded
+    """
+    started = time.perf_counter()
+    result: Dict = {"repo": repo_path}
+    if find_git_dir(repo_path) is None:
+        result["error"] = "not a git repository"
+        return result
+
+    verifier = GitVerifier(repo_path, backend=NativeBackend.for_repo(repo_path))
+    try:
+        # Don't write index files into the students' repositories
+        index = CommitIndex.load(repo_path, backend=verifier.backend, persist=False)
+        committed = index.exercises_committed(range(1, EXERCISE_COUNT + 1))
+        branches = verifier.get_branches(include_remote=True)
+        result.update({
+            "commits": verifier.commit_count(),
+            "branch": verifier.get_current_branch(),
+            "clean": verifier.is_clean(),
+            "has_remote": verifier.has_remote("origin"),
+            "has_main": verifier.branch_exists("main") or verifier.branch_exists("master"),
+            "feature_branches": [
+                b for b in branches if "feature" in b.lower() or "exercise" in b.lower()
+            ],
+            "has_merge": verifier.has_merge_commit(limit=30),
+            "version_tags": [t for t in verifier.get_tags() if t.startswith("v")],
+            "exercises_committed": committed,
+            "last_commit_message": verifier.get_last_commit_message(),
+        })
+    except Exception as exc:  # one broken fork must not stop the batch
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        # Workers grade hundreds of repos; don't keep each one's packs mapped
+        NativeBackend.release(repo_path)
+        RepoState.invalidate(repo_path)
+    result["seconds"] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def _init_worker(slots) -> None:
+    set_git_process_limit(slots)
+
+
+def grade_many(
+    repos: Iterable[str],
+    workers: Optional[int] = None,
+    max_git_processes: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Grade repositories in parallel, yielding results as they finish.
+
+    Args:
+        repos: Repository paths
+        workers: Number of worker processes (defaults to the CPU count)
+        max_git_processes: Most git processes allowed at once across all
+            workers (defaults to ``workers``)
+
+    Yields:
+        One result dict per repository, in completion order
+    """
+    repos = list(repos)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(repos) or 1))
+    if workers == 1:
+        for repo in repos:
+            yield grade_repo(repo)
+        return
+
+    slots = multiprocessing.BoundedSemaphore(max_git_processes or workers)
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(slots,)) as pool:
+        yield from pool.imap_unordered(grade_repo, repos, chunksize=1)
+
+
+def write_json_lines(results: Iterable[Dict], stream) -> Dict[str, int]:
+    """
+    Write each result as one JSON line, flushing as it goes.
+
+    Returns:
+        Counts of graded and failed repositories
+    """
+    summary = {"graded": 0, "errors": 0}
+    for result in results:
+        stream.write(json.dumps(result, sort_keys=True) + "\n")
+        stream.flush()
+        summary["errors" if "error" in result else "graded"] += 1
+    return summary
@@ -0,0 +1,44 @@
+"""
+Limit on Concurrent Git Processes
+
+When many repositories are graded at once, each worker may need to fall
+back to running git. A shared semaphore (e.g. a
+``multiprocessing.BoundedSemaphore`` handed to every pool worker) caps how
+many of those short-lived git processes run at the same time.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_slots = None
+
+
+def set_git_process_limit(slots) -> None:
+    """
+    Install a semaphore that every short-lived git process must hold.
+
+    Args:
+        slots: A semaphore-like object with ``acquire``/``release``,
+            or None to remove the limit
+    """
+    global _slots
+    _slots = slots
+
+
+def get_git_process_limit() -> Optional[object]:
+    """Return the installed semaphore, if any."""
+    return _slots
+
+
+@contextmanager
+def git_slot() -> Iterator[None]:
+    """Hold one git process slot for the duration of the block."""
+    slots = _slots
+    if slots is None:
+        yield
+        return
+    slots.acquire()
+    try:
+        yield
+    finally:
+        slots.release()
@@ -0,0 +1,656 @@
+"""
+Pure-Python Git Repository Reader
+
+Reads ``.git/refs``, ``packed-refs``, loose objects (zlib) and pack files
+with their ``.idx`` through ``mmap``, so GitVerifier can answer checks
+without starting a single ``git`` process.
+
+Only SHA-1 repositories are supported; anything unusual (SHA-256 object
+format, reftable refs, unsupported revision syntax) makes the hooks
+return None so GitVerifier falls back to running git.
+"""
+
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from .backend import Backend, is_oid
+from .worktree import WorktreeStatus
+
+
+OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+OFS_DELTA = 6
+REF_DELTA = 7
+
+# Revision suffixes we understand: HEAD~2, main^, v1.0.0^2, ...
+REV_SUFFIX = re.compile(r"([~^])(\d*)")
+
+# Rules `git rev-parse` uses to expand a short ref name
+DWIM_RULES = ("{}", "refs/{}", "refs/tags/{}", "refs/heads/{}", "refs/remotes/{}", "refs/remotes/{}/HEAD")
+
+# While any of these exist `git branch` describes the rebase or bisect instead
+DETACHED_STATE_FILES = ("rebase-merge", "rebase-apply", "BISECT_LOG")
+
+# Keep at most this many decoded objects in memory
+CACHE_LIMIT = 4096
+
+
+def find_git_dir(path: str) -> Optional[Tuple[str, str]]:
+    """
+    Locate the repository that contains ``path``.
+
+    Returns:
+        ``(worktree_root, git_dir)``, or None if ``path`` is not inside a
+        non-bare repository.
+    """
+    current = os.path.realpath(path)
+    while True:
+        dotgit = os.path.join(current, ".git")
+        if os.path.isdir(dotgit):
+            return current, dotgit
+        if os.path.isfile(dotgit):
+            # Linked worktrees and submodules use a "gitdir: <path>" file
+            with open(dotgit, "r", encoding="utf-8") as f:
+                line = f.readline().strip()
+            if line.startswith("gitdir:"):
+                target = line[len("gitdir:"):].strip()
+                return current, os.path.normpath(os.path.join(current, target))
+            return None
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def parse_config(path: str) -> Dict[Tuple[str, str], Dict[str, List[str]]]:
+    """
+    Parse a git config file into ``{(section, subsection): {key: [values]}}``.
+
+    Section and key names are lower-cased like git does; includes are
+    not followed.
+    """
+    config: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return config
+
+    section = ("", "")
+    for raw in lines:
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            header = line[1:line.index("]")] if "]" in line else line[1:]
+            name, _, sub = header.partition(" ")
+            section = (name.lower(), sub.strip().strip('"'))
+            if "." in name and not sub:
+                # Old-style [section.subsection]
+                name, _, sub = name.partition(".")
+                section = (name.lower(), sub)
+            config.setdefault(section, {})
+            continue
+        key, sep, value = line.partition("=")
+        value = value.split(" #")[0].split(" ;")[0].strip().strip('"') if sep else "true"
+        config.setdefault(section, {}).setdefault(key.strip().lower(), []).append(value)
+    return config
+
+
+class PackFile:
+    """A single ``.pack`` file and its ``.idx``, both memory-mapped."""
+
+    def __init__(self, idx_path: str):
+        self.idx_path = idx_path
+        self.pack_path = idx_path[:-4] + ".pack"
+        with open(idx_path, "rb") as f:
+            self.idx = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(self.pack_path, "rb") as f:
+            self.pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.idx[:4] == b"\377tOc":
+            self.version = struct.unpack(">I", self.idx[4:8])[0]
+            fanout_start = 8
+        else:
+            self.version = 1
+            fanout_start = 0
+        self.fanout = struct.unpack(">256I", self.idx[fanout_start:fanout_start + 1024])
+        self.count = self.fanout[255]
+        self.names_start = fanout_start + 1024
+
+    def close(self) -> None:
+        self.idx.close()
+        self.pack.close()
+
+    def _name_at(self, i: int) -> bytes:
+        if self.version == 1:
+            pos = self.names_start + i * 24 + 4
+        else:
+            pos = self.names_start + i * 20
+        return self.idx[pos:pos + 20]
+
+    def find(self, oid: bytes) -> Optional[int]:
+        """Return the pack offset of an object, or None if it isn't here."""
+        first = oid[0]
+        lo = self.fanout[first - 1] if first else 0
+        hi = self.fanout[first]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            name = self._name_at(mid)
+            if name < oid:
+                lo = mid + 1
+            elif name > oid:
+                hi = mid
+            else:
+                return self._offset_at(mid)
+        return None
+
+    def _offset_at(self, i: int) -> int:
+        if self.version == 1:
+            pos = self.names_start + i * 24
+            return struct.unpack(">I", self.idx[pos:pos + 4])[0]
+        pos = self.names_start + self.count * 24 + i * 4
+        offset = struct.unpack(">I", self.idx[pos:pos + 4])[0]
+        if offset & 0x80000000:
+            large = self.names_start + self.count * 28 + (offset & 0x7FFFFFFF) * 8
+            offset = struct.unpack(">Q", self.idx[large:large + 8])[0]
+        return offset
+
+    def inflate(self, pos: int, size: int) -> bytes:
+        """Decompress the zlib stream that starts at ``pos``."""
+        decomp = zlib.decompressobj()
+        out = []
+        chunk = max(size, 4096) + 64
+        while not decomp.eof and pos < len(self.pack):
+            out.append(decomp.decompress(self.pack[pos:pos + chunk]))
+            pos += chunk
+        return b"".join(out)
+
+    def header(self, offset: int) -> Tuple[int, int, int]:
+        """Decode an object header; returns ``(type, size, data_offset)``."""
+        byte = self.pack[offset]
+        obj_type = (byte >> 4) & 7
+        size = byte & 0x0F
+        shift = 4
+        pos = offset + 1
+        while byte & 0x80:
+            byte = self.pack[pos]
+            size |= (byte & 0x7F) << shift
+            shift += 7
+            pos += 1
+        return obj_type, size, pos
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Apply a git delta (copy/insert instructions) to a base object."""
+
+    def varint(pos: int) -> Tuple[int, int]:
+        value = shift = 0
+        while True:
+            byte = delta[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value, pos
+
+    _, pos = varint(0)  # source size
+    _, pos = varint(pos)  # result size
+    out = bytearray()
+    end = len(delta)
+    while pos < end:
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            offset = size = 0
+            for bit in range(4):
+                if op & (1 << bit):
+                    offset |= delta[pos] << (8 * bit)
+                    pos += 1
+            for bit in range(3):
+                if op & (1 << (4 + bit)):
+                    size |= delta[pos] << (8 * bit)
+                    pos += 1
+            out += base[offset:offset + (size or 0x10000)]
+        elif op:
+            out += delta[pos:pos + op]
+            pos += op
+        else:
+            raise ValueError("invalid delta opcode 0")
+    return bytes(out)
+
+
+class NativeBackend(Backend):
+    """
+    Backend that reads the repository files directly.
+
+    Refs are re-read on every lookup (loose refs are tiny files and
+    ``packed-refs`` is cached by mtime), so answers stay current while
+    the student keeps working. Objects are immutable and cached.
+    """
+
+    _instances: Dict[str, "NativeBackend"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, repo_path: Optional[str] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+        """
+        self.repo_path = repo_path or os.getcwd()
+        self.worktree: Optional[str] = None
+        self.git_dir: Optional[str] = None
+        self.common_dir: Optional[str] = None
+
+        found = find_git_dir(self.repo_path)
+        if found is not None:
+            self.worktree, self.git_dir = found
+            self.common_dir = self.git_dir
+            commondir_file = os.path.join(self.git_dir, "commondir")
+            if os.path.isfile(commondir_file):
+                with open(commondir_file, "r", encoding="utf-8") as f:
+                    self.common_dir = os.path.normpath(os.path.join(self.git_dir, f.read().strip()))
+
+        self.config = self._load_config()
+        self._config_stat = self.config_stat()
+        core = self.config.get(("core", ""), {})
+        extensions = self.config.get(("extensions", ""), {})
+        # Repositories we can't read natively are left entirely to git
+        self.available = (
+            self.git_dir is not None
+            and core.get("bare", ["false"])[-1].lower() != "true"
+            and extensions.get("objectformat", ["sha1"])[-1].lower() == "sha1"
+            and extensions.get("refstorage", ["files"])[-1].lower() == "files"
+        )
+
+        self._lock = threading.RLock()
+        self._packs: Dict[str, PackFile] = {}
+        self._packs_mtime: Dict[str, float] = {}
+        self._cache: Dict[str, Tuple[str, bytes]] = {}
+        self._packed_refs: Dict[str, str] = {}
+        self._packed_refs_stat: Optional[Tuple[float, int]] = None
+
+    def _load_config(self) -> Dict[Tuple[str, str], Dict[str, List[str]]]:
+        """Merge the user's global config with the repository config."""
+        home = os.path.expanduser("~")
+        xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+        paths = [os.path.join(xdg, "git", "config"), os.path.join(home, ".gitconfig")]
+        if self.common_dir:
+            paths.append(os.path.join(self.common_dir, "config"))
+        merged: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+        for path in paths:
+            for section, values in parse_config(path).items():
+                target = merged.setdefault(section, {})
+                for key, items in values.items():
+                    target.setdefault(key, []).extend(items)
+        return merged
+
+    def config_stat(self) -> Optional[Tuple[int, int]]:
+        """``(mtime_ns, size)`` of the repository config, or None if missing."""
+        if not self.common_dir:
+            return None
+        try:
+            st = os.stat(os.path.join(self.common_dir, "config"))
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _refresh_config(self) -> None:
+        """Re-read the config if `git remote add` and friends rewrote it."""
+        stat = self.config_stat()
+        with self._lock:
+            if stat != self._config_stat:
+                self.config = self._load_config()
+                self._config_stat = stat
+
+    @classmethod
+    def for_repo(cls, repo_path: Optional[str] = None) -> "NativeBackend":
+        """
+        Return the shared backend for a repository, creating it if needed.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+        """
+        key = os.path.realpath(repo_path or os.getcwd())
+        with cls._instances_lock:
+            backend = cls._instances.get(key)
+            if backend is None:
+                backend = cls(key)
+                cls._instances[key] = backend
+            return backend
+
+    @classmethod
+    def release(cls, repo_path: Optional[str] = None) -> None:
+        """Close and forget the shared backend for a repository."""
+        key = os.path.realpath(repo_path or os.getcwd())
+        with cls._instances_lock:
+            backend = cls._instances.pop(key, None)
+        if backend is not None:
+            backend.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for pack in self._packs.values():
+                pack.close()
+            self._packs.clear()
+            self._packs_mtime.clear()
+            self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------
+
+    def _object_dirs(self) -> List[str]:
+        """The repository's object directory plus any alternates."""
+        objects = os.path.join(self.common_dir, "objects")
+        dirs = [objects]
+        alternates = os.path.join(objects, "info", "alternates")
+        if os.path.isfile(alternates):
+            with open(alternates, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        dirs.append(os.path.normpath(os.path.join(objects, line)))
+        return dirs
+
+    def _refresh_packs(self) -> bool:
+        """Load new ``.idx`` files; returns True if anything changed."""
+        changed = False
+        for objects in self._object_dirs():
+            pack_dir = os.path.join(objects, "pack")
+            try:
+                mtime = os.stat(pack_dir).st_mtime
+            except OSError:
+                continue
+            if self._packs_mtime.get(pack_dir) == mtime:
+                continue
+            self._packs_mtime[pack_dir] = mtime
+            for name in sorted(os.listdir(pack_dir)):
+                path = os.path.join(pack_dir, name)
+                if name.endswith(".idx") and path not in self._packs:
+                    try:
+                        self._packs[path] = PackFile(path)
+                        changed = True
+                    except (OSError, ValueError):
+                        continue
+        return changed
+
+    def _read_loose(self, oid: str) -> Optional[Tuple[str, bytes]]:
+        for objects in self._object_dirs():
+            path = os.path.join(objects, oid[:2], oid[2:])
+            try:
+                with open(path, "rb") as f:
+                    raw = zlib.decompress(f.read())
+            except (OSError, zlib.error):
+                continue
+            header, _, data = raw.partition(b"\0")
+            return header.split(b" ", 1)[0].decode("ascii"), data
+        return None
+
+    def _read_packed(self, pack: PackFile, offset: int) -> Tuple[str, bytes]:
+        obj_type, size, pos = pack.header(offset)
+        if obj_type in OBJECT_TYPES:
+            return OBJECT_TYPES[obj_type], pack.inflate(pos, size)
+
+        if obj_type == OFS_DELTA:
+            byte = pack.pack[pos]
+            pos += 1
+            distance = byte & 0x7F
+            while byte & 0x80:
+                byte = pack.pack[pos]
+                pos += 1
+                distance = ((distance + 1) << 7) | (byte & 0x7F)
+            base_type, base = self._read_packed(pack, offset - distance)
+        elif obj_type == REF_DELTA:
+            base_oid = pack.pack[pos:pos + 20].hex()
+            pos += 20
+            found = self.read_object(base_oid)
+            if found is None:
+                raise ValueError(f"missing delta base {base_oid}")
+            base_type, base = found
+        else:
+            raise ValueError(f"unknown pack object type {obj_type}")
+        return base_type, apply_delta(base, pack.inflate(pos, size))
+
+    def read_object(self, name: str) -> Optional[Tuple[str, bytes]]:
+        if not self.available:
+            return None
+        oid = name if is_oid(name) else self.resolve(name)
+        if oid is None:
+            return None
+        cached = self._cache.get(oid)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            found = None
+            binary = bytes.fromhex(oid)
+            for attempt in range(2):
+                if attempt == 0:
+                    self._refresh_packs()
+                for pack in self._packs.values():
+                    offset = pack.find(binary)
+                    if offset is not None:
+                        try:
+                            found = self._read_packed(pack, offset)
+                        except (ValueError, IndexError, zlib.error):
+                            found = None
+                        break
+                if found is None:
+                    found = self._read_loose(oid)
+                # A repack may have moved the object into a new pack
+                if found is not None or not self._refresh_packs():
+                    break
+
+            if found is not None:
+                if len(self._cache) >= CACHE_LIMIT:
+                    self._cache.clear()
+                self._cache[oid] = found
+            return found
+
+    # ------------------------------------------------------------------
+    # Refs
+    # ------------------------------------------------------------------
+
+    def _load_packed_refs(self) -> Dict[str, str]:
+        path = os.path.join(self.common_dir, "packed-refs")
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._packed_refs, self._packed_refs_stat = {}, None
+            return self._packed_refs
+        stamp = (st.st_mtime, st.st_size)
+        if stamp != self._packed_refs_stat:
+            refs = {}
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    # Skip the "# pack-refs with:" header and "^<peeled>" lines
+                    if line.startswith(("#", "^")):
+                        continue
+                    oid, _, refname = line.strip().partition(" ")
+                    if refname:
+                        refs[refname] = oid
+            self._packed_refs, self._packed_refs_stat = refs, stamp
+        return self._packed_refs
+
+    def _ref_file(self, refname: str) -> str:
+        # HEAD and other pseudo-refs are per-worktree; refs/ live in the common dir
+        base = self.common_dir if refname.startswith("refs/") else self.git_dir
+        return os.path.join(base, *refname.split("/"))
+
+    def read_ref(self, refname: str) -> Optional[str]:
+        """
+        Read one ref without following symbolic refs.
+
+        Returns:
+            An oid, ``"ref: <target>"`` for symbolic refs, or None.
+        """
+        try:
+            with open(self._ref_file(refname), "r", encoding="utf-8") as f:
+                value = f.read().strip()
+        except (OSError, UnicodeDecodeError):
+            value = None
+        if value:
+            return value
+        if refname.startswith("refs/"):
+            with self._lock:
+                return self._load_packed_refs().get(refname)
+        return None
+
+    def _peel_ref(self, refname: str) -> Optional[str]:
+        """Follow symbolic refs until an oid is found."""
+        for _ in range(10):
+            value = self.read_ref(refname)
+            if value is None:
+                return None
+            if not value.startswith("ref:"):
+                return value if is_oid(value) else None
+            refname = value[4:].strip()
+        return None
+
+    def resolve(self, rev: str) -> Optional[str]:
+        if not self.available or not rev:
+            return None
+        # Branch and tag names can't contain "~" or "^", so the first one
+        # starts the suffix
+        cut = min((i for i in (rev.find("~"), rev.find("^")) if i >= 0), default=len(rev))
+        base, suffix = rev[:cut], rev[cut:]
+        if REV_SUFFIX.sub("", suffix):
+            return None
+
+        if is_oid(base):
+            oid = base
+        else:
+            if not base or set(base) & set(":@{}*?[\\ "):
+                return None
+            oid = None
+            for rule in DWIM_RULES:
+                oid = self._peel_ref(rule.format(base))
+                if oid is not None:
+                    break
+            if oid is None:
+                return None
+
+        for op, count in REV_SUFFIX.findall(suffix):
+            n = int(count) if count else 1
+            if op == "~":
+                for _ in range(n):
+                    commit = self.read_commit(oid)
+                    if commit is None or not commit.parents:
+                        return None
+                    oid = commit.parents[0]
+            else:
+                commit = self.read_commit(oid)
+                if commit is None:
+                    return None
+                if n == 0:
+                    oid = commit.oid
+                elif n <= len(commit.parents):
+                    oid = commit.parents[n - 1]
+                else:
+                    return None
+        return oid
+
+    def list_refs(self, prefix: str = "refs/") -> Optional[Dict[str, str]]:
+        if not self.available:
+            return None
+        refs = {}
+        with self._lock:
+            for refname, oid in self._load_packed_refs().items():
+                if refname.startswith(prefix):
+                    refs[refname] = oid
+        root = os.path.join(self.common_dir, "refs")
+        for dirpath, _, filenames in os.walk(root):
+            rel = os.path.relpath(dirpath, self.common_dir).replace(os.sep, "/")
+            for filename in filenames:
+                if filename.endswith(".lock"):
+                    continue
+                refname = f"{rel}/{filename}"
+                if refname.startswith(prefix):
+                    value = self.read_ref(refname)
+                    if value:
+                        refs[refname] = value
+        return dict(sorted(refs.items()))
+
+    def current_branch(self) -> Optional[str]:
+        if not self.available:
+            return None
+        head = self.read_ref("HEAD")
+        if head is None:
+            return None
+        if not head.startswith("ref:"):
+            return "HEAD"
+        target = head[4:].strip()
+        # An unborn branch has no commit yet; let git report it
+        if self._peel_ref(target) is None:
+            return None
+        return target[len("refs/heads/"):] if target.startswith("refs/heads/") else target
+
+    def detached_head(self) -> Optional[str]:
+        if not self.available:
+            return None
+        if any(os.path.exists(os.path.join(self.git_dir, name)) for name in DETACHED_STATE_FILES):
+            return None
+        head = self.resolve("HEAD")
+        # Like `git branch`: name HEAD after the last checkout in the reflog
+        for line in reversed(self._head_log()):
+            info, _, message = line.partition("\t")
+            if not message.startswith("checkout: moving from "):
+                continue
+            target = message[len("checkout: moving from "):].partition(" to ")[2]
+            parts = info.split(" ", 2)
+            if not target or len(parts) < 2:
+                continue
+            new_oid = parts[1]
+            name = new_oid[:7]
+            matches = [rule.format(target) for rule in DWIM_RULES if self._peel_ref(rule.format(target))]
+            if target != "HEAD" and len(matches) == 1:
+                commit = self.read_commit(self._peel_ref(matches[0]))
+                if commit is not None and commit.oid == new_oid:
+                    name = matches[0]
+                    for prefix in ("refs/tags/", "refs/remotes/"):
+                        if name.startswith(prefix):
+                            name = name[len(prefix):]
+                            break
+            return f"(HEAD detached {'at' if head == new_oid else 'from'} {name})"
+        return "(no branch)"
+
+    def remotes(self) -> Optional[List[str]]:
+        if not self.available:
+            return None
+        self._refresh_config()
+        return [sub for (section, sub) in self.config if section == "remote" and sub]
+
+    def reflog(self, limit: int) -> Optional[List[str]]:
+        if not self.available:
+            return None
+        lines = self._head_log()
+        entries = []
+        # Same shape as `git reflog`: "<short oid> HEAD@{n}: <message>"
+        for n, line in enumerate(reversed(lines[-limit:] if limit else [])):
+            info, _, message = line.partition("\t")
+            new_oid = info.split(" ", 2)[1] if " " in info else ""
+            entries.append(f"{new_oid[:7]} HEAD@{{{n}}}: {message}")
+        return entries
+
+    def _head_log(self) -> List[str]:
+        """Raw lines of ``logs/HEAD``, oldest first."""
+        try:
+            with open(os.path.join(self.git_dir, "logs", "HEAD"), "r", encoding="utf-8", errors="replace") as f:
+                return f.read().splitlines()
+        except OSError:
+            return []
+
+    def is_repository(self) -> Optional[bool]:
+        return True if self.git_dir is not None else None
+
+    def is_clean(self) -> Optional[bool]:
+        if not self.available:
+            return None
+        return WorktreeStatus(self).is_clean()
@@ -0,0 +1,203 @@
+"""
+Git Object Parsing Helpers
+
+Small, dependency-free helpers for reading commit and tree objects and
+walking history. They work on raw object bytes, so any backend that can
+hand back ``(type, data)`` for an object name can reuse them.
+"""
+
+import heapq
+from collections import namedtuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+
+Commit = namedtuple("Commit", ["oid", "tree", "parents", "timestamp", "message"])
+TreeEntry = namedtuple("TreeEntry", ["mode", "name", "oid"])
+
+# Mode of a tree entry that is itself a directory
+TREE_MODE = "40000"
+
+
+def parse_commit(oid: str, data: bytes) -> Commit:
+    """
+    Parse the body of a commit object.
+
+    Args:
+        oid: Object id of the commit
+        data: Raw commit object contents (without the loose-object header)
+
+    Returns:
+        Parsed Commit
+    """
+    header, _, message = data.partition(b"\n\n")
+    tree = ""
+    parents = []
+    timestamp = 0
+    for line in header.split(b"\n"):
+        # Continuation lines of multi-line headers (e.g. gpgsig) start with a space
+        if line.startswith(b" "):
+            continue
+        key, _, value = line.partition(b" ")
+        if key == b"tree":
+            tree = value.decode("ascii")
+        elif key == b"parent":
+            parents.append(value.decode("ascii"))
+        elif key == b"committer":
+            # "Name <email> 1700000000 +0100"
+            parts = value.rsplit(b" ", 2)
+            try:
+                timestamp = int(parts[-2])
+            except (IndexError, ValueError):
+                timestamp = 0
+    return Commit(
+        oid, tree, tuple(parents), timestamp,
+        message.decode("utf-8", errors="replace"),
+    )
+
+
+def commit_subject(commit: Commit) -> str:
+    """
+    Return the subject of a commit, the same way ``git log --format=%s`` does.
+
+    The subject is the first paragraph of the message with its lines
+    joined by single spaces.
+    """
+    paragraph = commit.message.strip("\n").split("\n\n", 1)[0]
+    return " ".join(line.strip() for line in paragraph.split("\n") if line.strip())
+
+
+def parse_tree(data: bytes, hash_size: int = 20) -> List[TreeEntry]:
+    """
+    Parse the body of a tree object.
+
+    Args:
+        data: Raw tree object contents
+        hash_size: Length in bytes of a binary object id (20 for SHA-1)
+
+    Returns:
+        List of tree entries in stored order
+    """
+    entries = []
+    pos = 0
+    end = len(data)
+    while pos < end:
+        space = data.index(b" ", pos)
+        nul = data.index(b"\0", space)
+        mode = data[pos:space].decode("ascii")
+        name = data[space + 1:nul].decode("utf-8", errors="surrogateescape")
+        oid = data[nul + 1:nul + 1 + hash_size].hex()
+        entries.append(TreeEntry(mode, name, oid))
+        pos = nul + 1 + hash_size
+    return entries
+
+
+def walk_commits(
+    read_commit: Callable[[str], Optional[Commit]],
+    start: List[str],
+    limit: Optional[int] = None,
+    stop: Optional[Set[str]] = None,
+) -> Iterator[Commit]:
+    """
+    Yield commits reachable from ``start``, newest first.
+
+    This mirrors the default ``git log`` order: commits are emitted by
+    committer date, visiting each one once.
+
+    Args:
+        read_commit: Function that loads a commit by oid (None if missing)
+        start: Commit oids to start from
+        limit: Stop after this many commits (None walks everything)
+        stop: Commits that are neither yielded nor walked past
+    """
+    seen: Set[str] = set(stop or ())
+    heap: List[Tuple[int, int, Commit]] = []
+    counter = 0
+
+    def push(oid: str) -> None:
+        nonlocal counter
+        if oid in seen:
+            return
+        seen.add(oid)
+        commit = read_commit(oid)
+        if commit is not None:
+            heapq.heappush(heap, (-commit.timestamp, counter, commit))
+            counter += 1
+
+    for oid in start:
+        push(oid)
+
+    emitted = 0
+    while heap and (limit is None or emitted < limit):
+        _, _, commit = heapq.heappop(heap)
+        yield commit
+        emitted += 1
+        for parent in commit.parents:
+            push(parent)
+
+
+def tree_lookup(
+    read_tree: Callable[[str], Optional[List[TreeEntry]]],
+    tree_oid: str,
+    path: str,
+) -> Optional[str]:
+    """
+    Find the object id stored at ``path`` inside a tree.
+
+    Args:
+        read_tree: Function that loads a tree by oid
+        tree_oid: Root tree to search
+        path: Slash-separated path relative to the repository root
+
+    Returns:
+        The entry's oid, or None if the path does not exist
+    """
+    oid = tree_oid
+    for part in [p for p in path.strip("/").split("/") if p]:
+        entries = read_tree(oid)
+        if entries is None:
+            return None
+        for entry in entries:
+            if entry.name == part:
+                oid = entry.oid
+                break
+        else:
+            return None
+    return oid
+
+
+def changed_paths(
+    read_tree: Callable[[str], Optional[List[TreeEntry]]],
+    old_tree: Optional[str],
+    new_tree: Optional[str],
+    prefix: str = "",
+) -> Set[str]:
+    """
+    Return the file paths that differ between two trees.
+
+    Either side may be None to mean "empty tree".
+    """
+    if old_tree == new_tree:
+        return set()
+
+    def entries_of(oid: Optional[str]) -> Dict[str, TreeEntry]:
+        if oid is None:
+            return {}
+        return {e.name: e for e in (read_tree(oid) or [])}
+
+    old_entries = entries_of(old_tree)
+    new_entries = entries_of(new_tree)
+    changed: Set[str] = set()
+    for name in set(old_entries) | set(new_entries):
+        old = old_entries.get(name)
+        new = new_entries.get(name)
+        if old is not None and new is not None and old.oid == new.oid and old.mode == new.mode:
+            continue
+        path = prefix + name
+        old_sub = old.oid if old is not None and old.mode == TREE_MODE else None
+        new_sub = new.oid if new is not None and new.mode == TREE_MODE else None
+        if old_sub or new_sub:
+            changed |= changed_paths(read_tree, old_sub, new_sub, path + "/")
+        # A blob on either side (including a blob replaced by a directory)
+        if (old is not None and old.mode != TREE_MODE) or (new is not None and new.mode != TREE_MODE):
+            changed.add(path)
+    return changed
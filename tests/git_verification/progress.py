@@ -0,0 +1,190 @@
+"""
+Commit Index for Exercise Progress
+
+Instead of running ``git log`` twice per exercise, CommitIndex reads the
+history once (``git log --name-only``, or the backend in-process) and maps
+exercise numbers and touched paths to commits, so each progress question
+is a dictionary lookup.
+
+With ``persist=True`` the index is saved in the repository's git
+directory and updated incrementally: later runs only read the commits
+added since the last indexed HEAD. If HEAD moved somewhere else (reset,
+rebase), it is rebuilt. By default nothing is written, so checking a
+student's repository never leaves files behind in it.
+
+Usage:
+    index = CommitIndex.load()
+    committed = index.exercises_committed(range(1, 16))
+"""
+
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .backend import Backend
+from .native import find_git_dir
+from .objects import changed_paths, commit_subject, walk_commits
+from .state import FIELD_SEP, RECORD_SEP, run_batch
+
+INDEX_FILE = "verifier-commit-index.json"
+INDEX_VERSION = 1
+
+# "Exercise 3", "exercise-3", "exercise_3" (not "exercise 30" for 3)
+EXERCISE_PATTERN = re.compile(r"exercise[\s_-]*(\d+)(?!\d)", re.IGNORECASE)
+
+
+def exercise_path(number: int) -> str:
+    """Path of a solo exercise file, relative to the repository root."""
+    return f"exercises/solo/exercise_{number}.py"
+
+
+class CommitIndex:
+    """Maps exercise numbers and paths to the commits that mention/touch them."""
+
+    def __init__(self, repo_path: Optional[str] = None, backend: Optional[Backend] = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+            backend: Optional backend to read history in-process instead of git
+        """
+        self.repo_path = repo_path or os.getcwd()
+        self.backend = backend
+        self.tip: Optional[str] = None
+        self.commits: Dict[str, Tuple[str, List[str]]] = {}
+        self.by_exercise: Dict[int, Set[str]] = {}
+        self.by_path: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        repo_path: Optional[str] = None,
+        backend: Optional[Backend] = None,
+        persist: bool = False,
+    ) -> "CommitIndex":
+        """
+        Load the saved index (if any) and bring it up to date with HEAD.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+            backend: Optional backend to read history in-process instead of git
+            persist: Save the updated index back to the git directory
+                (off by default; only for repositories you own)
+        """
+        index = cls(repo_path, backend)
+        saved = index._index_file()
+        if saved and os.path.isfile(saved):
+            try:
+                with open(saved, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION:
+                    index.tip = data["tip"]
+                    for oid, (subject, files) in data["commits"].items():
+                        index._add(oid, subject, files)
+            except (OSError, ValueError, KeyError, TypeError):
+                index = cls(repo_path, backend)
+        if index.update() and persist:
+            index.save()
+        return index
+
+    def _index_file(self) -> Optional[str]:
+        found = find_git_dir(self.repo_path)
+        return os.path.join(found[1], INDEX_FILE) if found else None
+
+    def _add(self, oid: str, subject: str, files: List[str]) -> None:
+        self.commits[oid] = (subject, files)
+        for match in EXERCISE_PATTERN.finditer(subject):
+            self.by_exercise.setdefault(int(match.group(1)), set()).add(oid)
+        for path in files:
+            self.by_path.setdefault(path, set()).add(oid)
+
+    def _read_new(self, head: str) -> Optional[List[Tuple[str, Tuple[str, ...], str, List[str]]]]:
+        """Commits reachable from ``head`` that aren't indexed yet."""
+        if self.backend is not None:
+            new = []
+            for commit in walk_commits(self.backend.read_commit, [head], stop=set(self.commits)):
+                if len(commit.parents) > 1:
+                    files: Set[str] = set()
+                else:
+                    parent = self.backend.read_commit(commit.parents[0]) if commit.parents else None
+                    files = changed_paths(self.backend.read_tree, parent.tree if parent else None, commit.tree)
+                new.append((commit.oid, commit.parents, commit_subject(commit), sorted(files)))
+            return new
+
+        args = ["log", "--name-only", f"--format={RECORD_SEP}%H %P{FIELD_SEP}%s", head]
+        if self.tip and self.tip in self.commits:
+            args.append(f"^{self.tip}")
+        output = run_batch(self.repo_path, {"log": args})["log"]
+        if output is None:
+            return None
+        new = []
+        for record in output.split(RECORD_SEP)[1:]:
+            header, _, names = record.partition("\n")
+            ids, _, subject = header.partition(FIELD_SEP)
+            oid, *parents = ids.split()
+            new.append((oid, tuple(parents), subject, [n for n in names.split("\n") if n]))
+        return new
+
+    def _head(self) -> Optional[str]:
+        if self.backend is not None:
+            return self.backend.resolve("HEAD")
+        output = run_batch(self.repo_path, {"head": ["rev-parse", "--verify", "-q", "HEAD"]})["head"]
+        return output.strip() if output else None
+
+    def update(self) -> bool:
+        """
+        Index the commits added since the last update.
+
+        Returns:
+            True if the index changed
+        """
+        head = self._head()
+        if head is None or head == self.tip:
+            return False
+
+        new = self._read_new(head)
+        if new is None:
+            return False
+        # Incremental only if the old tip is an ancestor of HEAD, i.e. one of
+        # the new commits has it as a parent. Otherwise history was rewritten.
+        if self.tip is not None and not any(self.tip in parents for _, parents, _, _ in new):
+            self.tip = None
+            self.commits, self.by_exercise, self.by_path = {}, {}, {}
+            new = self._read_new(head) or []
+
+        for oid, _, subject, files in new:
+            self._add(oid, subject, files)
+        self.tip = head
+        return True
+
+    def save(self) -> None:
+        """Write the index to the repository's git directory."""
+        path = self._index_file()
+        if path is None:
+            return
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "tip": self.tip,
+                "commits": {oid: [subject, files] for oid, (subject, files) in self.commits.items()},
+            }, f)
+        os.replace(tmp, path)
+
+    def commits_for_exercise(self, number: int) -> Set[str]:
+        """Commits whose subject mentions the exercise or that touch its file."""
+        return self.by_exercise.get(number, set()) | self.by_path.get(exercise_path(number), set())
+
+    def exercise_committed(self, number: int) -> bool:
+        """Check if an exercise appears to be committed."""
+        return number in self.by_exercise or exercise_path(number) in self.by_path
+
+    def exercises_committed(self, numbers: Iterable[int]) -> List[int]:
+        """Return the exercise numbers from ``numbers`` that have commits."""
+        return [n for n in numbers if self.exercise_committed(n)]
+
+    def has_commit_with_file(self, filepath: str) -> bool:
+        """Check if any indexed commit touched the given file."""
+        return filepath in self.by_path
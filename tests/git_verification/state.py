@@ -0,0 +1,275 @@
+"""
+Repository Snapshots
+
+A RepoState collects the history-related facts the verifier checks look
+at (refs, tags, the recent log, the reflog and remotes) in one batched
+pass. Snapshots are memoized per repository and keyed by (repo path,
+HEAD oid, index mtime, config, refs), so every GitVerifier created during
+a test run shares the same one until a commit, checkout, branch, tag or
+remote changes the key.
+
+The working tree is not part of the key, so whether it is clean is not
+snapshotted; GitVerifier.is_clean() always asks the backend or git.
+"""
+
+import os
+import subprocess
+import threading
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+from .backend import Backend
+from .limits import get_git_process_limit, git_slot
+from .native import NativeBackend
+from .objects import changed_paths, commit_subject, walk_commits
+
+
+LogEntry = namedtuple("LogEntry", ["oid", "parents", "subject", "files"])
+
+# How many commits and reflog entries a snapshot keeps
+SNAPSHOT_DEPTH = 50
+
+# Separators for the batched `git log` output
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+
+
+def run_batch(repo_path: str, commands: Dict[str, List[str]], timeout: int = 10) -> Dict[str, Optional[str]]:
+    """
+    Run several git commands at once and collect their output.
+
+    All processes are started before any is waited on, so the batch
+    takes about as long as its slowest command. When a git process limit
+    is installed (see ``limits.py``) the commands run one at a time, each
+    holding a slot.
+
+    Returns:
+        ``{name: stdout}``; a command that failed maps to None
+    """
+    if get_git_process_limit() is not None:
+        results = {}
+        for name, args in commands.items():
+            with git_slot():
+                results.update(_run_concurrently(repo_path, {name: args}, timeout))
+        return results
+    return _run_concurrently(repo_path, commands, timeout)
+
+
+def _run_concurrently(repo_path: str, commands: Dict[str, List[str]], timeout: int) -> Dict[str, Optional[str]]:
+    procs = {}
+    for name, args in commands.items():
+        try:
+            procs[name] = subprocess.Popen(
+                ["git", *args],
+                cwd=repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                errors="replace",
+            )
+        except OSError:
+            procs[name] = None
+
+    results: Dict[str, Optional[str]] = {}
+    for name, proc in procs.items():
+        if proc is None:
+            results[name] = None
+            continue
+        try:
+            out, _ = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            results[name] = None
+            continue
+        results[name] = out if proc.returncode == 0 else None
+    return results
+
+
+def state_key(repo_path: str) -> Optional[Tuple]:
+    """
+    Cheap fingerprint of a repository: HEAD, the index mtime, the config
+    and all refs.
+
+    Read straight from ``.git`` when possible; otherwise one batch of
+    ``git show-ref --head`` and ``git remote``.
+    """
+    native = NativeBackend.for_repo(repo_path)
+    if native.available:
+        index_path = os.path.join(native.git_dir, "index")
+        try:
+            index_mtime = os.stat(index_path).st_mtime_ns
+        except OSError:
+            index_mtime = 0
+        refs = native.list_refs("refs/") or {}
+        return (
+            os.path.realpath(repo_path),
+            native.read_ref("HEAD"),
+            native.resolve("HEAD"),
+            index_mtime,
+            native.config_stat(),
+            tuple(refs.items()),
+        )
+
+    out = run_batch(repo_path, {"refs": ["show-ref", "--head"], "remotes": ["remote"]})
+    if out["refs"] is None:
+        return None
+    return (os.path.realpath(repo_path), out["refs"], out["remotes"])
+
+
+class RepoState:
+    """An immutable snapshot of the facts GitVerifier checks."""
+
+    _cache: Dict[str, Tuple[Tuple, "RepoState"]] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        head: Optional[str],
+        current_branch: str,
+        refs: Dict[str, str],
+        log: List[LogEntry],
+        commit_count: int,
+        reflog: List[str],
+        remotes: List[str],
+        detached: Optional[str] = None,
+    ):
+        self.head = head
+        self.current_branch = current_branch
+        self.refs = refs
+        self.log = log
+        self.commit_count = commit_count
+        self.reflog = reflog
+        self.remotes = remotes
+        # `git branch`'s "(HEAD detached at ...)" entry, if known
+        self.detached = detached
+
+    @property
+    def log_complete(self) -> bool:
+        """True when ``log`` holds every commit reachable from HEAD."""
+        return len(self.log) >= self.commit_count
+
+    @classmethod
+    def load(cls, repo_path: Optional[str] = None, backend: Optional[Backend] = None) -> Optional["RepoState"]:
+        """
+        Return the snapshot for a repository, building it if the key changed.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+            backend: Backend to read from; used only if it can list refs,
+                otherwise the snapshot is taken with a batch of git commands
+
+        Returns:
+            The snapshot, or None if the path isn't a usable repository
+        """
+        repo_path = repo_path or os.getcwd()
+        key = state_key(repo_path)
+        if key is None:
+            return None
+        path = key[0]
+        with cls._cache_lock:
+            cached = cls._cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if backend is not None and backend.list_refs("refs/") is not None:
+            state = cls.capture_backend(backend)
+        else:
+            state = cls.capture_git(repo_path)
+        if state is not None:
+            with cls._cache_lock:
+                cls._cache[path] = (key, state)
+        return state
+
+    @classmethod
+    def invalidate(cls, repo_path: Optional[str] = None) -> None:
+        """Drop cached snapshots (for one repository, or all of them)."""
+        with cls._cache_lock:
+            if repo_path is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(os.path.realpath(repo_path), None)
+
+    @classmethod
+    def capture_git(cls, repo_path: str) -> Optional["RepoState"]:
+        """Take a snapshot with one batch of concurrent git commands."""
+        out = run_batch(repo_path, {
+            "head": ["rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
+            "refs": ["for-each-ref", "--format=%(objectname) %(refname) %(symref)"],
+            "log": [
+                "log", f"-{SNAPSHOT_DEPTH}", "--name-only",
+                f"--format={RECORD_SEP}%H %P{FIELD_SEP}%s",
+            ],
+            "count": ["rev-list", "--count", "HEAD"],
+            "reflog": ["reflog", f"-{SNAPSHOT_DEPTH}"],
+            "remotes": ["remote"],
+            "points_at": ["branch", "--points-at", "HEAD", "--format=%(refname)"],
+        })
+        if out["head"] is None or out["refs"] is None:
+            return None
+
+        head_lines = out["head"].split("\n")
+        refs = {}
+        for line in out["refs"].splitlines():
+            oid, _, rest = line.partition(" ")
+            refname, _, symref = rest.partition(" ")
+            refs[refname] = f"ref: {symref}" if symref else oid
+
+        log = []
+        for record in (out["log"] or "").split(RECORD_SEP)[1:]:
+            header, _, files = record.partition("\n")
+            ids, _, subject = header.partition(FIELD_SEP)
+            oid, *parents = ids.split()
+            log.append(LogEntry(oid, tuple(parents), subject, frozenset(f for f in files.split("\n") if f)))
+
+        try:
+            count = int(out["count"] or 0)
+        except ValueError:
+            count = 0
+
+        return cls(
+            head=head_lines[0] if head_lines else None,
+            current_branch=head_lines[1] if len(head_lines) > 1 else "",
+            refs=refs,
+            log=log,
+            commit_count=count,
+            reflog=(out["reflog"] or "").splitlines(),
+            remotes=(out["remotes"] or "").split(),
+            detached=next((line for line in (out["points_at"] or "").splitlines() if line.startswith("(")), None),
+        )
+
+    @classmethod
+    def capture_backend(cls, backend: Backend) -> Optional["RepoState"]:
+        """Take a snapshot from a backend that can read everything in-process."""
+        refs = backend.list_refs("refs/")
+        current = backend.current_branch()
+        reflog = backend.reflog(SNAPSHOT_DEPTH)
+        remotes = backend.remotes()
+        head = backend.resolve("HEAD")
+        if None in (refs, current, reflog, remotes, head):
+            return None
+
+        log = []
+        count = 0
+        for commit in walk_commits(backend.read_commit, [head]):
+            count += 1
+            if len(log) >= SNAPSHOT_DEPTH:
+                continue
+            if len(commit.parents) > 1:
+                # `git log --name-only` prints no files for merges
+                files = frozenset()
+            else:
+                parent = backend.read_commit(commit.parents[0]) if commit.parents else None
+                files = frozenset(changed_paths(backend.read_tree, parent.tree if parent else None, commit.tree))
+            log.append(LogEntry(commit.oid, commit.parents, commit_subject(commit), files))
+
+        return cls(
+            head=head,
+            current_branch=current,
+            refs=refs,
+            log=log,
+            commit_count=count,
+            reflog=reflog,
+            remotes=remotes,
+            detached=backend.detached_head() if current == "HEAD" else None,
+        )
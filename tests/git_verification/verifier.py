@@ -0,0 +1,501 @@
+"""
+GitVerifier - checks that git operations were actually performed.
+
+Checks read from a shared RepoState snapshot (see ``state.py``) that is
+taken once per repository state. Queries that reach past the snapshot
+use the backend if one is given (see ``backend.py``), and run a short
+``git`` command otherwise.
+"""
+
+import fnmatch
+import subprocess
+import os
+from typing import Dict, Iterator, List, Optional, Set
+
+from .backend import Backend
+from .limits import git_slot
+from .objects import Commit, changed_paths, commit_subject, tree_lookup, walk_commits
+from .state import SNAPSHOT_DEPTH, RepoState
+
+
+def parse_branch_listing(output: str, include_remote: bool) -> List[str]:
+    """Turn `git branch` / `git branch -a` output into branch names."""
+    branches = []
+    for line in output.split('\n'):
+        line = line.strip().lstrip('* ')
+        if line and not line.startswith('remotes/'):
+            branches.append(line)
+        elif line.startswith('remotes/') and include_remote:
+            branches.append(line.replace('remotes/', ''))
+
+    return branches
+
+
+class GitVerifier:
+    """Utility class for verifying git operations."""
+
+    def __init__(
+        self,
+        repo_path: Optional[str] = None,
+        backend: Optional[Backend] = None,
+        use_snapshot: bool = True,
+    ):
+        """
+        Initialize the GitVerifier.
+
+        Args:
+            repo_path: Path to the git repository. Defaults to current directory.
+            backend: Optional backend used for object and ref lookups
+                (e.g. CatFileBackend). Checks it can't answer still run git.
+            use_snapshot: Answer checks from the shared RepoState snapshot
+        """
+        self.repo_path = repo_path or os.getcwd()
+        self.backend = backend
+        self.use_snapshot = use_snapshot
+
+    def __enter__(self) -> "GitVerifier":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the backend, if any."""
+        if self.backend is not None:
+            self.backend.close()
+
+    def _run_git(self, *args) -> str:
+        """Run a git command and return output."""
+        try:
+            with git_slot():
+                result = subprocess.run(
+                    ["git", *args],
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+            return result.stdout.strip()
+        except subprocess.TimeoutExpired:
+            return ""
+        except Exception:
+            return ""
+
+    def state(self) -> Optional[RepoState]:
+        """
+        Get the current snapshot of the repository.
+
+        Returns:
+            The shared RepoState, or None if snapshots are disabled or the
+            repository can't be read
+        """
+        if not self.use_snapshot:
+            return None
+        return RepoState.load(self.repo_path, self.backend)
+
+    def _head_commits(self, limit: Optional[int] = None) -> Optional[Iterator[Commit]]:
+        """Walk history from HEAD through the backend (None if unavailable)."""
+        if self.backend is None:
+            return None
+        head = self.backend.resolve("HEAD")
+        if head is None:
+            return None
+        return walk_commits(self.backend.read_commit, [head], limit)
+
+    def _refs(self) -> Optional[Dict[str, str]]:
+        """All refs from the snapshot or the backend (None if unavailable)."""
+        state = self.state()
+        if state is not None:
+            return state.refs
+        if self.backend is not None:
+            return self.backend.list_refs("refs/")
+        return None
+
+    def _ref_names(self, prefix: str) -> Optional[List[str]]:
+        """Short names of the refs under ``prefix`` (None if unavailable)."""
+        refs = self._refs()
+        if refs is None:
+            return None
+        return [name[len(prefix):] for name in refs if name.startswith(prefix)]
+
+    def _detached_head(self) -> Optional[str]:
+        """The detached HEAD entry `git branch` lists (None if unavailable)."""
+        state = self.state()
+        if state is not None:
+            return state.detached
+        if self.backend is not None:
+            return self.backend.detached_head()
+        return None
+
+    def _branch_listing(self, include_remote: bool) -> str:
+        """Output in the same shape as `git branch` / `git branch -a`."""
+        refs = self._refs()
+        current = self.get_current_branch() if refs is not None else None
+        detached = self._detached_head() if current == "HEAD" else None
+        if refs is None or (current == "HEAD" and detached is None):
+            if include_remote:
+                return self._run_git("branch", "-a")
+            return self._run_git("branch")
+
+        lines = ["* " + detached] if detached else []
+        for name, value in refs.items():
+            if name.startswith("refs/heads/"):
+                short = name[len("refs/heads/"):]
+                lines.append(("* " if short == current else "  ") + short)
+        if include_remote:
+            for name, value in refs.items():
+                if name.startswith("refs/remotes/"):
+                    line = "  remotes/" + name[len("refs/remotes/"):]
+                    if value.startswith("ref: refs/remotes/"):
+                        line += " -> " + value[len("ref: refs/remotes/"):]
+                    lines.append(line)
+        return "\n".join(lines)
+
+    def is_repository(self) -> bool:
+        """
+        Check if the path is inside a git repository.
+
+        Returns:
+            True if git recognizes the directory as a repository
+        """
+        if self.state() is not None:
+            return True
+        if self.backend is not None:
+            found = self.backend.is_repository()
+            if found is not None:
+                return found
+        return self._run_git("rev-parse", "--git-dir") != ""
+
+    def has_commit_message(self, message_substring: str, limit: int = 50) -> bool:
+        """
+        Check if any recent commit message contains the given substring.
+
+        Args:
+            message_substring: Text to search for in commit messages
+            limit: Number of recent commits to check
+
+        Returns:
+            True if a matching commit is found
+        """
+        state = self.state()
+        if state is not None and (limit <= len(state.log) or state.log_complete):
+            needle = message_substring.lower()
+            return any(needle in entry.subject.lower() for entry in state.log[:limit])
+
+        commits = self._head_commits(limit)
+        if commits is not None:
+            needle = message_substring.lower()
+            return any(needle in commit_subject(c).lower() for c in commits)
+
+        output = self._run_git("log", f"-{limit}", "--oneline")
+        return message_substring.lower() in output.lower()
+
+    def has_commit_with_file(self, filepath: str, limit: int = 50) -> bool:
+        """
+        Check if any recent commit modified the given file.
+
+        Args:
+            filepath: Path to the file (relative to repo root)
+            limit: Number of recent commits to check
+
+        Returns:
+            True if a commit touching this file is found
+        """
+        state = self.state()
+        if state is not None:
+            prefix = filepath.strip("/") + "/"
+            for entry in state.log:
+                if filepath in entry.files or any(f.startswith(prefix) for f in entry.files):
+                    return True
+            if state.log_complete:
+                return False
+
+        if self.backend is not None:
+            head = self.backend.resolve("HEAD")
+            if head is not None:
+                read_tree = self.backend.read_tree
+                for commit in walk_commits(self.backend.read_commit, [head]):
+                    entry = tree_lookup(read_tree, commit.tree, filepath)
+                    if entry is None:
+                        continue
+                    parents = [self.backend.read_commit(p) for p in commit.parents]
+                    # Like `git log -- <path>`: the path differs from every parent
+                    if all(
+                        p is None or tree_lookup(read_tree, p.tree, filepath) != entry
+                        for p in parents
+                    ):
+                        return True
+                return False
+
+        output = self._run_git("log", f"-{limit}", "--oneline", "--", filepath)
+        return bool(output)
+
+    def branch_exists(self, branch_name: str, include_remote: bool = True) -> bool:
+        """
+        Check if a branch exists.
+
+        Args:
+            branch_name: Name of the branch
+            include_remote: Also check remote branches
+
+        Returns:
+            True if branch exists
+        """
+        # Check local branches
+        local_names = self._ref_names("refs/heads/")
+        if local_names is not None:
+            local = [n for n in local_names if fnmatch.fnmatchcase(n, branch_name)]
+        else:
+            local = self._run_git("branch", "--list", branch_name)
+        if local:
+            return True
+
+        if include_remote:
+            remote_names = self._ref_names("refs/remotes/")
+            if remote_names is not None:
+                remote = [n for n in remote_names if fnmatch.fnmatchcase(n, f"*/{branch_name}")]
+            else:
+                remote = self._run_git("branch", "-r", "--list", f"*/{branch_name}")
+            if remote:
+                return True
+
+        return False
+
+    def get_branches(self, include_remote: bool = False) -> List[str]:
+        """
+        Get list of all branches.
+
+        Args:
+            include_remote: Include remote branches
+
+        Returns:
+            List of branch names
+        """
+        return parse_branch_listing(self._branch_listing(include_remote), include_remote)
+
+    def commit_count(self, branch: str = "HEAD") -> int:
+        """
+        Get the number of commits in a branch.
+
+        Args:
+            branch: Branch name or ref
+
+        Returns:
+            Number of commits
+        """
+        state = self.state()
+        if state is not None and branch == "HEAD":
+            return state.commit_count
+
+        if self.backend is not None:
+            start = self.backend.resolve(branch)
+            if start is not None:
+                return sum(1 for _ in walk_commits(self.backend.read_commit, [start]))
+
+        output = self._run_git("rev-list", "--count", branch)
+        try:
+            return int(output)
+        except ValueError:
+            return 0
+
+    def tag_exists(self, tag_name: str) -> bool:
+        """
+        Check if a tag exists.
+
+        Args:
+            tag_name: Name of the tag
+
+        Returns:
+            True if tag exists
+        """
+        tags = self._ref_names("refs/tags/")
+        if tags is not None:
+            return any(fnmatch.fnmatchcase(t, tag_name) for t in tags)
+        if self.backend is not None and not set("*?[") & set(tag_name):
+            return self.backend.resolve(f"refs/tags/{tag_name}") is not None
+
+        output = self._run_git("tag", "-l", tag_name)
+        return bool(output)
+
+    def get_tags(self) -> List[str]:
+        """
+        Get list of all tags.
+
+        Returns:
+            List of tag names
+        """
+        tags = self._ref_names("refs/tags/")
+        if tags is not None:
+            return tags
+
+        output = self._run_git("tag", "-l")
+        return [t.strip() for t in output.split('\n') if t.strip()]
+
+    def has_merge_commit(self, limit: int = 20) -> bool:
+        """
+        Check if there are any merge commits in recent history.
+
+        Args:
+            limit: Number of recent commits to check
+
+        Returns:
+            True if a merge commit is found
+        """
+        state = self.state()
+        if state is not None:
+            if any(len(entry.parents) > 1 for entry in state.log):
+                return True
+            if state.log_complete:
+                return False
+
+        commits = self._head_commits()
+        if commits is not None:
+            # `git log -N --merges` applies the limit after filtering, so any
+            # merge reachable from HEAD counts
+            return any(len(c.parents) > 1 for c in commits)
+
+        output = self._run_git("log", f"-{limit}", "--merges", "--oneline")
+        return bool(output)
+
+    def file_was_modified_in_commit(self, filepath: str, commit: str = "HEAD") -> bool:
+        """
+        Check if a file was modified in a specific commit.
+
+        Args:
+            filepath: Path to the file
+            commit: Commit reference
+
+        Returns:
+            True if file was modified in that commit
+        """
+        state = self.state()
+        if state is not None and commit == "HEAD" and state.log and len(state.log[0].parents) < 2:
+            return filepath in "\n".join(sorted(state.log[0].files))
+
+        target = self.backend.read_commit(commit) if self.backend is not None else None
+        if target is not None:
+            read_tree = self.backend.read_tree
+            paths: Optional[Set[str]] = None
+            for parent_oid in target.parents or [None]:
+                parent = self.backend.read_commit(parent_oid) if parent_oid else None
+                changed = changed_paths(read_tree, parent.tree if parent else None, target.tree)
+                # Merges list only files that differ from every parent
+                paths = changed if paths is None else paths & changed
+            return filepath in "\n".join(sorted(paths or ()))
+
+        output = self._run_git("show", "--name-only", "--format=", commit)
+        return filepath in output
+
+    def get_current_branch(self) -> str:
+        """
+        Get the name of the current branch.
+
+        Returns:
+            Current branch name
+        """
+        state = self.state()
+        if state is not None:
+            return state.current_branch
+
+        if self.backend is not None:
+            branch = self.backend.current_branch()
+            if branch is not None:
+                return branch
+        return self._run_git("rev-parse", "--abbrev-ref", "HEAD")
+
+    def is_clean(self) -> bool:
+        """
+        Check if the working directory is clean.
+
+        Returns:
+            True if no uncommitted changes
+        """
+        # Not snapshotted: worktree edits don't change the RepoState key
+        if self.backend is not None:
+            clean = self.backend.is_clean()
+            if clean is not None:
+                return clean
+        output = self._run_git("status", "--porcelain")
+        return not bool(output)
+
+    def get_last_commit_message(self) -> str:
+        """
+        Get the message of the last commit.
+
+        Returns:
+            Last commit message
+        """
+        state = self.state()
+        if state is not None and state.log:
+            return state.log[0].subject
+
+        commits = self._head_commits(1)
+        if commits is not None:
+            for commit in commits:
+                return commit_subject(commit)
+
+        return self._run_git("log", "-1", "--format=%s")
+
+    def has_remote(self, remote_name: str = "origin") -> bool:
+        """
+        Check if a remote exists.
+
+        Args:
+            remote_name: Name of the remote
+
+        Returns:
+            True if remote exists
+        """
+        state = self.state()
+        if state is not None:
+            return remote_name in state.remotes
+
+        if self.backend is not None:
+            remotes = self.backend.remotes()
+            if remotes is not None:
+                return remote_name in remotes
+        output = self._run_git("remote")
+        return remote_name in output.split('\n')
+
+    def reflog_contains(self, action_substring: str, limit: int = 50) -> bool:
+        """
+        Check if reflog contains a specific action.
+
+        Args:
+            action_substring: Text to search for in reflog
+            limit: Number of recent entries to check
+
+        Returns:
+            True if found in reflog
+        """
+        state = self.state()
+        if state is not None and (limit <= SNAPSHOT_DEPTH or len(state.reflog) < SNAPSHOT_DEPTH):
+            entries = state.reflog[:limit]
+        elif self.backend is not None:
+            entries = self.backend.reflog(limit)
+        else:
+            entries = None
+        if entries is not None:
+            output = "\n".join(entries)
+        else:
+            output = self._run_git("reflog", f"-{limit}")
+        return action_substring.lower() in output.lower()
+
+
+# Convenience functions for quick checks
+def verify_exercise_committed(exercise_num: int) -> bool:
+    """Check if an exercise has been committed."""
+    verifier = GitVerifier()
+    return verifier.has_commit_message(f"Exercise {exercise_num}")
+
+
+def verify_branch_created(branch_name: str) -> bool:
+    """Check if a branch was created."""
+    verifier = GitVerifier()
+    return verifier.branch_exists(branch_name)
+
+
+def verify_tag_created(tag_name: str) -> bool:
+    """Check if a tag was created."""
+    verifier = GitVerifier()
+    return verifier.tag_exists(tag_name)
@@ -0,0 +1,437 @@
+"""
+Working Tree Status Without Git
+
+Answers "is the working directory clean?" the way ``git status
+--porcelain`` does: the index must match HEAD, every tracked file must
+match the index, and there must be no untracked files that aren't
+ignored by ``.gitignore``, ``.git/info/exclude`` or ``core.excludesFile``.
+Files marked skip-worktree or assume-unchanged are not compared, as in git.
+
+This covers plain student repositories, not all of ``git status``.
+``is_clean()`` returns None, so GitVerifier runs git instead, when the
+repository uses something this module doesn't model:
+
+- split or sparse indexes, and ``git add -N`` entries
+- submodules
+- files whose stat data changed and that contain CR bytes or are covered
+  by gitattributes (line-ending conversion and clean/smudge filters)
+- ``core.ignoreCase`` (case-insensitive file systems)
+- POSIX character classes (``[[:alpha:]]``) in ignore patterns
+"""
+
+import hashlib
+import os
+import re
+import stat
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from .objects import TREE_MODE
+
+# Index entry flags
+FLAG_ASSUME_VALID = 0x8000
+FLAG_EXTENDED = 0x4000
+FLAG_STAGE = 0x3000
+EXT_SKIP_WORKTREE = 0x4000
+EXT_INTENT_TO_ADD = 0x2000
+
+# Index extensions whose entries we can't read as a plain list
+UNSUPPORTED_EXTENSIONS = (b"link", b"sdir")
+
+GITLINK_MODE = 0o160000
+
+
+class IndexEntry:
+    """One path recorded in ``.git/index``."""
+
+    __slots__ = ("path", "mode", "oid", "mtime", "size", "stage", "skip_worktree", "assume_valid")
+
+    def __init__(self, path, mode, oid, mtime, size, stage, skip_worktree, assume_valid=False):
+        self.path = path
+        self.mode = mode
+        self.oid = oid
+        self.mtime = mtime
+        self.size = size
+        self.stage = stage
+        self.skip_worktree = skip_worktree
+        self.assume_valid = assume_valid
+
+
+def read_index(path: str) -> Optional[List[IndexEntry]]:
+    """
+    Parse a version 2, 3 or 4 index file.
+
+    Returns:
+        The index entries, an empty list if there is no index yet, or
+        None if the file can't be understood.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+    except OSError:
+        return None
+    if data[:4] != b"DIRC":
+        return None
+    version, count = struct.unpack(">II", data[4:12])
+    if version not in (2, 3, 4):
+        return None
+
+    entries = []
+    pos = 12
+    previous = b""
+    for _ in range(count):
+        start = pos
+        (_, _, mtime_s, mtime_ns, _, _, mode, _, _, size) = struct.unpack(">10I", data[pos:pos + 40])
+        oid = data[pos + 40:pos + 60].hex()
+        flags = struct.unpack(">H", data[pos + 60:pos + 62])[0]
+        pos += 62
+        extended = 0
+        if flags & FLAG_EXTENDED:
+            extended = struct.unpack(">H", data[pos:pos + 2])[0]
+            pos += 2
+        if version == 4:
+            # Path is stored as "strip N bytes from the previous path" + suffix
+            byte = data[pos]
+            pos += 1
+            strip = byte & 0x7F
+            while byte & 0x80:
+                byte = data[pos]
+                pos += 1
+                strip = ((strip + 1) << 7) | (byte & 0x7F)
+            end = data.index(b"\0", pos)
+            name = previous[:len(previous) - strip] + data[pos:end]
+            pos = end + 1
+        else:
+            end = data.index(b"\0", pos)
+            name = data[pos:end]
+            # Entries are NUL-padded to a multiple of 8 bytes
+            pos = start + ((end - start) // 8 + 1) * 8
+        previous = name
+        if extended & EXT_INTENT_TO_ADD:
+            # `git add -N` files always show up in status
+            return None
+        entries.append(IndexEntry(
+            name.decode("utf-8", errors="surrogateescape"),
+            mode,
+            oid,
+            (mtime_s, mtime_ns),
+            size,
+            (flags & FLAG_STAGE) >> 12,
+            bool(extended & EXT_SKIP_WORKTREE),
+            bool(flags & FLAG_ASSUME_VALID),
+        ))
+
+    # Extensions follow the entries, before the trailing checksum
+    while pos + 8 <= len(data) - 20:
+        signature = data[pos:pos + 4]
+        if signature in UNSUPPORTED_EXTENSIONS:
+            # Split index (entries live in another file) or sparse index
+            return None
+        pos += 8 + struct.unpack(">I", data[pos + 4:pos + 8])[0]
+    return entries
+
+
+def blob_oid(data: bytes) -> str:
+    """Hash file contents the way `git hash-object` does."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression."""
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end < 0:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body[0] == "!":
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """Ordered gitignore patterns; the last matching pattern wins."""
+
+    def __init__(self):
+        self.rules: List[Tuple[re.Pattern, bool, bool]] = []
+        self.unsupported = False
+
+    def add_file(self, path: str, base: str = "") -> None:
+        """
+        Load patterns from an ignore file.
+
+        Args:
+            path: File to read (missing files are skipped)
+            base: Directory the file applies to, relative to the worktree root
+        """
+        try:
+            with open(path, "r", encoding="utf-8", errors="surrogateescape") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            if not line or line.startswith("#"):
+                continue
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            if "[:" in line:
+                # POSIX character classes aren't translated
+                self.unsupported = True
+                continue
+            regex = glob_to_regex(line.lstrip("/"))
+            prefix = re.escape(base + "/") if base else ""
+            if "/" in line:
+                # Patterns with a slash are relative to the ignore file's directory
+                full = prefix + regex
+            else:
+                full = prefix + "(?:.*/)?" + regex
+            self.rules.append((re.compile(full + r"\Z", re.DOTALL), negate, dir_only))
+
+    def copy(self) -> "IgnoreRules":
+        clone = IgnoreRules()
+        clone.rules = list(self.rules)
+        clone.unsupported = self.unsupported
+        return clone
+
+    def ignored(self, path: str, is_dir: bool) -> bool:
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(path):
+                return not negate
+        return False
+
+
+class WorktreeStatus:
+    """Compares HEAD, the index and the working tree of a NativeBackend repo."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.root = backend.worktree
+        core = backend.config.get(("core", ""), {})
+        self.trust_filemode = core.get("filemode", ["true"])[-1].lower() != "false"
+        self.ignore_case = core.get("ignorecase", ["false"])[-1].lower() == "true"
+        self.global_attributes = (
+            core.get("attributesfile", [None])[-1] is not None
+            or os.path.isfile(os.path.join(backend.common_dir, "info", "attributes"))
+        )
+        self.has_attributes = False
+        self.excludes_file = core.get("excludesfile", [None])[-1]
+        if self.excludes_file is None:
+            xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+            self.excludes_file = os.path.join(xdg, "git", "ignore")
+
+    def _head_files(self) -> Optional[Dict[str, Tuple[int, str]]]:
+        """Flatten the HEAD tree into ``{path: (mode, oid)}``."""
+        head = self.backend.resolve("HEAD")
+        if head is None:
+            # Unborn branch: nothing committed yet
+            return {} if self.backend.read_ref("HEAD") else None
+        commit = self.backend.read_commit(head)
+        if commit is None:
+            return None
+        files: Dict[str, Tuple[int, str]] = {}
+        stack = [(commit.tree, "")]
+        while stack:
+            tree_oid, prefix = stack.pop()
+            entries = self.backend.read_tree(tree_oid)
+            if entries is None:
+                return None
+            for entry in entries:
+                if entry.mode == TREE_MODE:
+                    stack.append((entry.oid, prefix + entry.name + "/"))
+                else:
+                    files[prefix + entry.name] = (int(entry.mode, 8), entry.oid)
+        return files
+
+    def _file_matches(self, entry: IndexEntry, index_mtime: float) -> Optional[bool]:
+        full = os.path.join(self.root, *entry.path.split("/"))
+        try:
+            st = os.lstat(full)
+        except OSError:
+            return False
+        if stat.S_ISLNK(st.st_mode) != (stat.S_IFMT(entry.mode) == stat.S_IFLNK):
+            return False
+        if self.trust_filemode and not stat.S_ISLNK(st.st_mode):
+            if bool(st.st_mode & 0o100) != bool(entry.mode & 0o100):
+                return False
+        mtime = (int(st.st_mtime), st.st_mtime_ns % 1_000_000_000)
+        # Unchanged stat data means unchanged content, unless the file was
+        # written in the same second as the index ("racy git")
+        if mtime == entry.mtime and st.st_size == entry.size and entry.mtime[0] < int(index_mtime):
+            return True
+        if stat.S_ISLNK(st.st_mode):
+            data = os.fsencode(os.readlink(full))
+        else:
+            try:
+                with open(full, "rb") as f:
+                    data = f.read()
+            except OSError:
+                return False
+        # Line-ending and filter conversions need git itself
+        if b"\r" in data or self.has_attributes:
+            return None
+        return blob_oid(data) == entry.oid
+
+    def _has_untracked(self, tracked: Dict[str, IndexEntry]) -> Optional[bool]:
+        git_dir = self.backend.git_dir
+        rules = IgnoreRules()
+        rules.add_file(os.path.expanduser(self.excludes_file))
+        rules.add_file(os.path.join(self.backend.common_dir, "info", "exclude"))
+
+        # Directories that contain tracked files are walked; others only
+        # need to contain a single non-ignored file to count as untracked
+        tracked_dirs = set()
+        for path in tracked:
+            parts = path.split("/")[:-1]
+            for i in range(1, len(parts) + 1):
+                tracked_dirs.add("/".join(parts[:i]))
+
+        stack = [("", rules)]
+        while stack:
+            rel_dir, parent_rules = stack.pop()
+            full_dir = os.path.join(self.root, *rel_dir.split("/")) if rel_dir else self.root
+            dir_rules = parent_rules.copy()
+            dir_rules.add_file(os.path.join(full_dir, ".gitignore"), rel_dir)
+            if dir_rules.unsupported:
+                return None
+            try:
+                entries = list(os.scandir(full_dir))
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.name == ".git" or os.path.realpath(entry.path) == os.path.realpath(git_dir):
+                    continue
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if rel in tracked:
+                    continue
+                if is_dir:
+                    # Everything untracked below an ignored directory is ignored too
+                    if dir_rules.ignored(rel, True):
+                        continue
+                    if rel in tracked_dirs:
+                        stack.append((rel, dir_rules))
+                        continue
+                    found = self._dir_has_files(entry.path, rel, dir_rules)
+                    if found is not False:
+                        return found
+                elif not dir_rules.ignored(rel, False):
+                    return True
+        return False
+
+    def _dir_has_files(self, full_dir: str, rel_dir: str, rules: IgnoreRules) -> Optional[bool]:
+        """Whether an untracked directory holds any non-ignored file (None if unsure)."""
+        if os.path.exists(os.path.join(full_dir, ".git")):
+            # Nested repositories are reported as untracked directories
+            return True
+        rules = rules.copy()
+        rules.add_file(os.path.join(full_dir, ".gitignore"), rel_dir)
+        if rules.unsupported:
+            return None
+        try:
+            entries = list(os.scandir(full_dir))
+        except OSError:
+            return False
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}"
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if rules.ignored(rel, is_dir):
+                continue
+            found = self._dir_has_files(entry.path, rel, rules) if is_dir else True
+            if found is not False:
+                return found
+        return False
+
+    def is_clean(self) -> Optional[bool]:
+        """
+        Check whether ``git status --porcelain`` would print nothing.
+
+        Returns:
+            True/False, or None when the answer needs git itself
+        """
+        index_path = os.path.join(self.backend.git_dir, "index")
+        if self.ignore_case:
+            return None
+        entries = read_index(index_path)
+        head_files = self._head_files()
+        if entries is None or head_files is None:
+            return None
+        try:
+            index_mtime = os.stat(index_path).st_mtime
+        except OSError:
+            index_mtime = 0.0
+
+        tracked: Dict[str, IndexEntry] = {}
+        for entry in entries:
+            if entry.stage:
+                # Unmerged paths from a conflict
+                return False
+            if entry.mode == GITLINK_MODE:
+                # Submodule status needs git to look inside the submodule
+                return None
+            tracked[entry.path] = entry
+        self.has_attributes = self.global_attributes or any(
+            path == ".gitattributes" or path.endswith("/.gitattributes") for path in tracked
+        )
+
+        # Staged changes: index vs HEAD
+        if len(tracked) != len(head_files):
+            return False
+        for path, entry in tracked.items():
+            if head_files.get(path) != (entry.mode, entry.oid):
+                return False
+
+        # Unstaged changes: working tree vs index
+        for entry in tracked.values():
+            # git doesn't look at `update-index --assume-unchanged` files either
+            if entry.skip_worktree or entry.assume_valid:
+                continue
+            matches = self._file_matches(entry, index_mtime)
+            if matches is None:
+                return None
+            if not matches:
+                return False
+
+        status = self.backend.config.get(("status", ""), {})
+        if status.get("showuntrackedfiles", ["normal"])[-1].lower() in ("no", "false"):
+            return True
+        untracked = self._has_untracked(tracked)
+        return None if untracked is None else not untracked
@@ -0,0 +1,80 @@
+"""
+Tests for the benchmark runner.
+
+Run with: pytest tests/test_benchmarks.py -v
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks import CASES, Case, compare, measure, run_case
+from benchmarks.__main__ import main
+
+
+def sleepy_case(seconds_per_item):
+    return Case(
+        "sleepy", "time", "sleep",
+        lambda rng, size: (size * seconds_per_item,),
+        lambda func, args: func(*args),
+    )
+
+
+class TestCases:
+    def test_inputs_are_deterministic_and_sized(self):
+        for case in CASES:
+            first = case.make_input(random.Random(100), 100)
+            assert first == case.make_input(random.Random(100), 100), case.name
+            assert isinstance(first, tuple), case.name
+
+    def test_two_sum_input_has_unique_answer_at_the_end(self):
+        case = next(c for c in CASES if c.name == "two_sum")
+        nums, target = case.make_input(random.Random(10), 10)
+        pairs = [(i, j) for i in range(10) for j in range(i + 1, 10) if nums[i] + nums[j] == target]
+        assert pairs == [(8, 9)]
+
+
+class TestRunner:
+    def test_measure_records_throughput_and_memory(self):
+        result = measure(next(c for c in CASES if c.name == "find_max"), 100, min_time=0.01)
+        assert result["calls"] >= 1
+        assert result["ops_per_sec"] > 0
+        assert result["peak_bytes"] >= 0
+
+    def test_errors_are_recorded(self):
+        case = Case("broken", "math", "sqrt", lambda rng, size: (-1,), lambda func, args: func(*args))
+        assert measure(case, 10, min_time=0.01)["error"].startswith("ValueError")
+
+    def test_sizes_over_budget_are_skipped(self):
+        started = time.perf_counter()
+        results = run_case(sleepy_case(0.001), sizes=[10, 100, 1000], min_time=0, budget=0.05)
+        assert [("skipped" in r) for r in results] == [False, True, True]
+        assert time.perf_counter() - started < 1
+
+    def test_compare_flags_regressions(self):
+        def run(ops, peak):
+            return {"results": [{"case": "f", "size": 10, "ops_per_sec": ops, "peak_bytes": peak}]}
+
+        assert compare(run(95, 1000), run(100, 1000)) == []
+        slower = compare(run(50, 1000), run(100, 1000))
+        assert [r["metric"] for r in slower] == ["ops_per_sec"]
+        hungrier = compare(run(100, 100_000), run(100, 1000))
+        assert [r["metric"] for r in hungrier] == ["peak_bytes"]
+
+
+class TestMain:
+    def test_missing_baseline_warns_and_saving_records_one(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        args = ["find_max", "--max-size", "10", "--min-time", "0.01", "--baseline", str(baseline), "-o", str(tmp_path / "run.json")]
+
+        assert main(args) == 0
+        assert "No baseline at" in capsys.readouterr().err
+
+        assert main(args + ["--save-baseline"]) == 0
+        assert baseline.exists()
+        err = capsys.readouterr().err
+        assert "No baseline at" not in err
+        assert "Baseline saved" in err
@@ -0,0 +1,669 @@
+"""
+Tests for the large-input helpers that sit next to the exercise functions.
+
+These are kept out of tests/test_exercises.py so the per-exercise progress
+counts in run_tests.py stay the same.
+
+Run with: pytest tests/test_exercise_extensions.py -v
+"""
+
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "exercises", "solo"))
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "exercises", "collaborative")
+)
+
+
+# =============================================================================
+# Exercise 1: Reverse String
+# =============================================================================
+class TestReverseStream:
+    """Tests for reverse_stream and grapheme-aware reversal."""
+
+    TEXT = "héllo wörld ✓ 日本語 👍🏽 é 🇸🇪🇫🇮 👨‍👩‍👧 end\r\n" * 7
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64, 1 << 16])
+    def test_matches_reverse_string(self, chunk_size):
+        from exercise_1 import reverse_stream
+
+        reader = io.BytesIO(self.TEXT.encode("utf-8"))
+        assert "".join(reverse_stream(reader, chunk_size)) == self.TEXT[::-1]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64, 1 << 16])
+    def test_graphemes_across_blocks(self, chunk_size):
+        from exercise_1 import reverse_stream, reverse_string
+
+        reader = io.BytesIO(self.TEXT.encode("utf-8"))
+        expected = reverse_string(self.TEXT, graphemes=True)
+        assert "".join(reverse_stream(reader, chunk_size, graphemes=True)) == expected
+
+    def test_flags_at_file_start(self):
+        from exercise_1 import reverse_stream, reverse_string
+
+        text = "🇪🏽🇸️a👍a\u200d"
+        reader = io.BytesIO(text.encode("utf-8"))
+        assert "".join(reverse_stream(reader, 8, graphemes=True)) == reverse_string(text, graphemes=True)
+
+    def test_grapheme_reversal(self):
+        from exercise_1 import reverse_string
+
+        assert reverse_string("née", graphemes=True) == "eén"
+        assert reverse_string("a👍🏽b", graphemes=True) == "b👍🏽a"
+        assert reverse_string("🇸🇪🇫🇮", graphemes=True) == "🇫🇮🇸🇪"
+        assert reverse_string("x👨‍👩‍👧", graphemes=True) == "👨‍👩‍👧x"
+        assert reverse_string("a\r\nb", graphemes=True) == "b\r\na"
+
+    def test_hangul_jamo_stay_together(self):
+        from exercise_1 import grapheme_clusters
+
+        # "각" decomposed into L + V + T jamo
+        assert grapheme_clusters("각x") == ["각", "x"]
+        assert grapheme_clusters("각각") == ["각", "각"]
+        assert grapheme_clusters("ᆨᄀ") == ["ᆨ", "ᄀ"]
+
+    def test_zwj_only_joins_emoji(self):
+        from exercise_1 import grapheme_clusters
+
+        assert grapheme_clusters("a‍b") == ["a‍", "b"]
+        assert grapheme_clusters("a‍👩") == ["a‍", "👩"]
+        assert grapheme_clusters("👩‍b") == ["👩‍", "b"]
+        assert grapheme_clusters("👍🏽‍❤️x") == ["👍🏽‍❤️", "x"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 6])
+    def test_zwj_sequence_across_blocks(self, chunk_size):
+        from exercise_1 import reverse_stream, reverse_string
+
+        text = "x👩́‍👧a‍👧y"
+        reader = io.BytesIO(text.encode("utf-8"))
+        expected = reverse_string(text, graphemes=True)
+        assert expected == "y👧a‍👩́‍👧x"
+        assert "".join(reverse_stream(reader, chunk_size, graphemes=True)) == expected
+
+    @pytest.mark.parametrize("text", [
+        "x" + "🇸🇪" * 500 + "🇫y",
+        "🇸" * 1001,
+        "n" + "́" * 2000 + "e",
+        "👩" + "́" * 500 + "‍👧" * 3 + "́" * 500,
+    ], ids=["flag-pairs", "odd-flag-run", "accents", "zwj-sequence"])
+    def test_long_runs_across_many_blocks(self, text):
+        from exercise_1 import reverse_stream, reverse_string
+
+        reader = io.BytesIO(text.encode("utf-8"))
+        pieces = list(reverse_stream(reader, 64, graphemes=True))
+        assert "".join(pieces) == reverse_string(text, graphemes=True)
+        # A cluster longer than a block is streamed, not held in memory
+        assert max(len(piece) for piece in pieces) <= 64
+
+    def test_text_mode_file(self, tmp_path):
+        from exercise_1 import reverse_stream
+
+        path = tmp_path / "log.txt"
+        path.write_text("line one\nline two\n", encoding="utf-8")
+        with open(path, "r", encoding="utf-8") as f:
+            assert "".join(reverse_stream(f, 4)) == "\nowt enil\neno enil"
+
+    def test_empty(self):
+        from exercise_1 import reverse_stream
+
+        assert list(reverse_stream(io.BytesIO(b""))) == []
+
+
+class TestReverseFile:
+    """Tests for reverse_file."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 5, 7, 1 << 20])
+    def test_multibyte_across_blocks(self, tmp_path, chunk_size):
+        from exercise_1 import reverse_file
+
+        text = "aé✓日本😀z" * 50
+        src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+        src.write_bytes(text.encode("utf-8"))
+
+        written = reverse_file(str(src), str(dst), chunk_size)
+        assert dst.read_bytes().decode("utf-8") == text[::-1]
+        assert written == src.stat().st_size
+
+    def test_empty_file(self, tmp_path):
+        from exercise_1 import reverse_file
+
+        src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+        src.write_bytes(b"")
+        assert reverse_file(str(src), str(dst)) == 0
+        assert dst.read_bytes() == b""
+
+
+# =============================================================================
+# Exercise 2: FizzBuzz
+# =============================================================================
+def classic_fizzbuzz(i):
+    if i % 15 == 0:
+        return "FizzBuzz"
+    if i % 3 == 0:
+        return "Fizz"
+    if i % 5 == 0:
+        return "Buzz"
+    return str(i)
+
+
+class TestLazyFizzBuzz:
+    """Tests for ifizzbuzz and FizzBuzzSeq."""
+
+    @pytest.mark.parametrize("start,stop", [(1, 101), (7, 50), (0, 16), (-20, 3), (5, 5)])
+    def test_ifizzbuzz_matches_rules(self, start, stop):
+        from exercise_2 import ifizzbuzz
+
+        assert list(ifizzbuzz(start, stop)) == [classic_fizzbuzz(i) for i in range(start, stop)]
+
+    def test_ifizzbuzz_unbounded(self):
+        import itertools
+        from exercise_2 import ifizzbuzz
+
+        assert list(itertools.islice(ifizzbuzz(14), 3)) == ["14", "FizzBuzz", "16"]
+
+    def test_sequence_matches_fizzbuzz(self):
+        from exercise_2 import FizzBuzzSeq, fizzbuzz
+
+        assert list(FizzBuzzSeq(100)) == fizzbuzz(100)
+        assert len(FizzBuzzSeq(0)) == 0
+
+    def test_sequence_equals_list(self):
+        from exercise_2 import FizzBuzzSeq, fizzbuzz
+
+        assert FizzBuzzSeq(100) == fizzbuzz(100)
+        assert fizzbuzz(100) == FizzBuzzSeq(100)
+        assert FizzBuzzSeq(100) != fizzbuzz(99)
+        assert FizzBuzzSeq(60)[::3] == fizzbuzz(60)[::3]
+        assert FizzBuzzSeq(3) != ("1", "2", "Fizz")
+
+    def test_huge_sequence_random_access(self):
+        from exercise_2 import FizzBuzzSeq
+
+        seq = FizzBuzzSeq(10**8)
+        assert len(seq) == 10**8
+        assert seq[0] == "1"
+        assert seq[-1] == "Buzz"  # 10**8
+        assert seq[10**8 - 3] == "99999998"
+        with pytest.raises(IndexError):
+            seq[10**8]
+
+    def test_slicing(self):
+        from exercise_2 import FizzBuzzSeq, fizzbuzz
+
+        seq = FizzBuzzSeq(60)
+        expected = fizzbuzz(60)
+        for part in [slice(9, 15), slice(None, None, 3), slice(50, 10, -7), slice(-5, None)]:
+            assert list(seq[part]) == expected[part]
+        assert seq[10:20][2:4] == seq[12:14]
+
+
+class TestWriteFizzBuzz:
+    """Tests for the bulk bytes writer."""
+
+    @pytest.mark.parametrize("start,stop", [
+        (1, 16), (1, 10_000), (2_999, 6_001), (12_345, 98_765),
+        (5, 3), (-40, 10), (999_990, 1_001_000), (2_999_990, 3_003_001),
+    ])
+    def test_matches_ifizzbuzz(self, start, stop):
+        from exercise_2 import ifizzbuzz, write_fizzbuzz
+
+        out = io.BytesIO()
+        written = write_fizzbuzz(out, start, stop)
+        expected = "".join(word + "\n" for word in ifizzbuzz(start, stop)).encode("ascii")
+        assert out.getvalue() == expected
+        assert written == len(expected)
+
+    def test_file_descriptor(self, tmp_path):
+        from exercise_2 import fizzbuzz, write_fizzbuzz
+
+        path = tmp_path / "fizzbuzz.txt"
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+        try:
+            write_fizzbuzz(fd, 1, 200_001)
+        finally:
+            os.close(fd)
+        assert path.read_text().splitlines() == fizzbuzz(200_000)
+
+
+class TestFizzBuzzEngine:
+    """Tests for rule-table FizzBuzz."""
+
+    @staticmethod
+    def naive(rules, number):
+        return "".join(word for divisor, word in rules if number % divisor == 0) or str(number)
+
+    def test_classic_rules(self):
+        from exercise_2 import FizzBuzzEngine, fizzbuzz
+
+        engine = FizzBuzzEngine({3: "Fizz", 5: "Buzz"})
+        assert engine.period == 15
+        assert engine.fizzbuzz(100) == fizzbuzz(100)
+
+    @pytest.mark.parametrize("rules", [
+        [(3, "Fizz"), (5, "Buzz"), (7, "Bazz"), (11, "Bong"), (13, "Fuzz")],
+        [(5, "Buzz"), (3, "Fizz")],
+        [(2, "a"), (4, "b"), (2, "c")],
+        [(3, "Fizz"), (101, "X"), (103, "Y"), (107, "Z")],
+        [(65_537, "Big"), (7, "Bazz")],
+        [],
+    ])
+    def test_matches_naive_rules(self, rules):
+        from exercise_2 import FizzBuzzEngine
+
+        engine = FizzBuzzEngine(rules)
+        for start, stop in [(1, 3000), (-50, 50), (65_530, 65_545), (1_111_100, 1_111_300)]:
+            expected = [self.naive(rules, i) for i in range(start, stop)]
+            assert list(engine.iterate(start, stop)) == expected
+            assert [engine.label(i) for i in range(start, stop)] == expected
+
+    def test_huge_lcm_uses_sparse_divisors(self):
+        from exercise_2 import MAX_WHEEL_SIZE, FizzBuzzEngine
+
+        engine = FizzBuzzEngine([(3, "Fizz"), (101, "X"), (103, "Y"), (107, "Z")])
+        assert engine.period <= MAX_WHEEL_SIZE
+        assert engine.sparse_divisors == [107]
+        assert engine.label(3 * 101 * 103 * 107) == "FizzXYZ"
+
+    def test_invalid_divisor(self):
+        from exercise_2 import FizzBuzzEngine
+
+        for divisor in (0, -3, 2.5):
+            with pytest.raises(ValueError):
+                FizzBuzzEngine([(divisor, "x")])
+
+
+# =============================================================================
+# Exercise 3: Find Max
+# =============================================================================
+class TestFindMaxSources:
+    """Tests for find_max over iterables and buffers, and find_max_file."""
+
+    def test_iterables_in_one_pass(self):
+        from exercise_3 import find_max
+
+        assert find_max(x * (-1) ** x for x in range(10)) == 8
+        assert find_max(iter([])) is None
+        assert find_max((3, 1, 2)) == 3
+        assert find_max(range(1, 10**6)) == 10**6 - 1
+
+    def test_buffers(self):
+        import array
+        from exercise_3 import find_max
+
+        assert find_max(array.array("d", [1.5, -2.0, 2.25])) == 2.25
+        assert find_max(array.array("q")) is None
+        assert find_max(b"\x01\x7f\x10") == 0x7F
+        assert find_max(memoryview(array.array("i", [-5, -1, -9]))) == -1
+        assert find_max(memoryview(bytes(range(12))).cast("B", (3, 4))) == 11
+
+    @pytest.mark.parametrize("dtype,values", [
+        ("i", [3, -9, 27, 4]),
+        ("q", [-(2**40), 2**41, 7]),
+        ("d", [0.5, -1e300, 1e10, 3.25]),
+        ("B", list(range(200))),
+    ])
+    def test_file(self, tmp_path, dtype, values):
+        import array
+        from exercise_3 import find_max_file
+
+        path = tmp_path / "metrics.bin"
+        with open(path, "wb") as f:
+            array.array(dtype, values * 1000).tofile(f)
+        assert find_max_file(str(path), dtype, chunk_size=4096) == max(values)
+
+    @pytest.mark.parametrize("dtype", ["q", "d", "B"])
+    def test_parallel_matches_serial(self, monkeypatch, dtype):
+        import array
+        import random
+        import exercise_3
+
+        monkeypatch.setattr(exercise_3, "PARALLEL_MIN_ITEMS", 10)
+        rng = random.Random(dtype)
+        values = array.array(dtype, [rng.randrange(250) for _ in range(10_001)])
+        assert exercise_3.find_max(values, workers=3) == max(values)
+        assert exercise_3.find_max(values[:2], parallel=True, workers=8) == max(values[:2])
+        assert exercise_3.find_max(array.array(dtype), parallel=True) is None
+
+    def test_file_edge_cases(self, tmp_path):
+        from exercise_3 import find_max_file
+
+        empty = tmp_path / "empty.bin"
+        empty.write_bytes(b"")
+        assert find_max_file(str(empty), "d") is None
+
+        ragged = tmp_path / "ragged.bin"
+        ragged.write_bytes(b"\0" * 10)
+        with pytest.raises(ValueError):
+            find_max_file(str(ragged), "d")
+
+
+class TestTopKAndWindow:
+    """Tests for find_top_k and SlidingWindowMax."""
+
+    def test_top_k(self):
+        import array
+        from exercise_3 import find_top_k
+
+        assert find_top_k([1, 5, 3, 9, 2], 3) == [9, 5, 3]
+        assert find_top_k(iter([4, 4, 1]), 2) == [4, 4]
+        assert find_top_k([1, 2], 5) == [2, 1]
+        assert find_top_k(array.array("i", [7, -1, 8]), 1) == [8]
+        assert find_top_k([], 3) == []
+        assert find_top_k([1, 2, 3], 0) == []
+
+    def test_sliding_window_matches_naive(self):
+        import random
+        from exercise_3 import SlidingWindowMax
+
+        rng = random.Random(19)
+        values = [rng.randrange(-50, 50) for _ in range(500)]
+        for window in (1, 2, 7, 100, 1000):
+            tracker = SlidingWindowMax(window)
+            for i, value in enumerate(values):
+                expected = max(values[max(0, i - window + 1):i + 1])
+                assert tracker.push(value) == expected
+                assert tracker.max() == expected
+                assert len(tracker) == min(i + 1, window)
+
+    def test_sliding_window_empty_and_invalid(self):
+        from exercise_3 import SlidingWindowMax
+
+        assert SlidingWindowMax(3).max() is None
+        assert len(SlidingWindowMax(3)) == 0
+        with pytest.raises(ValueError):
+            SlidingWindowMax(0)
+
+
+# =============================================================================
+# Exercise 4: Count Vowels
+# =============================================================================
+def lower_count(text):
+    """The original definition: lowercase, then count aeiou."""
+    return sum(1 for char in text.lower() if char in "aeiou")
+
+
+class TestVowelEngine:
+    """Tests for byte-level vowel counting."""
+
+    @pytest.mark.parametrize("text", [
+        "", "hello", "AEIOU", "rhythm", "Python Programming",
+        "Ünïcödé ÅÄÖ éàè naïve façade", "İstanbul", "日本語 aei 😀 OU", "\ud800 lone a",
+    ])
+    def test_matches_lowercase_definition(self, text):
+        from exercise_4 import count_vowels
+
+        assert count_vowels(text) == lower_count(text)
+
+    def test_large_text_spans_chunks(self, monkeypatch):
+        import exercise_4
+
+        monkeypatch.setattr(exercise_4, "CHUNK_SIZE", 7)
+        text = "The quick brown fox jumps over the lazy dog. ÉLAN vital! " * 20
+        assert exercise_4.count_vowels(text) == lower_count(text)
+        assert exercise_4.count_vowels(text.encode("utf-8")) == lower_count(text)
+
+    def test_bytes_like(self):
+        from exercise_4 import count_vowels
+
+        assert count_vowels(b"Python Programming") == 4
+        assert count_vowels(bytearray(b"AEIOUxyz")) == 5
+        assert count_vowels(memoryview(b"--a--e--")) == 2
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1 << 20])
+    def test_file(self, tmp_path, chunk_size):
+        from exercise_4 import count_vowels_file
+
+        text = "héllo wörld, AEIOU and rhythm ✓\n" * 500
+        path = tmp_path / "corpus.txt"
+        path.write_text(text, encoding="utf-8")
+        assert count_vowels_file(str(path), chunk_size) == lower_count(text)
+
+
+class TestCharClassCounter:
+    """Tests for multi-class character counting."""
+
+    CLASSES = {
+        "vowels": "aeiouyåäö",
+        "consonants": "bcdfghjklmnpqrstvwxyz",
+        "digits": "0123456789",
+    }
+
+    @staticmethod
+    def naive(classes, text):
+        return {
+            name: sum(1 for char in text if char.lower() in chars.lower() or char in chars)
+            for name, chars in classes.items()
+        }
+
+    @pytest.mark.parametrize("text", [
+        "", "Åsa, 42 år", "Rhythm & Yoga: 2024!", "ÄÖÅ äöå \x01\x02\x03", "日本語 abc 😀 123",
+    ])
+    def test_matches_naive(self, text):
+        from exercise_4 import CharClassCounter
+
+        assert CharClassCounter(self.CLASSES).count(text) == self.naive(self.CLASSES, text)
+
+    def test_overlapping_classes_and_case(self):
+        from exercise_4 import CharClassCounter
+
+        counter = CharClassCounter({"y": "y", "letters": "xyz"}, ignore_case=False)
+        assert counter.count("xyYz") == {"y": 1, "letters": 3}
+
+    def test_streaming_and_file(self, tmp_path, monkeypatch):
+        import exercise_4
+        from exercise_4 import CharClassCounter
+
+        monkeypatch.setattr(exercise_4, "CHUNK_SIZE", 5)
+        text = "Hej på dig, 123 gånger! Yes.\n" * 40
+        expected = self.naive(self.CLASSES, text)
+        counter = CharClassCounter(self.CLASSES)
+
+        for start in range(0, len(text), 17):
+            counter.feed(text[start:start + 17])
+        assert counter.totals() == expected
+        counter.reset()
+        assert set(counter.totals().values()) == {0}
+
+        path = tmp_path / "text.txt"
+        path.write_text(text, encoding="utf-8")
+        assert counter.count_file(str(path), chunk_size=3) == expected
+
+
+class TestCountVowelsTree:
+    """Tests for counting vowels across a directory tree."""
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        expected = {}
+        for i in range(30):
+            folder = tmp_path / f"part{i % 3}" / ("deep" if i % 2 else "")
+            folder.mkdir(parents=True, exist_ok=True)
+            path = folder / f"doc{i}.txt"
+            text = "Some text with vowels, ÅÄÖ and numbers %d\n" % i * (i + 1)
+            path.write_text(text, encoding="utf-8")
+            expected[str(path)] = lower_count(text)
+        (tmp_path / "notes.md").write_text("aaaa")
+        return tmp_path, expected
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_counts_every_file(self, corpus, workers):
+        from exercise_4 import count_vowels_tree
+
+        root, expected = corpus
+        results = list(count_vowels_tree(str(root), workers=workers, pattern="*.txt"))
+        assert {r.path: r.count for r in results} == expected
+        assert results[-1].total == sum(expected.values())
+        assert [r.total for r in results] == sorted(r.total for r in results)
+
+    def test_unreadable_file(self, tmp_path):
+        from exercise_4 import count_vowels_tree
+
+        (tmp_path / "ok.txt").write_text("aeiou")
+        (tmp_path / "broken.txt").symlink_to(tmp_path / "missing")
+        results = {os.path.basename(r.path): r.count for r in count_vowels_tree(str(tmp_path), workers=1)}
+        assert results == {"ok.txt": 5, "broken.txt": None}
+
+
+# =============================================================================
+# Exercise 5: Palindrome
+# =============================================================================
+def cleaned_palindrome(text):
+    """The original definition: lowercase, keep alphanumerics, compare."""
+    cleaned = "".join(c for char in text for c in char.lower() if c.isalnum())
+    return cleaned == cleaned[::-1]
+
+
+PALINDROME_CASES = [
+    "", "a", "racecar", "hello", "A man, a plan, a canal: Panama", "No 'x' in Nixon",
+    "Was it a car or a cat I saw?", ".,!", "ab", "Ésé", "日本日", "😀a😀b", "Àb,bà", "12 3 21",
+    "İi", "ΣaΣ", "İı", "ı, İ",
+]
+
+
+class TestPalindromeFile:
+    """Tests for the two-pointer check and is_palindrome_file."""
+
+    @pytest.mark.parametrize("text", PALINDROME_CASES)
+    def test_two_pointer_matches_definition(self, text):
+        from exercise_5 import is_palindrome
+
+        assert is_palindrome(text) is cleaned_palindrome(text)
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+    def test_file_matches_definition(self, tmp_path, chunk_size):
+        from exercise_5 import is_palindrome_file
+
+        path = tmp_path / "text.txt"
+        for text in PALINDROME_CASES + ["Åsa, ... asÅ!" * 3 + "x" + "!asÅ ,asÅ" * 3]:
+            path.write_text(text, encoding="utf-8")
+            assert is_palindrome_file(str(path), chunk_size) is cleaned_palindrome(text), text
+
+    def test_large_file(self, tmp_path):
+        from exercise_5 import is_palindrome_file
+
+        half = "Never odd or even, said Åsa. " * 2000
+        path = tmp_path / "big.txt"
+        path.write_text(half + half[::-1], encoding="utf-8")
+        assert is_palindrome_file(str(path), 4096) is True
+        path.write_text(half + "z" + half, encoding="utf-8")
+        assert is_palindrome_file(str(path), 4096) is False
+
+    @pytest.mark.parametrize("text,expected", [("İi", True), ("ΣaΣ", True), ("İ.ı", False), ("Σ, σ", True)])
+    def test_non_ascii_folds_the_same_everywhere(self, tmp_path, text, expected):
+        from exercise_5 import PalindromeEngine, is_palindrome, is_palindrome_file
+
+        # "İ" lowercases to "i" plus a combining dot; a whole-string lower()
+        # would also turn a final "Σ" into "ς"
+        assert is_palindrome(text) is expected
+        path = tmp_path / "text.txt"
+        path.write_text(text, encoding="utf-8")
+        for chunk_size in (1, 1 << 20):
+            assert is_palindrome_file(str(path), chunk_size) is expected
+        assert (PalindromeEngine().longest(text) == text) is expected
+
+
+class TestPalindromeEngine:
+    """Tests for the Manacher engine."""
+
+    @staticmethod
+    def brute_force(text):
+        chars = ["".join(c for c in char.lower() if c.isalnum()) for char in text if char.isalnum()]
+        count, best = 0, 0
+        for i in range(len(chars)):
+            for j in range(i + 1, len(chars) + 1):
+                if chars[i:j] == chars[i:j][::-1]:
+                    count += 1
+                    best = max(best, j - i)
+        return count, best
+
+    @pytest.mark.parametrize("text", PALINDROME_CASES + ["Hello, racecar!", "abacabadabacaba", "aaaa", "xAbBa!"])
+    def test_matches_brute_force(self, text):
+        from exercise_5 import PalindromeEngine, is_palindrome
+
+        info = PalindromeEngine().analyze(text)
+        count, best = self.brute_force(text)
+        assert info.count == count
+        assert sum(1 for c in info.longest if c.isalnum()) == best
+        assert text[info.span[0]:info.span[1]] == info.longest
+        assert is_palindrome(info.longest)
+
+    def test_longest_keeps_original_text(self):
+        from exercise_5 import PalindromeEngine
+
+        engine = PalindromeEngine()
+        assert engine.longest("Hello, racecar!") == "racecar"
+        assert engine.longest("A man, a plan, a canal: Panama!") == "A man, a plan, a canal: Panama"
+        assert engine.longest("...") == ""
+
+    def test_batch_reuses_buffers(self):
+        import random
+        from exercise_5 import PalindromeEngine
+
+        rng = random.Random(24)
+        texts = ["".join(rng.choice("abA, ") for _ in range(rng.randint(0, 40))) for _ in range(200)]
+        engine = PalindromeEngine()
+        results = list(engine.analyze_batch(texts))
+        assert [r.count for r in results] == [self.brute_force(t)[0] for t in texts]
+        assert results == [PalindromeEngine().analyze(t) for t in texts]
+        assert len(engine._odd) == max(len([c for c in t if c.isalnum()]) for t in texts)
+
+
+# =============================================================================
+# Exercise 6: Two Sum
+# =============================================================================
+class TestTwoSumIndex:
+    """Tests for the hash-based two_sum and TwoSumIndex."""
+
+    @staticmethod
+    def pairs(nums, target):
+        return {(i, j) for i in range(len(nums)) for j in range(i + 1, len(nums)) if nums[i] + nums[j] == target}
+
+    def test_two_sum_raises_without_pair(self):
+        from exercise_6 import two_sum
+
+        with pytest.raises(ValueError):
+            two_sum([1, 2, 4], 100)
+        with pytest.raises(ValueError):
+            two_sum([3], 6)
+        with pytest.raises(ValueError):
+            two_sum([], 0)
+
+    def test_two_sum_large_input(self):
+        from exercise_6 import two_sum
+
+        nums = list(range(0, 300_000, 3))
+        nums[-1] += 1
+        assert two_sum(nums, nums[-1] + nums[-2]) == [len(nums) - 2, len(nums) - 1]
+
+    def test_queries_match_brute_force(self):
+        import random
+        from exercise_6 import TwoSumIndex, two_sum
+
+        rng = random.Random(25)
+        for _ in range(50):
+            nums = [rng.randint(-20, 20) for _ in range(rng.randint(0, 25))]
+            index = TwoSumIndex(nums)
+            for target in range(-45, 46):
+                expected = self.pairs(nums, target)
+                if not expected:
+                    for query in (index.query, index.query_sorted, lambda t: two_sum(nums, t)):
+                        with pytest.raises(ValueError):
+                            query(target)
+                    assert index.query_many([target]) == [None]
+                    continue
+                assert tuple(index.query(target)) in expected
+                assert tuple(index.query_sorted(target)) in expected
+                assert tuple(two_sum(nums, target)) in expected
+
+    def test_examples(self):
+        from exercise_6 import TwoSumIndex
+
+        index = TwoSumIndex([2, 7, 11, 15])
+        assert index.query(9) == [0, 1]
+        assert index.query_sorted(26) == [2, 3]
+        assert index.query_many([9, 18, 100]) == [[0, 1], [1, 2], None]
+        assert TwoSumIndex([3, 3]).query(6) == [0, 1]
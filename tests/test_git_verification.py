@@ -0,0 +1,362 @@
+"""
+Tests for the git verification utilities themselves.
+
+Each test builds a small throwaway repository and checks that every
+GitVerifier backend gives the same answers as plain `git` commands.
+
+Run with: pytest tests/test_git_verification.py -v
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+# Add tests directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from git_verification import AsyncGitVerifier, CatFileBackend, CommitIndex, GitVerifier, NativeBackend, RepoState
+from git_verification.progress import INDEX_FILE
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def git(repo, *args, date=None):
+    """Run a git command in the given repository."""
+    env = dict(
+        os.environ,
+        GIT_AUTHOR_NAME="Student",
+        GIT_AUTHOR_EMAIL="student@example.com",
+        GIT_COMMITTER_NAME="Student",
+        GIT_COMMITTER_EMAIL="student@example.com",
+    )
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    subprocess.run(["git", *args], cwd=repo, env=env, check=True, capture_output=True)
+
+
+def commit_file(repo, path, content, message, when):
+    """Write a file and commit it with a fixed date."""
+    full = os.path.join(repo, path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, "w") as f:
+        f.write(content)
+    git(repo, "add", path)
+    git(repo, "commit", "-m", message, date=f"2024-01-01T12:00:{when:02d}")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repository with branches, a merge and tags, like a student fork."""
+    path = str(tmp_path / "lab")
+    os.makedirs(path)
+    git(path, "init", "-q", "-b", "main")
+    commit_file(path, "README.md", "lab\n", "Initial commit", 1)
+    commit_file(path, "exercises/solo/exercise_1.py", "x = 1\n", "Exercise 1: Implement reverse_string", 2)
+    git(path, "checkout", "-q", "-b", "feature/exercise-3")
+    commit_file(path, "exercises/solo/exercise_3.py", "y = 3\n", "Exercise 3: Implement find_max", 3)
+    git(path, "checkout", "-q", "main")
+    commit_file(path, "exercises/solo/exercise_2.py", "z = 2\n", "Exercise 2: Add fizzbuzz\n\nLonger body", 4)
+    git(path, "merge", "--no-ff", "-m", "Merge branch 'feature/exercise-3'", "feature/exercise-3",
+        date="2024-01-01T12:00:05")
+    git(path, "tag", "v0.1.0")
+    git(path, "tag", "-a", "v1.0.0", "-m", "Release v1.0.0")
+    return path
+
+
+BACKENDS = {
+    "cat-file": CatFileBackend,
+    "native": NativeBackend,
+}
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def pair(request, repo):
+    """A plain verifier and a backend verifier for the same repository."""
+    with GitVerifier(repo, backend=BACKENDS[request.param](repo), use_snapshot=False) as fast:
+        yield GitVerifier(repo, use_snapshot=False), fast
+
+
+QUERIES = [
+    ("has_commit_message", ("exercise 1",)),
+    ("has_commit_message", ("exercise 9",)),
+    ("has_commit_message", ("Initial", 1)),
+    ("has_commit_with_file", ("exercises/solo/exercise_3.py",)),
+    ("has_commit_with_file", ("exercises/solo",)),
+    ("has_commit_with_file", ("exercises/solo/exercise_9.py",)),
+    ("branch_exists", ("main",)),
+    ("branch_exists", ("feature/exercise-3",)),
+    ("branch_exists", ("missing-branch",)),
+    ("commit_count", ()),
+    ("commit_count", ("feature/exercise-3",)),
+    ("commit_count", ("no-such-ref",)),
+    ("tag_exists", ("v1.0.0",)),
+    ("tag_exists", ("v0.1.0",)),
+    ("tag_exists", ("v2.0.0",)),
+    ("has_merge_commit", ()),
+    ("file_was_modified_in_commit", ("exercises/solo/exercise_2.py", "HEAD~1")),
+    ("file_was_modified_in_commit", ("exercises/solo/exercise_3.py", "HEAD")),
+    ("file_was_modified_in_commit", ("README.md", "HEAD~3")),
+    ("get_last_commit_message", ()),
+    ("get_branches", ()),
+    ("get_branches", (True,)),
+    ("get_tags", ()),
+    ("tag_exists", ("v*",)),
+    ("get_current_branch", ()),
+    ("is_clean", ()),
+    ("has_remote", ("origin",)),
+    ("reflog_contains", ("merge",)),
+    ("reflog_contains", ("rebase",)),
+    ("is_repository", ()),
+]
+
+
+@pytest.mark.parametrize("method,args", QUERIES)
+def test_backend_matches_git(pair, method, args):
+    plain, fast = pair
+    assert getattr(fast, method)(*args) == getattr(plain, method)(*args)
+
+
+@pytest.mark.parametrize("backend", [None, "native"])
+def test_ref_patterns_are_case_sensitive(repo, backend, monkeypatch):
+    verifier = GitVerifier(repo, backend=NativeBackend(repo) if backend else None)
+    assert verifier.state() is not None
+    # What fnmatch.filter sees on Windows
+    monkeypatch.setattr(os.path, "normcase", str.lower)
+    assert verifier.branch_exists("main")
+    assert not verifier.branch_exists("Main")
+    assert not verifier.branch_exists("FEATURE/*")
+    assert verifier.tag_exists("v1.0.0")
+    assert not verifier.tag_exists("V1.*")
+
+
+def test_feature_branch_has_no_merge(repo):
+    git(repo, "checkout", "-q", "feature/exercise-3")
+    with GitVerifier(repo, backend=CatFileBackend(repo), use_snapshot=False) as verifier:
+        assert not verifier.has_merge_commit()
+        assert verifier.commit_count() == 3
+
+
+@pytest.fixture
+def packed_repo(repo, tmp_path):
+    """The same repository after `git gc`, with a clone as remote."""
+    git(repo, "gc", "-q", "--aggressive")
+    clone = str(tmp_path / "clone")
+    git(repo, "clone", "-q", repo, clone)
+    git(clone, "checkout", "-q", "-b", "feature/exercise-5")
+    git(clone, "pack-refs", "--all")
+    return clone
+
+
+@pytest.mark.parametrize("method,args", QUERIES + [
+    ("branch_exists", ("exercise-3",)),
+    ("get_branches", (True,)),
+])
+def test_native_reads_packs_and_packed_refs(packed_repo, method, args):
+    plain = GitVerifier(packed_repo, use_snapshot=False)
+    with GitVerifier(packed_repo, backend=NativeBackend(packed_repo), use_snapshot=False) as fast:
+        assert getattr(fast, method)(*args) == getattr(plain, method)(*args)
+
+
+def test_native_detects_dirty_worktree(repo):
+    verifier = GitVerifier(repo, backend=NativeBackend(repo), use_snapshot=False)
+    assert verifier.is_clean()
+
+    with open(os.path.join(repo, ".gitignore"), "w") as f:
+        f.write("*.log\nbuild/\n")
+    assert not verifier.is_clean()
+    git(repo, "add", ".gitignore")
+    git(repo, "commit", "-q", "-m", "Ignore build output")
+    assert verifier.is_clean()
+
+    os.makedirs(os.path.join(repo, "build"))
+    for name in ("build/out.txt", "debug.log"):
+        with open(os.path.join(repo, name), "w") as f:
+            f.write("ignored\n")
+    assert verifier.is_clean()
+
+    with open(os.path.join(repo, "README.md"), "a") as f:
+        f.write("edited\n")
+    assert not verifier.is_clean()
+    git(repo, "add", "README.md")
+    assert not verifier.is_clean()
+    git(repo, "commit", "-q", "-m", "Edit README")
+
+    # git status skips assume-unchanged files, so the backend must too
+    git(repo, "update-index", "--assume-unchanged", "README.md")
+    with open(os.path.join(repo, "README.md"), "a") as f:
+        f.write("local only\n")
+    assert GitVerifier(repo, use_snapshot=False).is_clean()
+    assert verifier.is_clean()
+
+
+def test_native_defers_unsupported_status_to_git(repo):
+    backend = NativeBackend(repo)
+    verifier = GitVerifier(repo, backend=backend, use_snapshot=False)
+    plain = GitVerifier(repo, use_snapshot=False)
+
+    # POSIX character classes in ignore patterns
+    commit_file(repo, ".gitignore", "run[[:digit:]].log\n", "Ignore run logs", 6)
+    with open(os.path.join(repo, "run1.log"), "w") as f:
+        f.write("ignored\n")
+    assert backend.is_clean() is None
+    assert plain.is_clean()
+    assert verifier.is_clean()
+
+    # Filters from a nested .gitattributes can make a rewritten file clean
+    commit_file(repo, "exercises/.gitattributes", "*.py text\n", "Add attributes", 7)
+    path = os.path.join(repo, "exercises", "solo", "exercise_1.py")
+    with open(path, "w") as f:
+        f.write("x = 1\n")
+    os.utime(path, (0, 0))
+    assert backend.is_clean() is None
+    assert verifier.is_clean() == plain.is_clean()
+
+
+def test_native_runs_no_subprocesses(repo, monkeypatch):
+    def forbidden(*args, **kwargs):
+        raise AssertionError("a git process was started")
+
+    verifier = GitVerifier(repo, backend=NativeBackend(repo), use_snapshot=False)
+    monkeypatch.setattr(subprocess, "run", forbidden)
+    monkeypatch.setattr(subprocess, "Popen", forbidden)
+    for method, args in QUERIES:
+        if "no-such-ref" not in args:
+            getattr(verifier, method)(*args)
+
+
+@pytest.mark.parametrize("backend", [None, "native"])
+@pytest.mark.parametrize("method,args", QUERIES)
+def test_snapshot_matches_git(repo, backend, method, args):
+    plain = GitVerifier(repo, use_snapshot=False)
+    snap = GitVerifier(repo, backend=NativeBackend(repo) if backend else None)
+    assert getattr(snap, method)(*args) == getattr(plain, method)(*args)
+
+
+@pytest.mark.parametrize("detach", ["HEAD~1", "v1.0.0", "new-commit"])
+@pytest.mark.parametrize("backend", [None, "native"])
+@pytest.mark.parametrize("method,args", QUERIES)
+def test_snapshot_matches_git_detached(repo, backend, method, args, detach):
+    if detach == "new-commit":
+        # Moved on since the checkout: "(HEAD detached from <sha>)"
+        git(repo, "checkout", "-q", "HEAD~1")
+        commit_file(repo, "notes.txt", "notes\n", "Detached work", 7)
+    else:
+        git(repo, "checkout", "-q", detach)
+    test_snapshot_matches_git(repo, backend, method, args)
+
+
+def test_snapshot_shared_and_invalidated(repo):
+    RepoState.invalidate()
+    first = GitVerifier(repo).state()
+    assert GitVerifier(repo).state() is first
+
+    commit_file(repo, "exercises/solo/exercise_4.py", "v = 4\n", "Exercise 4: Count vowels", 6)
+    second = GitVerifier(repo).state()
+    assert second is not first
+    assert GitVerifier(repo).get_last_commit_message() == "Exercise 4: Count vowels"
+
+    git(repo, "branch", "feature/exercise-5")
+    assert GitVerifier(repo).state() is not second
+    assert GitVerifier(repo).branch_exists("feature/exercise-5")
+
+
+@pytest.mark.parametrize("backend", [None, "native"])
+def test_snapshot_sees_new_remote(repo, backend):
+    RepoState.invalidate()
+
+    def verifier():
+        return GitVerifier(repo, backend=NativeBackend.for_repo(repo) if backend else None)
+
+    assert not verifier().has_remote("origin")
+    git(repo, "remote", "add", "origin", "https://example.com/lab.git")
+    assert verifier().has_remote("origin")
+
+
+@pytest.mark.parametrize("backend", [None, "native"])
+def test_snapshot_sees_worktree_changes(repo, backend):
+    RepoState.invalidate()
+
+    def verifier():
+        return GitVerifier(repo, backend=NativeBackend.for_repo(repo) if backend else None)
+
+    assert verifier().is_clean()
+    with open(os.path.join(repo, "README.md"), "a") as f:
+        f.write("edited\n")
+    assert not verifier().is_clean()
+
+    git(repo, "checkout", "--", "README.md")
+    assert verifier().is_clean()
+    with open(os.path.join(repo, "notes.txt"), "w") as f:
+        f.write("untracked\n")
+    assert not verifier().is_clean()
+
+
+def test_async_verifier_matches_git(repo):
+    plain = GitVerifier(repo, use_snapshot=False)
+
+    async def run_all():
+        verifier = AsyncGitVerifier(repo, max_concurrency=4)
+        return await asyncio.gather(*(getattr(verifier, m)(*a) for m, a in QUERIES))
+
+    assert asyncio.run(run_all()) == [getattr(plain, m)(*a) for m, a in QUERIES]
+
+
+def test_async_verify_exercises_committed(repo):
+    from git_verification.aio import verify_exercises_committed
+
+    committed = asyncio.run(verify_exercises_committed(verifier=AsyncGitVerifier(repo)))
+    assert [n for n, done in committed.items() if done] == [1, 2, 3]
+    assert sorted(committed) == list(range(1, 16))
+
+
+@pytest.mark.parametrize("backend", [None, "native"])
+def test_commit_index_updates_incrementally(repo, backend):
+    def load():
+        return CommitIndex.load(repo, backend=NativeBackend(repo) if backend else None, persist=True)
+
+    index = load()
+    assert index.exercises_committed(range(1, 16)) == [1, 2, 3]
+    assert index.has_commit_with_file("exercises/solo/exercise_3.py")
+    assert len(index.commits) == 5
+
+    commit_file(repo, "exercises/solo/exercise_10.py", "b = 10\n", "Add binary search", 6)
+    index = load()
+    assert index.exercises_committed(range(1, 16)) == [1, 2, 3, 10]
+    assert len(index.commits) == 6
+
+    # Rewriting history drops the commits that are no longer reachable
+    git(repo, "reset", "-q", "--hard", "HEAD~2")
+    index = load()
+    assert index.exercises_committed(range(1, 16)) == [1, 2]
+    assert len(index.commits) == 3
+
+
+def test_commit_index_not_saved_by_default(repo):
+    index = CommitIndex.load(repo)
+    assert index.exercises_committed(range(1, 16)) == [1, 2, 3]
+    assert not os.path.exists(os.path.join(repo, ".git", INDEX_FILE))
+
+
+def test_grade_many_streams_one_result_per_repo(repo, packed_repo, tmp_path):
+    from git_verification.grading import grade_many, read_manifest
+
+    manifest = tmp_path / "forks.txt"
+    manifest.write_text(f"# cohort 1\n{repo}\nclone\nmissing\n")
+    repos = read_manifest(str(manifest))
+    results = {r["repo"]: r for r in grade_many(repos, workers=2, max_git_processes=1)}
+
+    assert set(results) == set(repos)
+    assert results[repo]["exercises_committed"] == [1, 2, 3]
+    assert results[repo]["has_merge"] and results[repo]["version_tags"] == ["v0.1.0", "v1.0.0"]
+    assert results[packed_repo]["has_remote"]
+    assert results[str(tmp_path / "missing")]["error"] == "not a git repository"
+
+
+def test_shared_backend_per_repository(repo):
+    assert CatFileBackend.for_repo(repo) is CatFileBackend.for_repo(repo + "/")
+    CatFileBackend.close_all()
@@ -0,0 +1,196 @@
+"""
+Tests for the run_tests.py progress reporter.
+
+Run with: pytest tests/test_run_tests.py -v
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import run_tests
+
+
+def report(nodeid, when="call", outcome="passed"):
+    """A minimal stand-in for pytest's TestReport."""
+    return SimpleNamespace(
+        nodeid=nodeid,
+        when=when,
+        passed=outcome == "passed",
+        failed=outcome == "failed",
+    )
+
+
+class TestResultCollector:
+    def test_counts_per_class(self):
+        collector = run_tests.ResultCollector()
+        for r in [
+            report("tests/test_exercises.py::TestExercise1::test_basic"),
+            report("tests/test_exercises.py::TestExercise1::test_empty", outcome="failed"),
+            report("tests/test_exercises.py::TestExercise10::test_basic"),
+            report("tests/test_exercises.py::TestExercise10::test_basic", when="teardown"),
+            report("tests/test_exercises.py::TestExercise2::test_x", when="setup", outcome="failed"),
+        ]:
+            collector.pytest_runtest_logreport(r)
+
+        assert collector.results == {
+            "TestExercise1": {"passed": 1, "failed": 1},
+            "TestExercise10": {"passed": 1, "failed": 0},
+            "TestExercise2": {"passed": 0, "failed": 1},
+        }
+
+    def test_report_marks_complete_exercises(self, capsys):
+        run_tests.print_report({
+            "TestExercise1": {"passed": 5, "failed": 0},
+            "TestExercise2": {"passed": 1, "failed": 3},
+        })
+        out = capsys.readouterr().out
+        assert "📊 Overall: 6 / 9 tests passing" in out
+        assert "✅ Exercise 1 (Reverse String)" in out
+        assert "⬜ Exercise 2 (FizzBuzz)               - 1/4 passing" in out
+
+
+class TestParallelRun:
+    def test_shard_round_robin(self):
+        assert run_tests.shard(["a", "b", "c", "d", "e"], 2) == [["a", "c", "e"], ["b", "d"]]
+        assert run_tests.shard(["a", "b"], 8) == [["a"], ["b"]]
+
+    def test_parallel_matches_serial(self):
+        classes = ["TestExercise1", "TestExercise2", "TestExercise7"]
+        results, code = run_tests.run_pytest_parallel(2, classes)
+        assert results == run_tests.collect_results(classes)
+        assert code in run_tests.COMPLETE_RUN
+
+
+class TestWatchMode:
+    def test_affected_classes(self):
+        assert run_tests.affected_classes(["exercises/solo/exercise_3.py"]) == {"TestExercise3"}
+        assert run_tests.affected_classes([
+            "exercises/solo/exercise_12.py", "exercises/collaborative/exercise_8.py",
+        ]) == {"TestExercise12", "TestExercise8"}
+        assert run_tests.affected_classes(["exercises/solo/helpers.py"]) is None
+        assert run_tests.affected_classes(["tests/test_exercises.py"]) is None
+
+    def test_reload_picks_up_edits(self, tmp_path, monkeypatch):
+        source = tmp_path / "watched_exercise.py"
+        source.write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        import watched_exercise
+
+        try:
+            source.write_text("VALUE = 22\n")
+            run_tests.reload_sources([str(source)])
+            assert sys.modules["watched_exercise"].VALUE == 22
+
+            source.write_text("VALUE = (\n")
+            run_tests.reload_sources([str(source)])
+            assert "watched_exercise" not in sys.modules
+        finally:
+            sys.modules.pop("watched_exercise", None)
+
+    def test_refresh_reruns_only_changed_exercise(self, monkeypatch):
+        mtimes = {"/x/exercises/solo/exercise_1.py": 1, "/x/exercises/solo/exercise_2.py": 1}
+        runs = []
+
+        def fake_collect(test_classes=None):
+            runs.append(test_classes)
+            names = test_classes or ["TestExercise1", "TestExercise2"]
+            return {name: {"passed": len(runs), "failed": 0} for name in names}
+
+        monkeypatch.setattr(run_tests, "scan_sources", lambda: dict(mtimes))
+        monkeypatch.setattr(run_tests, "collect_results", fake_collect)
+        monkeypatch.setattr(run_tests, "reload_sources", lambda paths: None)
+
+        watcher = run_tests.Watcher()
+        watcher.run()
+        assert not watcher.refresh()
+
+        mtimes["/x/exercises/solo/exercise_2.py"] = 2
+        assert watcher.refresh()
+        assert runs == [None, ["TestExercise2"]]
+        assert watcher.results == {
+            "TestExercise1": {"passed": 1, "failed": 0},
+            "TestExercise2": {"passed": 2, "failed": 0},
+        }
+
+
+class TestResultCache:
+    @pytest.fixture
+    def lab(self, tmp_path, monkeypatch):
+        """A throwaway lab layout with a fake test runner."""
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_exercises.py").write_text("# tests\n")
+        solo = tmp_path / "exercises" / "solo"
+        solo.mkdir(parents=True)
+        (tmp_path / "exercises" / "collaborative").mkdir()
+        for n in (1, 2):
+            (solo / f"exercise_{n}.py").write_text(f"# exercise {n}\n")
+
+        runs = []
+
+        def fake_collect(test_classes=None):
+            runs.append(test_classes)
+            return {name: {"passed": 1, "failed": 0} for name in test_classes or []}, pytest.ExitCode.OK
+
+        monkeypatch.setattr(run_tests, "ROOT", str(tmp_path))
+        monkeypatch.setattr(run_tests, "SECTIONS", {
+            "Fundamentals:": {"Exercise 1": "TestExercise1", "Exercise 2": "TestExercise2"},
+        })
+        monkeypatch.setattr(run_tests, "run_pytest", fake_collect)
+        return tmp_path, runs
+
+    def test_only_changed_exercises_rerun(self, lab):
+        root, runs = lab
+        expected = {"TestExercise1": {"passed": 1, "failed": 0}, "TestExercise2": {"passed": 1, "failed": 0}}
+
+        assert run_tests.collect_results_cached() == expected
+        assert run_tests.collect_results_cached() == expected
+        (root / "exercises" / "solo" / "exercise_2.py").write_text("# solved\n")
+        assert run_tests.collect_results_cached() == expected
+        assert runs == [["TestExercise1", "TestExercise2"], ["TestExercise2"]]
+
+    def test_test_file_change_and_force_rerun_everything(self, lab):
+        root, runs = lab
+        run_tests.collect_results_cached()
+        (root / "tests" / "test_exercises.py").write_text("# more tests\n")
+        run_tests.collect_results_cached()
+        run_tests.collect_results_cached(force=True)
+        assert runs == [["TestExercise1", "TestExercise2"]] * 3
+
+    @pytest.mark.parametrize("code", [pytest.ExitCode.INTERRUPTED, pytest.ExitCode.INTERNAL_ERROR])
+    def test_unfinished_run_is_not_cached(self, lab, monkeypatch, code):
+        root, runs = lab
+        fake_collect = run_tests.run_pytest
+
+        def partial_collect(test_classes=None):
+            runs.append(test_classes)
+            return {"TestExercise1": {"passed": 1, "failed": 0}}, code
+
+        monkeypatch.setattr(run_tests, "run_pytest", partial_collect)
+        assert run_tests.collect_results_cached() == {"TestExercise1": {"passed": 1, "failed": 0}}
+        assert not (root / run_tests.CACHE_FILE).exists()
+
+        monkeypatch.setattr(run_tests, "run_pytest", fake_collect)
+        run_tests.collect_results_cached()
+        assert runs == [["TestExercise1", "TestExercise2"]] * 2
+
+    def test_classes_without_results_are_not_cached(self, lab, monkeypatch):
+        root, runs = lab
+        fake_collect = run_tests.run_pytest
+
+        def partial_collect(test_classes=None):
+            runs.append(test_classes)
+            return {"TestExercise1": {"passed": 1, "failed": 0}}, pytest.ExitCode.OK
+
+        monkeypatch.setattr(run_tests, "run_pytest", partial_collect)
+        run_tests.collect_results_cached()
+        monkeypatch.setattr(run_tests, "run_pytest", fake_collect)
+        assert run_tests.collect_results_cached() == {
+            "TestExercise1": {"passed": 1, "failed": 0},
+            "TestExercise2": {"passed": 1, "failed": 0},
+        }
+        assert runs == [["TestExercise1", "TestExercise2"], ["TestExercise2"]]